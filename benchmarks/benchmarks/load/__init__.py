@@ -4,10 +4,16 @@
 # See LICENSE in the root of the repository for full licensing details.
 """File loading benchmark tests."""
 
+import dask
+
 from iris import AttributeConstraint, Constraint, load, load_cube
 from iris.cube import Cube
+from iris.fileformats.netcdf.loader import READ_CONCURRENCY
+from iris.fileformats.pp import UNPACK_CONCURRENCY
 from iris.fileformats.um import structured_um_loading
+from iris.loading import LOAD_CONCURRENCY
 
+from .. import on_demand_benchmark
 from ..generate_data import BENCHMARK_DATA, REUSE_DATA, run_function_elsewhere
 from ..generate_data.um_files import create_um_files
 
@@ -219,3 +225,114 @@ class StructuredFF:
 
     def time_structured_load(self, _, __, ___):
         self.load()
+
+
+class PackedUnpackConcurrency:
+    """Realise structured-loaded WGDOS packed fields, in each unpacking mode."""
+
+    # For data generation
+    timeout = 600.0
+    params = ([(1280, 960, 5), (50, 50, 200)], ["FF", "PP"], ["SERIAL", "THREADS"])
+    param_names = ["xyz", "file_format", "unpack_mode"]
+
+    def setup_cache(self) -> dict:
+        file_type_args = self.params[1]
+        file_path_dict = {}
+        for xyz in self.params[0]:
+            x, y, z = xyz
+            file_path_dict[xyz] = create_um_files(x, y, z, 1, True, file_type_args)
+        return file_path_dict
+
+    def setup(
+        self, file_path_dict: dict, xyz: tuple, file_format: str, unpack_mode: str
+    ) -> None:
+        with structured_um_loading():
+            self.cube = load_cube(file_path_dict[xyz][file_format])
+
+    def time_realise(self, _, __, ___, unpack_mode: str) -> None:
+        with UNPACK_CONCURRENCY.set(unpack_mode, max_workers=4):
+            self.cube.core_data().compute()
+
+
+@on_demand_benchmark
+class NetcdfReadConcurrency:
+    """Realise data from many NetCDF files at once, with increasing thread counts.
+
+    Shows the scaling of each of the lazy data read modes with thread count.
+    On-demand, since the PER_FILE mode requires a thread-safe libnetcdf build.
+    """
+
+    FILE_DIR = BENCHMARK_DATA / "read_concurrency"
+    N_FILES = 16
+    params = ([1, 4, 16], ["GLOBAL_LOCK", "PER_FILE", "PROCESSES"])
+    param_names = ["n_threads", "read_mode"]
+
+    @staticmethod
+    def _create_files(save_dir: str, n_files: int) -> None:
+        """Run externally - everything must be self-contained."""
+        from pathlib import Path
+
+        import numpy as np
+
+        from iris import save
+        from iris.cube import Cube
+
+        for i in range(n_files):
+            cube = Cube(np.full((200, 100, 100), i, dtype=np.float32))
+            cube.var_name = "data"
+            save(cube, Path(save_dir) / f"file_{i}.nc", chunksizes=(1, 100, 100))
+
+    def setup_cache(self) -> None:
+        if not self.FILE_DIR.is_dir():
+            self.FILE_DIR.mkdir(parents=True)
+        file_paths = sorted(self.FILE_DIR.glob("*.nc"))
+        if not REUSE_DATA or len(file_paths) != self.N_FILES:
+            # See :mod:`benchmarks.generate_data` docstring for full explanation.
+            _ = run_function_elsewhere(
+                self._create_files, str(self.FILE_DIR), self.N_FILES
+            )
+
+    def setup(self, n_threads: int, read_mode: str) -> None:
+        self.cubes = load(str(self.FILE_DIR / "*.nc"))
+
+    def time_realise(self, n_threads: int, read_mode: str) -> None:
+        arrays = [cube.core_data() for cube in self.cubes]
+        with READ_CONCURRENCY.set(read_mode, max_workers=n_threads):
+            _ = dask.compute(*arrays, scheduler="threads", num_workers=n_threads)
+
+
+@on_demand_benchmark
+class ParallelFileLoad:
+    """Load many small NetCDF files, in each per-file load mode."""
+
+    FILE_DIR = BENCHMARK_DATA / "parallel_load"
+    N_FILES = 100
+    params = (["SERIAL", "THREADS", "PROCESSES"],)
+    param_names = ["load_mode"]
+
+    @staticmethod
+    def _create_files(save_dir: str, n_files: int) -> None:
+        """Run externally - everything must be self-contained."""
+        from pathlib import Path
+
+        from iris import save
+        from iris.tests.stock import realistic_4d
+
+        cube = realistic_4d()
+        for i in range(n_files):
+            cube.coord("time").points = cube.coord("time").points + 1.0
+            save(cube, Path(save_dir) / f"file_{i:03d}.nc")
+
+    def setup_cache(self) -> None:
+        if not self.FILE_DIR.is_dir():
+            self.FILE_DIR.mkdir(parents=True)
+        file_paths = sorted(self.FILE_DIR.glob("*.nc"))
+        if not REUSE_DATA or len(file_paths) != self.N_FILES:
+            # See :mod:`benchmarks.generate_data` docstring for full explanation.
+            _ = run_function_elsewhere(
+                self._create_files, str(self.FILE_DIR), self.N_FILES
+            )
+
+    def time_load(self, load_mode: str) -> None:
+        with LOAD_CONCURRENCY.set(load_mode, max_workers=4):
+            _ = load(str(self.FILE_DIR / "*.nc"))
@@ -8,7 +8,8 @@ import warnings
 
 import numpy as np
 
-from iris.cube import CubeList
+from iris.coords import AuxCoord, DimCoord
+from iris.cube import Cube, CubeList
 from iris.warnings import IrisVagueMetadataWarning
 
 from .generate_data.stock import realistic_4d_w_everything
@@ -42,6 +43,36 @@ class Merge:
     tracemalloc_merge.number = 3  # type: ignore[attr-defined]
 
 
+class MergeMany:
+    """Merge of many small cubes, of many different types, as from a large PP load."""
+
+    timeout = 600.0
+    params = [[10_000, 100_000]]
+    param_names = ["Number of cubes"]
+
+    cube_list: CubeList
+
+    def setup(self, n_cubes: int):
+        n_types = 500
+        template = Cube(np.zeros((4, 4), dtype=np.float32), units="K")
+        template.add_dim_coord(DimCoord(np.arange(4.0), "latitude", units="degrees"), 0)
+        template.add_dim_coord(
+            DimCoord(np.arange(4.0), "longitude", units="degrees"), 1
+        )
+        template.add_aux_coord(AuxCoord([0.0], "time", units="hours since 1970-01-01"))
+        cubes = []
+        for i_cube in range(n_cubes):
+            cube = template.copy()
+            # Each type is distinguished only by an attribute, like STASH.
+            cube.attributes["type"] = i_cube % n_types
+            cube.coord("time").points = [i_cube // n_types]
+            cubes.append(cube)
+        self.cube_list = CubeList(cubes)
+
+    def time_merge(self, _):
+        _ = self.cube_list.merge()
+
+
 class Concatenate:
     # TODO: Improve coverage.
 
@@ -70,3 +101,33 @@ class Concatenate:
         _ = self.cube_list.concatenate_cube()
 
     tracemalloc_concatenate.number = 3  # type: ignore[attr-defined]
+
+
+class ConcatenateMany:
+    """Concatenate of many small cubes along time, as from a load of daily files."""
+
+    timeout = 600.0
+    params = [[1_000, 10_000]]
+    param_names = ["Number of cubes"]
+
+    cube_list: CubeList
+
+    def setup(self, n_cubes: int):
+        template = Cube(np.zeros((1, 4, 4), dtype=np.float32), units="K")
+        time = DimCoord([0.0], "time", units="days since 1970-01-01")
+        template.add_dim_coord(time, 0)
+        template.add_dim_coord(DimCoord(np.arange(4.0), "latitude", units="degrees"), 1)
+        template.add_dim_coord(
+            DimCoord(np.arange(4.0), "longitude", units="degrees"), 2
+        )
+        cubes = []
+        # Shuffle the days, as the files may not be loaded in order.
+        days = np.random.default_rng(0).permutation(n_cubes)
+        for day in days:
+            cube = template.copy()
+            cube.coord("time").points = [float(day)]
+            cubes.append(cube)
+        self.cube_list = CubeList(cubes)
+
+    def time_concatenate(self, _):
+        _ = self.cube_list.concatenate_cube()
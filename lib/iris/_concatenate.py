@@ -4,11 +4,14 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Automatic concatenation of multiple cubes over one or more existing dimensions."""
 
-from collections import namedtuple
-from collections.abc import Mapping, Sequence
+import bisect
+from collections import OrderedDict, namedtuple
+from collections.abc import Hashable, Mapping, Sequence
 import itertools
+import threading
 from typing import Any
 import warnings
+import weakref
 
 import dask
 import dask.array as da
@@ -16,6 +19,7 @@ import numpy as np
 from xxhash import xxh3_64
 
 from iris._lazy_data import concatenate as concatenate_arrays
+from iris._lazy_data import is_lazy_data
 import iris.coords
 from iris.coords import AncillaryVariable, AuxCoord, CellMeasure, DimCoord
 import iris.cube
@@ -33,7 +37,7 @@ import iris.warnings
 
 
 # Restrict the names imported from this namespace.
-__all__ = ["concatenate"]
+__all__ = ["ARRAY_HASH_CACHE", "ArrayHashCache", "Concatenator", "concatenate"]
 
 # Direction of dimension coordinate value order.
 _CONSTANT = 0
@@ -454,6 +458,221 @@ class _ArrayHash(namedtuple("ArrayHash", ["value", "chunks"])):
         return result
 
 
+class ArrayHashCache:
+    """A size-bounded cache of the hashes of arrays, shared by all comparisons.
+
+    The hashes are keyed by the identity of the arrays, so that the same
+    coordinate arrays are only hashed once, however often they are compared.
+    Lazy arrays are identified by their :attr:`dask.array.Array.name`, which
+    is a token of their content.  Real arrays are identified by the array
+    object itself, and are only cached if they are read-only (as are the
+    points and bounds of a :class:`~iris.coords.DimCoord`), since the content
+    of a writeable array may change.
+
+    The least recently used hashes are discarded once there are more than
+    `maxsize`.  The :attr:`hits` and :attr:`misses` count the lookups, to
+    show how effective the cache is.
+
+    Parameters
+    ----------
+    maxsize : int, default=100000
+        The maximum number of hashes to keep.
+
+    """
+
+    def __init__(self, maxsize: int = 100_000) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._hashes: OrderedDict[Hashable, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups that found a cached hash."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """Discard all the cached hashes and reset the statistics."""
+        with self._lock:
+            self._hashes.clear()
+            self.hits = self.misses = 0
+
+    @staticmethod
+    def _key(a: da.Array | np.ndarray, dtype: np.dtype) -> Hashable | None:
+        # The key of the hash of the array cast to dtype, or None if it
+        # cannot be cached.
+        dtype = np.dtype(dtype).str
+        if isinstance(a, da.Array):
+            result = ("lazy", a.name, dtype)
+        else:
+            result = None
+            if type(a) is np.ndarray:
+                # Neither the array, nor any array whose memory it shares,
+                # can be modified.
+                base = a
+                while isinstance(base, np.ndarray) and not base.flags.writeable:
+                    base = base.base
+                if not isinstance(base, np.ndarray):
+                    result = ("real", id(a), dtype)
+        return result
+
+    def get(self, a: da.Array | np.ndarray, dtype: np.dtype) -> _ArrayHash | None:
+        """Return the cached hash of an array, cast to the given dtype.
+
+        Parameters
+        ----------
+        a :
+            The array.
+        dtype :
+            The dtype of the hashed array.
+
+        Returns
+        -------
+        :class:`_ArrayHash` or None
+            The cached hash, or None if it is not cached.
+
+        """
+        key = self._key(a, dtype)
+        result = None
+        with self._lock:
+            if key is not None and key in self._hashes:
+                array_hash, ref = self._hashes[key]
+                if ref is None or ref() is a:
+                    self._hashes.move_to_end(key)
+                    result = array_hash
+                else:
+                    # The id of a discarded array has been reused.
+                    del self._hashes[key]
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def put(
+        self, a: da.Array | np.ndarray, dtype: np.dtype, array_hash: _ArrayHash
+    ) -> None:
+        """Cache the hash of an array, cast to the given dtype.
+
+        Parameters
+        ----------
+        a :
+            The array.
+        dtype :
+            The dtype of the hashed array.
+        array_hash : :class:`_ArrayHash`
+            The hash.
+
+        """
+        key = self._key(a, dtype)
+        if key is not None:
+            ref = None if isinstance(a, da.Array) else weakref.ref(a)
+            with self._lock:
+                self._hashes[key] = (array_hash, ref)
+                self._hashes.move_to_end(key)
+                while len(self._hashes) > self.maxsize:
+                    self._hashes.popitem(last=False)
+
+    def cacheable(self, a: da.Array | np.ndarray) -> bool:
+        """Return whether the hash of an array can be cached."""
+        return self._key(a, a.dtype) is not None
+
+    def hashes(self, *arrays: da.Array | np.ndarray) -> list[_ArrayHash | None]:
+        """Return the hashes of arrays, computing and caching any not yet cached.
+
+        Parameters
+        ----------
+        *arrays :
+            The arrays to hash, without any change of dtype or chunks.
+
+        Returns
+        -------
+        list of :class:`_ArrayHash` or None
+            The hash of each array, or None if it cannot be cached.
+
+        """
+        result = [self.get(a, a.dtype) if self.cacheable(a) else None for a in arrays]
+        missing = {
+            i: (_hash_array(a), _chunks(a))
+            for i, (a, array_hash) in enumerate(zip(arrays, result))
+            if array_hash is None and self.cacheable(a)
+        }
+        (missing,) = dask.compute(missing)
+        for i, value in missing.items():
+            result[i] = _ArrayHash(*value)
+            self.put(arrays[i], arrays[i].dtype, result[i])
+        return result
+
+
+#: The session-wide cache of array hashes.
+ARRAY_HASH_CACHE = ArrayHashCache()
+
+#: The smallest real array compared by hash in :func:`_array_equal`.  Smaller
+#: arrays are quicker to compare directly.
+_HASH_EQUAL_MIN_SIZE = 2**20
+
+
+def _hash_equal(array1, array2) -> bool | None:
+    """Compare two arrays of the same shape by their content hashes.
+
+    Returns None if the hashes cannot decide the comparison, which requires
+    both arrays to be hashable by the :data:`ARRAY_HASH_CACHE`, with the same
+    dtype and chunks.  As for :func:`iris.util.array_equal`, without "withnans",
+    floating point arrays are never compared by hash.
+
+    """
+    kind = array1.dtype.kind
+    result = None
+    if (
+        array1.dtype == array2.dtype
+        and kind in "biuSU"
+        and is_lazy_data(array1) == is_lazy_data(array2)
+        and ARRAY_HASH_CACHE.cacheable(array1)
+        and ARRAY_HASH_CACHE.cacheable(array2)
+    ):
+        hash1, hash2 = ARRAY_HASH_CACHE.hashes(array1, array2)
+        if hash1.chunks == hash2.chunks:
+            result = hash1.value == hash2.value
+    return result
+
+
+def _array_equal(array1, array2) -> bool:
+    """Return whether two arrays are equal, comparing lazy or large arrays by hash.
+
+    Lazy arrays are then computed only once, however often they are compared.
+    Otherwise, this is the same as :func:`iris.util.array_equal`.
+
+    """
+    result = None
+    if (
+        isinstance(array1, np.ndarray | da.Array)
+        and isinstance(array2, np.ndarray | da.Array)
+        and array1.shape == array2.shape
+        and all(
+            is_lazy_data(array) or array.size >= _HASH_EQUAL_MIN_SIZE
+            for array in (array1, array2)
+        )
+    ):
+        result = _hash_equal(array1, array2)
+    if result is None:
+        result = array_equal(array1, array2)
+    return result
+
+
+def _chunks(a: da.Array | np.ndarray) -> tuple[tuple[int, ...], ...]:
+    """Get the chunks of an array, treating a real array as a single chunk."""
+    if isinstance(a, da.Array):
+        result = a.chunks
+    else:
+        result = tuple((i,) for i in a.shape)
+    return result
+
+
 def _array_id(
     coord: DimCoord | AuxCoord | AncillaryVariable | CellMeasure,
     bound: bool,
@@ -462,6 +681,19 @@ def _array_id(
     return f"{id(coord)}{bound}"
 
 
+def _is_numerical(dtype: np.dtype) -> bool:
+    return np.issubdtype(dtype, np.bool_) or np.issubdtype(dtype, np.number)
+
+
+def _hash_group_key(a: np.ndarray | da.Array) -> tuple[tuple[int, ...], str]:
+    """Get the key of the group of arrays hashed with common chunks and dtype."""
+    if _is_numerical(a.dtype):
+        dtype = "numerical"
+    else:
+        dtype = str(a.dtype)
+    return a.shape, dtype
+
+
 def _compute_hashes(
     arrays: Mapping[str, np.ndarray | da.Array],
 ) -> dict[str, _ArrayHash]:
@@ -473,6 +705,8 @@ def _compute_hashes(
     chunks and arrays with numerical dtypes are cast up to the same dtype before
     computing the hashes.
 
+    The hashes are looked up in, and added to, the :data:`ARRAY_HASH_CACHE`.
+
     Parameters
     ----------
     arrays :
@@ -485,23 +719,18 @@ def _compute_hashes(
 
     """
     hashes = {}
-
-    def is_numerical(dtype):
-        return np.issubdtype(dtype, np.bool_) or np.issubdtype(dtype, np.number)
+    cached_hashes = {}
+    sources = {}
 
     def group_key(item):
         array_id, a = item
-        if is_numerical(a.dtype):
-            dtype = "numerical"
-        else:
-            dtype = str(a.dtype)
-        return a.shape, dtype
+        return _hash_group_key(a)
 
     sorted_arrays = sorted(arrays.items(), key=group_key)
     for _, group_iter in itertools.groupby(sorted_arrays, key=group_key):
         array_ids, group = zip(*group_iter)
         # Unify dtype for numerical arrays, as the hash depends on it
-        if is_numerical(group[0].dtype):
+        if _is_numerical(group[0].dtype):
             dtype = np.result_type(*group)
             same_dtype_arrays = tuple(a.astype(dtype) for a in group)
         else:
@@ -516,15 +745,23 @@ def _compute_hashes(
             __, rechunked_arrays = da.core.unify_chunks(*itertools.chain(*argpairs))
         else:
             rechunked_arrays = same_dtype_arrays
-        for array_id, rechunked in zip(array_ids, rechunked_arrays):
-            if isinstance(rechunked, da.Array):
-                chunks = rechunked.chunks
+        for array_id, a, rechunked in zip(array_ids, group, rechunked_arrays):
+            # Real arrays are cast to a new array, so are cached by the
+            # identity of the original.
+            source = rechunked if isinstance(rechunked, da.Array) else a
+            cached = ARRAY_HASH_CACHE.get(source, rechunked.dtype)
+            if cached is None:
+                hashes[array_id] = (_hash_array(rechunked), _chunks(rechunked))
+                sources[array_id] = (source, rechunked.dtype)
             else:
-                chunks = tuple((i,) for i in rechunked.shape)
-            hashes[array_id] = (_hash_array(rechunked), chunks)
+                cached_hashes[array_id] = cached
 
     (hashes,) = dask.compute(hashes)
-    return {k: _ArrayHash(*v) for k, v in hashes.items()}
+    result = {k: _ArrayHash(*v) for k, v in hashes.items()}
+    for array_id, array_hash in result.items():
+        ARRAY_HASH_CACHE.put(*sources[array_id], array_hash)
+    result.update(cached_hashes)
+    return result
 
 
 def concatenate(
@@ -572,84 +809,204 @@ def concatenate(
         A :class:`iris.cube.CubeList` of concatenated :class:`iris.cube.Cube` instances.
 
     """
-    cube_signatures = []
-    for cube in cubes:
-        if cube.is_dataless():
-            raise iris.exceptions.DatalessError("concatenate")
-        cube_signatures.append(_CubeSignature(cube))
-
-    proto_cubes: list[_ProtoCube] = []
-    # Initialise the nominated axis (dimension) of concatenation
-    # which requires to be negotiated.
-    axis = None
-
-    # Compute hashes for parallel array comparison.
-    arrays = {}
-
-    def add_coords(cube_signature: _CubeSignature, coord_type: str) -> None:
-        for coord_and_dims in getattr(cube_signature, coord_type):
-            coord = coord_and_dims.coord
-            array_id = _array_id(coord, bound=False)
-            if isinstance(coord, (DimCoord, AuxCoord)):
-                arrays[array_id] = coord.core_points()
-                if coord.has_bounds():
-                    bound_array_id = _array_id(coord, bound=True)
-                    arrays[bound_array_id] = coord.core_bounds()
-            else:
-                arrays[array_id] = coord.core_data()
-
-    for cube_signature in cube_signatures:
-        if check_aux_coords:
-            add_coords(cube_signature, "aux_coords_and_dims")
-        if check_derived_coords:
-            add_coords(cube_signature, "derived_coords_and_dims")
-        if check_cell_measures:
-            add_coords(cube_signature, "cell_measures_and_dims")
-        if check_ancils:
-            add_coords(cube_signature, "ancillary_variables_and_dims")
-
-    hashes = _compute_hashes(arrays)
-
-    # Register each cube with its appropriate proto-cube.
-    for cube_signature in cube_signatures:
-        registered = False
-
-        # Register cube with an existing proto-cube.
-        for proto_cube in proto_cubes:
-            registered = proto_cube.register(
-                cube_signature,
-                hashes,
-                axis,
-                error_on_mismatch,
-                check_aux_coords,
-                check_cell_measures,
-                check_ancils,
-                check_derived_coords,
-            )
-            if registered:
-                axis = proto_cube.axis
-                break
+    concatenator = Concatenator(
+        error_on_mismatch=error_on_mismatch,
+        check_aux_coords=check_aux_coords,
+        check_cell_measures=check_cell_measures,
+        check_ancils=check_ancils,
+        check_derived_coords=check_derived_coords,
+    )
+    concatenator.add(cubes)
+    return concatenator.result()
+
+
+class Concatenator:
+    """Concatenate cubes over common existing dimensions, as they become available.
+
+    Each call of :meth:`add` registers further cubes with the concatenation
+    state of those already added, so that the current result is available
+    from :meth:`result` at any point.  The state of the source-cube of each
+    concatenated result, including the hashes of its coordinate arrays, is
+    kept between calls, so adding new cubes (such as the next time steps of
+    a forecast) only requires work for the new cubes.
+
+    For example:
+
+        >>> concatenator = Concatenator()  # doctest: +SKIP
+        >>> for cubes in new_time_steps():  # doctest: +SKIP
+        ...     concatenator.add(cubes)
+        ...     latest = concatenator.result()
+
+    Parameters
+    ----------
+    error_on_mismatch : bool, default=False
+        If True, raise an informative
+        :class:`~iris.exceptions.ContatenateError` if registration fails.
+    check_aux_coords : bool, default=True
+        Checks if the points and bounds of auxiliary coordinates of the cubes
+        match. This check is not applied to auxiliary coordinates that span the
+        dimension the concatenation is occurring along.
+    check_cell_measures : bool, default=True
+        Checks if the data of cell measures of the cubes match. This check is
+        not applied to cell measures that span the dimension the concatenation
+        is occurring along.
+    check_ancils : bool, default=True
+        Checks if the data of ancillary variables of the cubes match. This
+        check is not applied to ancillary variables that span the dimension the
+        concatenation is occurring along.
+    check_derived_coords : bool, default=True
+        Checks if the points and bounds of derived coordinates of the cubes
+        match. This check is not applied to derived coordinates that span the
+        dimension the concatenation is occurring along.
+
+    """
+
+    def __init__(
+        self,
+        error_on_mismatch: bool = False,
+        check_aux_coords: bool = True,
+        check_cell_measures: bool = True,
+        check_ancils: bool = True,
+        check_derived_coords: bool = True,
+    ) -> None:
+        self.error_on_mismatch = error_on_mismatch
+        self.check_aux_coords = check_aux_coords
+        self.check_cell_measures = check_cell_measures
+        self.check_ancils = check_ancils
+        self.check_derived_coords = check_derived_coords
+
+        self._proto_cubes: list[_ProtoCube] = []
+        # The nominated axis (dimension) of concatenation, which requires
+        # to be negotiated.
+        self._axis = None
+        # The hashes of the arrays of the source-cube of each proto-cube, to
+        # which the arrays of all other source-cubes are compared.
+        self._hashes: dict[str, _ArrayHash] = {}
+        # The total number of cubes added.
+        self._n_cubes = 0
+
+    def _arrays(
+        self, cube_signature: "_CubeSignature"
+    ) -> dict[str, np.ndarray | da.Array]:
+        """Get the arrays of a source-cube that are compared by hash."""
+        coord_types = []
+        if self.check_aux_coords:
+            coord_types.append("aux_coords_and_dims")
+        if self.check_derived_coords:
+            coord_types.append("derived_coords_and_dims")
+        if self.check_cell_measures:
+            coord_types.append("cell_measures_and_dims")
+        if self.check_ancils:
+            coord_types.append("ancillary_variables_and_dims")
+
+        arrays = {}
+        for coord_type in coord_types:
+            for coord_and_dims in getattr(cube_signature, coord_type):
+                coord = coord_and_dims.coord
+                array_id = _array_id(coord, bound=False)
+                if isinstance(coord, (DimCoord, AuxCoord)):
+                    arrays[array_id] = coord.core_points()
+                    if coord.has_bounds():
+                        bound_array_id = _array_id(coord, bound=True)
+                        arrays[bound_array_id] = coord.core_bounds()
+                else:
+                    arrays[array_id] = coord.core_data()
+        return arrays
+
+    def add(self, cubes: Sequence[iris.cube.Cube]) -> None:
+        """Register further cubes for concatenation.
+
+        Parameters
+        ----------
+        cubes : iterable of :class:`iris.cube.Cube`
+            An iterable containing one or more :class:`iris.cube.Cube`
+            instances to be concatenated with those already added.
+
+        """
+        cube_signatures = []
+        for cube in cubes:
+            if cube.is_dataless():
+                raise iris.exceptions.DatalessError("concatenate")
+            cube_signatures.append(_CubeSignature(cube))
+
+        # Compute hashes for parallel array comparison.
+        arrays = {}
+        for cube_signature in cube_signatures:
+            arrays.update(self._arrays(cube_signature))
+
+        # The hashes depend on the chunks and dtype of all the arrays of
+        # the same shape, so the existing arrays that the new arrays may be
+        # compared with are hashed again with them.
+        new_groups = {_hash_group_key(a) for a in arrays.values()}
+        for proto_cube in self._proto_cubes:
+            existing = self._arrays(proto_cube._cube_signature)
+            for array_id, a in existing.items():
+                if _hash_group_key(a) in new_groups:
+                    arrays[array_id] = a
+
+        hashes = dict(self._hashes)
+        hashes.update(_compute_hashes(arrays))
+
+        # Register each cube with its appropriate proto-cube.
+        for cube_signature in cube_signatures:
+            registered = False
+
+            # Register cube with an existing proto-cube.
+            for proto_cube in self._proto_cubes:
+                registered = proto_cube.register(
+                    cube_signature,
+                    hashes,
+                    self._axis,
+                    self.error_on_mismatch,
+                    self.check_aux_coords,
+                    self.check_cell_measures,
+                    self.check_ancils,
+                    self.check_derived_coords,
+                )
+                if registered:
+                    self._axis = proto_cube.axis
+                    break
+
+            # Create a new proto-cube for an unregistered cube.
+            if not registered:
+                self._proto_cubes.append(_ProtoCube(cube_signature))
 
-        # Create a new proto-cube for an unregistered cube.
-        if not registered:
-            proto_cubes.append(_ProtoCube(cube_signature))
+        self._n_cubes += len(cube_signatures)
+
+        # Only keep the hashes of the source-cubes of the proto-cubes, as
+        # the arrays of the other source-cubes are never compared again.
+        self._hashes = {
+            array_id: hashes[array_id]
+            for proto_cube in self._proto_cubes
+            for array_id in self._arrays(proto_cube._cube_signature)
+        }
 
-    # Construct a concatenated cube from each of the proto-cubes.
-    concatenated_cubes = iris.cube.CubeList()
+    def result(self) -> iris.cube.CubeList:
+        """Concatenate the cubes added so far.
 
-    # Emulate Python 2 behaviour.
-    def _none_sort(proto_cube):
-        return (proto_cube.name is not None, proto_cube.name)
+        Returns
+        -------
+        :class:`iris.cube.CubeList`
+            A :class:`iris.cube.CubeList` of concatenated :class:`iris.cube.Cube`
+            instances.
+
+        """
+        # Construct a concatenated cube from each of the proto-cubes.
+        concatenated_cubes = iris.cube.CubeList()
 
-    for proto_cube in sorted(proto_cubes, key=_none_sort):
-        concatenated_cubes.append(proto_cube.concatenate())
+        # Emulate Python 2 behaviour.
+        def _none_sort(proto_cube):
+            return (proto_cube.name is not None, proto_cube.name)
 
-    # Perform concatenation until we've reached an equilibrium.
-    count = len(concatenated_cubes)
-    if count != 1 and count != len(cubes):
-        concatenated_cubes = concatenate(concatenated_cubes)
+        for proto_cube in sorted(self._proto_cubes, key=_none_sort):
+            concatenated_cubes.append(proto_cube.concatenate())
 
-    return concatenated_cubes
+        # Perform concatenation until we've reached an equilibrium.
+        count = len(concatenated_cubes)
+        if count != 1 and count != self._n_cubes:
+            concatenated_cubes = concatenate(concatenated_cubes)
+
+        return concatenated_cubes
 
 
 class _CubeSignature:
@@ -919,13 +1276,13 @@ class _CoordSignature:
 
         """
         # A candidate axis must have non-identical coordinate points.
-        candidate_axis = not array_equal(coord.points, other.points)
+        candidate_axis = not _array_equal(coord.points, other.points)
 
         # Ensure both have equal availability of bounds.
         result = coord.has_bounds() == other.has_bounds()
         if result and not candidate_axis:
             # Ensure equality of bounds.
-            result = array_equal(coord.bounds, other.bounds)
+            result = _array_equal(coord.bounds, other.bounds)
 
         return result, candidate_axis
 
@@ -1019,6 +1376,9 @@ class _ProtoCube:
 
         # The list of source-cubes relevant to this proto-cube.
         self._skeletons = []
+        # The sorted extents of the source-cubes over each dimension that has
+        # been a candidate axis of concatenation.
+        self._sorted_extents = {}
         self._add_skeleton(self._coord_signature, self._cube.lazy_data())
 
         # The nominated axis of concatenation.
@@ -1301,6 +1661,8 @@ class _ProtoCube:
         """
         skeleton = _SkeletonCube(coord_signature, data)
         self._skeletons.append(skeleton)
+        for dim_ind, extents in self._sorted_extents.items():
+            bisect.insort_right(extents, coord_signature.dim_extents[dim_ind])
 
     def _build_aux_coordinates(self):
         """Generate the auxiliary coordinates with associated dimension(s) mapping.
@@ -1614,50 +1976,37 @@ class _ProtoCube:
         """
         result = True
 
-        # Add the new extent to the current extents collection.
+        # The extents of the registered source-cubes are kept in ascending
+        # order, in which they never overlap.  So the new extent only needs
+        # to be checked against its neighbours once it is sorted into them.
         dim_ind = self._coord_signature.dim_mapping.index(axis)
-        dim_extents = [
-            skeleton.signature.dim_extents[dim_ind] for skeleton in self._skeletons
-        ]
-        dim_extents.append(extent)
-
-        # Sort into the appropriate dimension order.
-        order = self._coord_signature.dim_order[dim_ind]
-        dim_extents.sort(reverse=(order == _DECREASING))
-
-        # Ensure that the extents don't overlap.
-        if len(dim_extents) > 1:
-            for i, extent in enumerate(dim_extents[1:]):
-                # Check the points - must be strictly monotonic.
-                if order == _DECREASING:
-                    big = dim_extents[i].points.min
-                    small = extent.points.max
-                else:
-                    small = dim_extents[i].points.max
-                    big = extent.points.min
+        if dim_ind not in self._sorted_extents:
+            self._sorted_extents[dim_ind] = sorted(
+                skeleton.signature.dim_extents[dim_ind] for skeleton in self._skeletons
+            )
+        dim_extents = self._sorted_extents[dim_ind]
+        i_extent = bisect.bisect_right(dim_extents, extent)
+        neighbours = [extent]
+        if i_extent > 0:
+            neighbours.insert(0, dim_extents[i_extent - 1])
+        if i_extent < len(dim_extents):
+            neighbours.append(dim_extents[i_extent])
+
+        # Ensure that the extents don't overlap.  Note that, in ascending
+        # order, this is the same test for either dimension order.
+        for lower, upper in zip(neighbours[:-1], neighbours[1:]):
+            # Check the points - must be strictly monotonic.
+            if lower.points.max >= upper.points.min:
+                result = False
+                break
+
+            # Check the bounds - must be strictly monotonic.
+            if upper.bounds is not None:
+                lower_bound_fail = lower.bounds[0].max >= upper.bounds[0].min
+                upper_bound_fail = lower.bounds[1].max >= upper.bounds[1].min
 
-                if small >= big:
+                if lower_bound_fail or upper_bound_fail:
                     result = False
                     break
 
-                # Check the bounds - must be strictly monotonic.
-                if extent.bounds is not None:
-                    if order == _DECREASING:
-                        big_0 = dim_extents[i].bounds[0].min
-                        big_1 = dim_extents[i].bounds[1].min
-                        small_0 = extent.bounds[0].max
-                        small_1 = extent.bounds[1].max
-                    else:
-                        small_0 = dim_extents[i].bounds[0].max
-                        small_1 = dim_extents[i].bounds[1].max
-                        big_0 = extent.bounds[0].min
-                        big_1 = extent.bounds[1].min
-
-                    lower_bound_fail = small_0 >= big_0
-                    upper_bound_fail = small_1 >= big_1
-
-                    if lower_bound_fail or upper_bound_fail:
-                        result = False
-                        break
-
         return result
@@ -0,0 +1,100 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Common support for the controls of concurrent loading and reading."""
+
+import concurrent.futures
+from contextlib import contextmanager
+import multiprocessing
+import os
+import threading
+import typing
+
+
+class ConcurrencyControl:
+    """The common behaviour of a control of concurrency, with a pool of workers.
+
+    Each subclass defines its own ``Modes`` enum, of which any "PROCESSES"
+    mode uses a pool of worker processes, and any other mode which uses a
+    pool at all uses a pool of threads.  The pool is started when first
+    needed, and is private to the process which started it.
+
+    """
+
+    #: The name prefix of the threads in a thread pool.
+    _THREAD_NAME_PREFIX = "iris"
+
+    def __init__(self, mode):
+        self.mode = mode
+        #: The number of workers in the pool (default chosen by Python).
+        self.max_workers = None
+        self._executor = None
+        self._executor_pid = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} mode={self.mode.name}"
+            f" max_workers={self.max_workers}>"
+        )
+
+    @contextmanager
+    def set(self, mode, max_workers: int | None = None) -> typing.Iterator[None]:
+        """Control the concurrency, within a context.
+
+        Parameters
+        ----------
+        mode : enum or str
+            The mode, from the ``Modes`` of this control, or its name.
+        max_workers : int, optional
+            The number of threads or processes in the pool.
+
+        Notes
+        -----
+        A pool is started afresh for the new settings, when needed, and any
+        pool started within the context is shut down on exit.
+
+        """
+        if isinstance(mode, str):
+            mode = self.Modes[mode.upper()]
+        old_settings = (self.mode, self.max_workers, self._executor)
+        self.mode = mode
+        self.max_workers = max_workers
+        self._executor = None
+        try:
+            yield
+        finally:
+            if self._executor is not old_settings[2]:
+                self.shutdown()
+            self.mode, self.max_workers, self._executor = old_settings
+
+    def shutdown(self):
+        """Stop any pool of workers."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._executor_pid == os.getpid():
+            executor.shutdown()
+
+    def _process_pool_options(self):
+        # Any extra keywords for a process pool, e.g. a worker initializer.
+        return {}
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                if self.mode.name == "PROCESSES":
+                    # N.B. "spawn", since forking a multi-threaded process can
+                    #  copy held locks into the workers.
+                    self._executor = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        **self._process_pool_options(),
+                    )
+                else:
+                    self._executor = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=self._THREAD_NAME_PREFIX,
+                    )
+                self._executor_pid = os.getpid()
+            return self._executor
@@ -484,6 +484,45 @@ class _FactoryDefn(namedtuple("_FactoryDefn", ["class_", "dependency_defns"])):
     __slots__ = ()
 
 
+class _SourceCube(
+    namedtuple("SourceCube", ["cube", "cube_signature", "coord_payload", "key"])
+):
+    """A source-cube, together with the signatures which define its ProtoCube.
+
+    Parameters
+    ----------
+    cube :
+        The source :class:`iris.cube.Cube`.
+    cube_signature :
+        The :class:`_CubeSignature` of the cube.
+    coord_payload :
+        The :class:`_CoordPayload` of the cube.
+    key :
+        A hashable summary of the signatures, which is equal for all
+        source-cubes that can merge together.  See :func:`_merge_key`.
+
+    """
+
+    __slots__ = ()
+
+
+class _Index(namedtuple("Index", ["codes", "cells"])):
+    """Integer coding of the scalar values of a candidate dimension.
+
+    Parameters
+    ----------
+    codes :
+        A :mod:`numpy` integer array of the index, within `cells`, of the
+        scalar value of each source-cube.
+    cells :
+        A list of the distinct scalar values of the candidate dimension, in
+        order of first appearance.
+
+    """
+
+    __slots__ = ()
+
+
 class _Relation(namedtuple("Relation", ["separable", "inseparable"])):
     """Categorisation of the candidate dimensions.
 
@@ -506,6 +545,61 @@ class _Relation(namedtuple("Relation", ["separable", "inseparable"])):
 _COMBINATION_JOIN = "-"
 
 
+def _attribute_key(value):
+    # A hashable form of an attribute value, which is the same for all values
+    # that compare equal as attributes (see LimitedAttributeDict.__eq__), or
+    # None when there is no such form.
+    try:
+        array = np.array(value, ndmin=1)
+        result = (array.shape, tuple(array.ravel().tolist()))
+        hash(result)
+    except (TypeError, ValueError):
+        result = None
+    return result
+
+
+def _merge_key(cube_signature, coord_payload):
+    """Return a hashable key for the signatures of a source-cube.
+
+    Source-cubes with different keys can never register with the same
+    :class:`ProtoCube`, so each cube need only be compared with the ProtoCubes
+    that share its key.  The key is built from just the cheaply hashed parts of
+    the signatures : names, attributes, shapes, dtypes and dimensions.
+
+    """
+    defn = cube_signature.defn
+
+    def attributes_key(attributes):
+        return tuple(
+            sorted((name, _attribute_key(value)) for name, value in attributes.items())
+        )
+
+    def names_and_dims(items_and_dims):
+        return tuple((item.name(), tuple(dims)) for item, dims in items_and_dims)
+
+    def vector_key(coords_and_dims):
+        return tuple(
+            (item.coord.name(), item.coord.shape, item.dims) for item in coords_and_dims
+        )
+
+    return (
+        defn.standard_name,
+        defn.long_name,
+        defn.var_name,
+        attributes_key(defn.attributes.globals),
+        attributes_key(defn.attributes.locals),
+        tuple(method.method for method in defn.cell_methods),
+        cube_signature.data_shape,
+        cube_signature.data_type,
+        names_and_dims(cube_signature.cell_measures_and_dims),
+        names_and_dims(cube_signature.ancillary_variables_and_dims),
+        tuple(defn.name() for defn in coord_payload.scalar.defns),
+        vector_key(coord_payload.vector.dim_coords_and_dims),
+        vector_key(coord_payload.vector.aux_coords_and_dims),
+        tuple(factory_defn.class_ for factory_defn in coord_payload.factory_defns),
+    )
+
+
 def _is_combination(name):
     """Determine whether the candidate dimension is an 'invented' combination.
 
@@ -526,11 +620,12 @@ def _is_combination(name):
 
 
 def build_indexes(positions):
-    r"""Construct a mapping for each candidate dimension.
+    r"""Construct an integer coding of the scalar values of each candidate dimension.
 
-    Construct a mapping for each candidate dimension that maps for each
-    of its scalar values the set of values for each of the other candidate
-    dimensions.
+    For each candidate dimension, the distinct scalar values are recorded in
+    order of first appearance, together with an array of the index of the
+    value of each source-cube within those.  All the analysis of the merge
+    space is then performed with vectorised operations on these integer codes.
 
     For example:
 
@@ -541,24 +636,11 @@ def build_indexes(positions):
         ...
         >>> indexes = build_indexes(positions)
         >>> for k in sorted(indexes):
-        ...     print('%r:' % k)
-        ...     for kk in sorted(indexes[k]):
-        ...         print('\t%r:' % kk, end=' ')
-        ...         for kkk in sorted(indexes[k][kk]):
-        ...             print('%r: %r' % (kkk, indexes[k][kk][kkk]), end=' ')
-        ...         print()
+        ...     print(f'{k!r}: {indexes[k].codes} {indexes[k].cells}')
         ...
-        'a':
-             0: 'b': set([10]) 'c': set([100])
-             1: 'b': set([10]) 'c': set([200])
-             2: 'b': set([20]) 'c': set([300])
-        'b':
-             10: 'a': set([0, 1]) 'c': set([200, 100])
-             20: 'a': set([2]) 'c': set([300])
-        'c':
-             100: 'a': set([0]) 'b': set([10])
-             200: 'a': set([1]) 'b': set([10])
-             300: 'a': set([2]) 'b': set([20])
+        'a': [0 1 2] [0, 1, 2]
+        'b': [0 0 1] [10, 20]
+        'c': [0 1 2] [100, 200, 300]
 
     Parameters
     ----------
@@ -568,93 +650,84 @@ def build_indexes(positions):
 
     Returns
     -------
-    The cross-reference dictionary for each candidate dimension.
+    A dictionary of :class:`_Index` for each candidate dimension.
 
     """
-    names = positions[0].keys()
-    scalar_index_by_name = {name: {} for name in names}
-
-    for position in positions:
-        for name, value in position.items():
-            name_index_by_scalar = scalar_index_by_name[name]
-
-            if value in name_index_by_scalar:
-                value_index_by_name = name_index_by_scalar[value]
-                for other_name in names:
-                    if other_name != name:
-                        value_index_by_name[other_name].add(position[other_name])
-            else:
-                name_index_by_scalar[value] = {
-                    other_name: set((position[other_name],))
-                    for other_name in names
-                    if other_name != name
-                }
+    indexes = {}
+    for name in positions[0]:
+        code_by_cell = {}
+        codes = np.fromiter(
+            (
+                code_by_cell.setdefault(position[name], len(code_by_cell))
+                for position in positions
+            ),
+            dtype=np.int64,
+            count=len(positions),
+        )
+        indexes[name] = _Index(codes, list(code_by_cell))
+    return indexes
 
-    return scalar_index_by_name
 
+def _n_unique(codes):
+    # The number of distinct values in an integer array.
+    return np.unique(codes).size
 
-def _separable_pair(name, index):
-    """Determine whether the candidate dimension is separable.
 
-    A candidate dimension X and Y are separable if each scalar
-    value of X maps to the same set of scalar values of Y.
+def _combined_codes(indexes, names):
+    """Integer code the combinations of the scalar values of candidate dimensions.
 
     Parameters
     ----------
-    name1 :
-        The first candidate dimension to be compared.
-    name2 :
-        The second candidate dimension to be compared.
-    index :
-        The cross-reference dictionary for the first candidate
-        dimension.
+    indexes :
+        The :class:`_Index` for each candidate dimension.
+    names :
+        The candidate dimensions to combine.
 
     Returns
     -------
-    bool
+    An array of the code of the combination of values of each source-cube.
 
     """
-    items = iter(index.values())
-    reference = next(items)[name]
-
-    return all([item[name] == reference for item in items])
-
+    names = list(names)
+    if not names:
+        # All source-cubes share the single, empty, combination.
+        n_positions = len(next(iter(indexes.values())).codes)
+        return np.zeros(n_positions, dtype=np.int64)
+    combined = indexes[names[0]].codes
+    for name in names[1:]:
+        index = indexes[name]
+        # Re-code after each step, so the combined codes stay within bounds.
+        _, combined = np.unique(
+            combined * len(index.cells) + index.codes, return_inverse=True
+        )
+        combined = combined.reshape(-1)
+    return combined
 
-def _separable(name, indexes):
-    """Determine the candidate dimensions that are separable and inseparable.
 
-    Determine the candidate dimensions that are separable and
-    inseparable relative to the provided candidate dimension.
+def _separable_pair(index1, index2):
+    """Determine whether two candidate dimensions are separable.
 
     A candidate dimension X and Y are separable if each scalar
     value of X maps to the same set of scalar values of Y.
+    As every value of Y appears with some value of X, that set must then be
+    all the values of Y, so every combination of the values occurs.
+    This makes the relationship symmetric.
 
     Parameters
     ----------
-    name :
-        The candidate dimension that requires its separable and
-        inseparable relationship to be determined.
-    indexes :
-        The cross-reference dictionary for each candidate dimension.
+    index1 :
+        The :class:`_Index` of the first candidate dimension.
+    index2 :
+        The :class:`_Index` of the second candidate dimension.
 
     Returns
     -------
-    tuple
-        A tuple containing the set of separable and inseparable
-        candidate dimensions.
+    bool
 
     """
-    separable = set()
-    inseparable = set()
-
-    for target_name in indexes:
-        if name != target_name:
-            if _separable_pair(target_name, indexes[name]):
-                separable.add(target_name)
-            else:
-                inseparable.add(target_name)
-
-    return _Relation(separable, inseparable)
+    n_cells1, n_cells2 = len(index1.cells), len(index2.cells)
+    n_pairs = _n_unique(index1.codes * n_cells2 + index2.codes)
+    return n_pairs == n_cells1 * n_cells2
 
 
 def derive_relation_matrix(indexes):
@@ -687,16 +760,25 @@ def derive_relation_matrix(indexes):
     Parameters
     ----------
     indexes :
-        The cross-reference dictionary for each candidate dimension.
+        The :class:`_Index` for each candidate dimension.
 
     Returns
     -------
     The relation dictionary for each candidate dimension.
 
     """
-    # TODO: This takes twice as long as it could do because it doesn't
-    # account for the symmetric nature of the relationship.
-    relation_matrix = {name: _separable(name, indexes) for name in indexes}
+    relation_matrix = {name: _Relation(set(), set()) for name in indexes}
+    names = list(indexes)
+
+    # The relationship is symmetric, so test each pair only once.
+    for i_name, name in enumerate(names):
+        for other_name in names[i_name + 1 :]:
+            if _separable_pair(indexes[name], indexes[other_name]):
+                relation_matrix[name].separable.add(other_name)
+                relation_matrix[other_name].separable.add(name)
+            else:
+                relation_matrix[name].inseparable.add(other_name)
+                relation_matrix[other_name].inseparable.add(name)
 
     return relation_matrix
 
@@ -761,7 +843,7 @@ def _derive_separable_group(relation_matrix, group):
     return result
 
 
-def _is_dependent(dependent, independent, positions, function_mapping=None):
+def _is_dependent(dependent, independent, indexes, function_mapping=None):
     """Determine whether there exists a one-to-one functional relationship.
 
     Determine whether there exists a one-to-one functional relationship
@@ -776,9 +858,8 @@ def _is_dependent(dependent, independent, positions, function_mapping=None):
     independent :
         A list of candidate dimension/s that require to act as the independent
         variables in a functional relationship.
-    positions :
-        A list containing a dictionary of candidate dimension key to
-        scalar value pairs for each source-cube.
+    indexes :
+        The :class:`_Index` for each candidate dimension.
     function_mapping : optional
         A dictionary that enumerates a valid functional relationship
         between the dependent candidate dimension and the independent
@@ -789,21 +870,27 @@ def _is_dependent(dependent, independent, positions, function_mapping=None):
     bool
 
     """
-    valid = True
-    relation = {}
-
-    if isinstance(function_mapping, dict):
-        relation = function_mapping
-
-    for position in positions:
-        item = tuple([position[name] for name in independent])
-
-        if item in relation:
-            if position[dependent] != relation[item]:
-                valid = False
-                break
-        else:
-            relation[item] = position[dependent]
+    independent = list(independent)
+    dependent_index = indexes[dependent]
+    keys = _combined_codes(indexes, independent)
+
+    # The relationship is a function if no combination of independent values
+    # occurs with more than one dependent value.
+    n_keys = _n_unique(keys)
+    n_pairs = _n_unique(keys * len(dependent_index.cells) + dependent_index.codes)
+    valid = n_pairs == n_keys
+
+    if valid and isinstance(function_mapping, dict):
+        # Enumerate the relationship, in order of first appearance.
+        _, first = np.unique(keys, return_index=True)
+        for i_position in np.sort(first):
+            item = tuple(
+                indexes[name].cells[indexes[name].codes[i_position]]
+                for name in independent
+            )
+            function_mapping[item] = dependent_index.cells[
+                dependent_index.codes[i_position]
+            ]
 
     return valid
 
@@ -857,7 +944,7 @@ def _derive_consistent_groups(relation_matrix, separable_group):
 
 
 def _build_separable_group(
-    space, group, separable_consistent_groups, positions, function_matrix
+    space, group, separable_consistent_groups, indexes, function_matrix
 ):
     """Update the space with the first separable consistent group.
 
@@ -881,9 +968,8 @@ def _build_separable_group(
         A set of related (chained) inseparable candidate dimensions.
     separable_consistent_groups :
         A list of candidate dimension groups that are consistently separable.
-    positions :
-        A list containing a dictionary of candidate dimension key to
-        scalar value pairs for each source-cube.
+    indexes :
+        The :class:`_Index` for each candidate dimension.
     function_matrix :
         The function mapping dictionary for each candidate dimension that
         participates in a functional relationship.
@@ -901,7 +987,7 @@ def _build_separable_group(
 
         for name in dependent:
             function_mapping = {}
-            valid = _is_dependent(name, independent, positions, function_mapping)
+            valid = _is_dependent(name, independent, indexes, function_mapping)
 
             if not valid:
                 break
@@ -921,7 +1007,7 @@ def _build_separable_group(
     return valid
 
 
-def _build_inseparable_group(space, group, positions, function_matrix):
+def _build_inseparable_group(space, group, indexes, function_matrix):
     """Update the space with the first valid scalar functional relationship.
 
     Update the space with the first valid scalar functional relationship
@@ -946,9 +1032,8 @@ def _build_inseparable_group(space, group, positions, function_matrix):
         any other candidate dimensions within the space.
     group :
         A set of related (chained) inseparable candidate dimensions.
-    positions :
-        A list containing a dictionary of candidate dimension key to
-        scalar value pairs for each source-cube.
+    indexes :
+        The :class:`_Index` for each candidate dimension.
     function_matrix :
         The function mapping dictionary for each candidate dimension that
         participates in a functional relationship.
@@ -968,7 +1053,7 @@ def _build_inseparable_group(space, group, positions, function_matrix):
 
         for name in dependent:
             function_mapping = {}
-            valid = _is_dependent(name, independent, positions, function_mapping)
+            valid = _is_dependent(name, independent, indexes, function_mapping)
 
             if not valid:
                 break
@@ -988,7 +1073,7 @@ def _build_inseparable_group(space, group, positions, function_matrix):
     return scalar
 
 
-def _build_combination_group(space, group, positions, function_matrix):
+def _build_combination_group(space, group, indexes, function_matrix):
     """Update the space with the new combined or invented dimension.
 
     Update the space with the new combined or invented dimension
@@ -1006,9 +1091,8 @@ def _build_combination_group(space, group, positions, function_matrix):
         any other candidate dimensions within the space.
     group :
         A set of related (chained) inseparable candidate dimensions.
-    positions :
-        A list containing a dictionary of candidate dimension key to
-        scalar value pairs for each source-cube.
+    indexes :
+        The :class:`_Index` for each candidate dimension.
     function_matrix :
         The function mapping dictionary for each candidate dimension that
         participates in a functional relationship.
@@ -1027,22 +1111,28 @@ def _build_combination_group(space, group, positions, function_matrix):
     for name in group:
         function_matrix[name] = {}
 
-    for position in positions:
+    # Enumerate each distinct combination of member values, in order of
+    # first appearance.
+    member_names = [int(member) if member.isdigit() else member for member in members]
+    _, first = np.unique(_combined_codes(indexes, member_names), return_index=True)
+    for i_position in np.sort(first):
         # Note, the cell double-tuple! This ensures that the cell value for
         # each member of the group is kept bound together as one key.
         cell = (
             tuple(
                 [
-                    position[int(member) if member.isdigit() else member]
-                    for member in members
+                    indexes[member].cells[indexes[member].codes[i_position]]
+                    for member in member_names
                 ]
             ),
         )
         for name in group:
-            function_matrix[name][cell] = position[name]
+            function_matrix[name][cell] = indexes[name].cells[
+                indexes[name].codes[i_position]
+            ]
 
 
-def derive_space(groups, relation_matrix, positions, function_matrix=None):
+def derive_space(groups, relation_matrix, indexes, function_matrix=None):
     """Determine the relationship between all the candidate dimensions.
 
     Parameters
@@ -1051,9 +1141,8 @@ def derive_space(groups, relation_matrix, positions, function_matrix=None):
         A list of all related (chained) inseparable candidate dimensions.
     relation_matrix :
         The relation dictionary for each candidate dimension.
-    positions :
-        A list containing a dictionary of candidate dimension key to
-        scalar value pairs for each source-cube.
+    indexes :
+        The :class:`_Index` for each candidate dimension.
     function_matrix : optional
           The function mapping dictionary for each candidate dimension that
           participates in a functional relationship.
@@ -1080,21 +1169,21 @@ def derive_space(groups, relation_matrix, positions, function_matrix=None):
                 relation_matrix, separable_group
             )
             if not _build_separable_group(
-                space, group, consistent_groups, positions, function_matrix
+                space, group, consistent_groups, indexes, function_matrix
             ):
                 # There is no relationship between any of the candidate
                 # dimensions in the separable group, so merge them together
                 # into a new combined dimension of the space.
-                _build_combination_group(space, group, positions, function_matrix)
+                _build_combination_group(space, group, indexes, function_matrix)
         else:
             # Determine whether there is a scalar relationship between one of
             # the candidate dimensions and each of the other candidate
             # dimensions in this inseparable group.
-            if not _build_inseparable_group(space, group, positions, function_matrix):
+            if not _build_inseparable_group(space, group, indexes, function_matrix):
                 # There is no relationship between any of the candidate
                 # dimensions in this inseparable group, so merge them together
                 # into a new combined dimension of the space.
-                _build_combination_group(space, group, positions, function_matrix)
+                _build_combination_group(space, group, indexes, function_matrix)
 
     return space
 
@@ -1102,32 +1191,40 @@ def derive_space(groups, relation_matrix, positions, function_matrix=None):
 class ProtoCube:
     """Framework for merging source-cubes into one or more higher dimensional cubes."""
 
-    def __init__(self, cube):
+    # Default hint ordering for candidate dimension coordinates.
+    _hints = [
+        "time",
+        "forecast_reference_time",
+        "forecast_period",
+        "model_level_number",
+    ]
+
+    def __init__(self, cube, source=None):
         """Create a new ProtoCube from the given cube.
 
         Create a new ProtoCube from the given cube and record the cube as a
         source-cube.
 
+        Parameters
+        ----------
+        cube :
+            The first source :class:`iris.cube.Cube`.
+        source : :class:`_SourceCube`, optional
+            The signatures of `cube`, if already calculated by
+            :meth:`source_cube`.
+
         """
-        if cube.is_dataless():
-            raise iris.exceptions.DatalessError("merge")
-        # Default hint ordering for candidate dimension coordinates.
-        self._hints = [
-            "time",
-            "forecast_reference_time",
-            "forecast_period",
-            "model_level_number",
-        ]
+        if source is None:
+            source = self.source_cube(cube)
 
         # The proto-cube source.
         self._source = cube
 
         # The cube signature is metadata that defines this ProtoCube.
-        self._cube_signature = self._build_signature(cube)
+        self._cube_signature = source.cube_signature
 
-        # Extract the scalar and vector coordinate data and metadata
-        # from the cube.
-        coord_payload = self._extract_coord_payload(cube)
+        # The scalar and vector coordinate data and metadata from the cube.
+        coord_payload = source.coord_payload
 
         # The coordinate signature defines the scalar and vector
         # coordinates of this ProtoCube.
@@ -1209,7 +1306,7 @@ class ProtoCube:
 
         function_matrix = {}
         space = derive_space(
-            groups, relation_matrix, positions, function_matrix=function_matrix
+            groups, relation_matrix, indexes, function_matrix=function_matrix
         )
         self._define_space(space, positions, indexes, function_matrix)
         self._build_coordinates()
@@ -1265,7 +1362,28 @@ class ProtoCube:
 
         return merged_cubes
 
-    def register(self, cube, error_on_mismatch=False):
+    @classmethod
+    def source_cube(cls, cube):
+        """Calculate the signatures of a source-cube.
+
+        Parameters
+        ----------
+        cube :
+            A source :class:`iris.cube.Cube`.
+
+        Returns
+        -------
+        :class:`_SourceCube`
+
+        """
+        if cube.is_dataless():
+            raise iris.exceptions.DatalessError("merge")
+        cube_signature = cls._build_signature(cube)
+        coord_payload = cls._extract_coord_payload(cube)
+        key = _merge_key(cube_signature, coord_payload)
+        return _SourceCube(cube, cube_signature, coord_payload, key)
+
+    def register(self, cube, error_on_mismatch=False, source=None):
         """Add a compatible :class:`iris.cube.Cube` as a source for merging.
 
         Add a compatible :class:`iris.cube.Cube` as a source-cube for
@@ -1283,6 +1401,9 @@ class ProtoCube:
         error_on_mismatch : bool, default=False
             If True, raise an informative
             :class:`~iris.exceptions.MergeError` if registration fails.
+        source : :class:`_SourceCube`, optional
+            The signatures of `cube`, if already calculated by
+            :meth:`source_cube`.
 
         Returns
         -------
@@ -1291,13 +1412,12 @@ class ProtoCube:
             this :class:`ProtoCube`.
 
         """
-        if cube.is_dataless():
-            raise iris.exceptions.DatalessError("merge")
+        if source is None:
+            source = self.source_cube(cube)
         cube_signature = self._cube_signature
-        other = self._build_signature(cube)
-        match = cube_signature.match(other, error_on_mismatch)
+        match = cube_signature.match(source.cube_signature, error_on_mismatch)
         if match:
-            coord_payload = self._extract_coord_payload(cube)
+            coord_payload = source.coord_payload
             match = coord_payload.match_signature(
                 self._coord_signature, error_on_mismatch
             )
@@ -1351,7 +1471,7 @@ class ProtoCube:
             A list containing a dictionary of candidate dimension key to
             scalar value pairs for each source-cube.
         indexes :
-            A cross-reference dictionary for each candidate dimension.
+            The :class:`_Index` for each candidate dimension.
         function_matrix :
             The function mapping dictionary for each candidate dimension that
             participates in a functional relationship.
@@ -1405,7 +1525,7 @@ class ProtoCube:
                 else:
                     # TODO: Consider appropriate sort order (ascending,
                     # descending) i.e. use CF positive attribute.
-                    cells = sorted(indexes[name])
+                    cells = sorted(indexes[name].cells)
                     points = np.array(
                         [cell.point for cell in cells],
                         dtype=metadata[name].points_dtype,
@@ -1643,7 +1763,8 @@ class ProtoCube:
         ):
             aux_coords_and_dims.append(_CoordAndDims(item.coord, dims))
 
-    def _build_signature(self, cube):
+    @staticmethod
+    def _build_signature(cube):
         """Generate the signature that defines this cube.
 
         Parameters
@@ -1673,7 +1794,8 @@ class ProtoCube:
                 self._coord_metadata[i] = metadata
         self._skeletons.append(skeleton)
 
-    def _extract_coord_payload(self, cube):
+    @classmethod
+    def _extract_coord_payload(cls, cube):
         """Extract all relevant coordinate data and metadata from the cube.
 
         In particular, for each scalar coordinate determine its definition,
@@ -1700,8 +1822,7 @@ class ProtoCube:
         # Coordinate hint ordering dictionary - from most preferred to least.
         # Copes with duplicate hint entries, where the most preferred is king.
         hint_dict = {
-            name: i
-            for i, name in zip(range(len(self._hints), 0, -1), self._hints[::-1])
+            name: i for i, name in zip(range(len(cls._hints), 0, -1), cls._hints[::-1])
         }
         # Coordinate axis ordering dictionary.
         axis_dict = {"T": 0, "Z": 1, "Y": 2, "X": 3}
@@ -39,9 +39,7 @@ from collections.abc import Iterable, Sequence
 import functools
 from functools import wraps
 from inspect import getfullargspec
-import itertools
-from numbers import Number
-from typing import Optional, Protocol, Union
+from typing import Optional, Protocol
 import warnings
 
 from cf_units import Unit
@@ -52,7 +50,7 @@ import scipy.interpolate
 import scipy.stats.mstats
 
 import iris._lazy_data
-from iris.analysis._area_weighted import AreaWeightedRegridder
+from iris.analysis._area_weighted import AREA_WEIGHTS_CACHE, AreaWeightedRegridder
 from iris.analysis._interpolation import EXTRAPOLATION_MODES, RectilinearInterpolator
 from iris.analysis._regrid import CurvilinearRegridder, RectilinearRegridder
 import iris.coords
@@ -61,6 +59,7 @@ from iris.exceptions import LazyAggregatorError
 import iris.util
 
 __all__ = (
+    "AREA_WEIGHTS_CACHE",
     "Aggregator",
     "AreaWeighted",
     "COUNT",
@@ -2334,6 +2333,11 @@ class _Groupby:
         self._groupby_coords: list[AuxCoord | DimCoord] = []
         self._shared_coords: list[tuple[AuxCoord | DimCoord, int]] = []
         self._groupby_indices: list[tuple[int, ...]] = []
+        # The group code of each point, the point indices in group order, and
+        # the start of each group within them.
+        self._codes: Optional[np.ndarray] = None
+        self._order: Optional[np.ndarray] = None
+        self._offsets: Optional[np.ndarray] = None
         self._stop = None
         # Ensure group-by coordinates are iterable.
         if not isinstance(groupby_coords, Iterable):
@@ -2375,6 +2379,65 @@ class _Groupby:
             raise ValueError("Shared coordinates have different lengths.")
         self._shared_coords.append((coord, dim))
 
+    def _factorise(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Number the groups in order of their first point.
+        if not self._groupby_coords:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty, empty
+        coord_codes = []
+        sizes = []
+        for coord in self._groupby_coords:
+            values, inverse = np.unique(coord.points, return_inverse=True)
+            coord_codes.append(inverse.reshape(-1))
+            sizes.append(len(values))
+        # Combine the codes of each coordinate into a composite key.
+        if len(coord_codes) == 1:
+            keys = coord_codes[0]
+        else:
+            try:
+                keys = np.ravel_multi_index(coord_codes, sizes)
+            except ValueError:
+                # Too many combinations to number : compare the codes instead.
+                keys = np.stack(coord_codes, axis=-1)
+        _, first, inverse = np.unique(
+            keys,
+            return_index=True,
+            return_inverse=True,
+            axis=0 if keys.ndim > 1 else None,
+        )
+        rank = np.empty(len(first), dtype=np.intp)
+        rank[np.argsort(first)] = np.arange(len(first))
+        codes = rank[inverse.reshape(-1)]
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes, minlength=len(first))
+        offsets = np.cumsum(counts) - counts
+        return codes, order, offsets
+
+    def group_codes(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Calculate the groups over one or more group-by coordinates, as arrays.
+
+        Also creates new group-by and shared coordinates given the calculated
+        groups.
+
+        Returns
+        -------
+        codes : array of int
+            The group number of each point.  Groups are numbered in order of
+            their first point.
+        order : array of int
+            The point indices, sorted by group, and in order within each group.
+        offsets : array of int
+            The start of each group within ``order``.
+
+        """
+        if self._codes is None:
+            self._codes, self._order, self._offsets = self._factorise()
+            # Calculate the new group-by coordinates.
+            self._compute_groupby_coords()
+            # Calculate the new shared coordinates.
+            self._compute_shared_coords()
+        return self._codes, self._order, self._offsets
+
     def group(self) -> list[tuple[int, ...]]:
         """Calculate groups and associated slices over one or more group-by coordinates.
 
@@ -2387,63 +2450,28 @@ class _Groupby:
 
         """
         if not self._groupby_indices:
-            # Construct the group indices for each group over the group-by
-            # coordinates. Keep constructing until all group-by coordinate
-            # groups are exhausted.
-
-            def group_iterator(points):
-                start = 0
-                for _, group in itertools.groupby(points):
-                    stop = sum((1 for _ in group), start)
-                    yield slice(start, stop)
-                    start = stop
-
-            groups = [group_iterator(c.points) for c in self._groupby_coords]
-            groupby_slices = [next(group) for group in groups]
-            indices_by_key: dict[tuple[Union[Number, str], ...], list[int]] = {}
-            while any(s is not None for s in groupby_slices):
-                # Determine the extent (start, stop) of the group given
-                # each current group-by coordinate group.
-                start = max(s.start for s in groupby_slices if s is not None)
-                stop = min(s.stop for s in groupby_slices if s is not None)
-                # Construct composite group key for the group using the
-                # start value from each group-by coordinate.
-                key = tuple(coord.points[start] for coord in self._groupby_coords)
-                # Associate group slice with group key within the ordered
-                # dictionary.
-                indices_by_key.setdefault(key, []).extend(range(start, stop))
-                # Prepare for the next group slice construction over the
-                # group-by coordinates.
-                for index, groupby_slice in enumerate(groupby_slices):
-                    if groupby_slice is None:
-                        continue
-                    # Determine whether coordinate has spanned all its
-                    # groups i.e. its full length
-                    # or whether we need to get the coordinates next group.
-                    if groupby_slice.stop == self._stop:
-                        # This coordinate has exhausted all its groups,
-                        # so remove it.
-                        groupby_slices[index] = None
-                    elif groupby_slice.stop == stop:
-                        # The current group of this coordinate is
-                        # exhausted, so get the next one.
-                        groupby_slices[index] = next(groups[index])
-
-            # Cache the indices
-            self._groupby_indices = [tuple(i) for i in indices_by_key.values()]
-            # Calculate the new group-by coordinates.
-            self._compute_groupby_coords()
-            # Calculate the new shared coordinates.
-            self._compute_shared_coords()
+            _, order, offsets = self.group_codes()
+            order_list = order.tolist()
+            bounds = offsets.tolist() + [len(order_list)]
+            self._groupby_indices = [
+                tuple(order_list[start:stop])
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
 
         # Return the group-by indices/groups.
         return self._groupby_indices
 
+    def _group_ends(self) -> tuple[np.ndarray, np.ndarray]:
+        # The first and last point index of each group.
+        stops = np.append(self._offsets[1:], len(self._order))
+        last = stops[: len(self._offsets)].astype(np.intp) - 1
+        return self._order[self._offsets], self._order[last]
+
     def _compute_groupby_coords(self) -> None:
         """Create new group-by coordinates given the group slices."""
         # Construct a group-by slice that samples the first element from each
         # group.
-        groupby_slice = np.array([i[0] for i in self._groupby_indices])
+        groupby_slice, _ = self._group_ends()
 
         # Create new group-by coordinates from the group-by slice.
         self.coords = [coord[groupby_slice] for coord in self._groupby_coords]
@@ -2469,7 +2497,7 @@ class _Groupby:
                         new_shape += shape[:-1]
                     work_arr = work_arr.reshape(work_shape)
 
-                    for indices in self._groupby_indices:
+                    for indices in np.split(self._order, self._offsets[1:]):
                         for arr in work_arr:
                             new_points_list.append("|".join(arr.take(indices)))
 
@@ -2485,61 +2513,49 @@ class _Groupby:
                     )
                     raise ValueError(msg)
             else:
-                new_bounds_list = []
                 if coord.has_bounds():
                     # Derive new coord's bounds from bounds.
                     item = coord.bounds
-                    maxmin_axis: Union[int, tuple[int, int]] = (dim, -1)
                     first_choices = coord.bounds.take(0, -1)
                     last_choices = coord.bounds.take(1, -1)
 
                 else:
                     # Derive new coord's bounds from points.
                     item = coord.points
-                    maxmin_axis = dim
                     first_choices = last_choices = coord.points
 
                 # Check whether item is monotonic along the dimension of interest.
                 deltas = np.diff(item, 1, dim)
                 monotonic = np.all(deltas >= 0) or np.all(deltas <= 0)
 
-                # Construct list of coordinate group boundary pairs.
+                # Construct the coordinate group boundary pairs.
                 if monotonic:
                     # Use first and last bound or point for new bounds.
-                    for indices in self._groupby_indices:
-                        start, stop = indices[0], indices[-1]
-                        if (
-                            getattr(coord, "circular", False)
-                            and (stop + 1) == self._stop
-                        ):
-                            new_bounds_list.append(
-                                [
-                                    first_choices.take(start, dim),
-                                    first_choices.take(0, dim) + coord.units.modulus,
-                                ]
-                            )
-                        else:
-                            new_bounds_list.append(
-                                [
-                                    first_choices.take(start, dim),
-                                    last_choices.take(stop, dim),
-                                ]
-                            )
+                    starts, stops = self._group_ends()
+                    lower = first_choices.take(starts, dim)
+                    upper = last_choices.take(stops, dim)
+                    wrapped = stops + 1 == self._stop
+                    if getattr(coord, "circular", False) and np.any(wrapped):
+                        shape = [1] * upper.ndim
+                        shape[dim] = -1
+                        upper = np.where(
+                            wrapped.reshape(shape),
+                            first_choices.take([0], dim) + coord.units.modulus,
+                            upper,
+                        )
                 else:
                     # Use min and max bound or point for new bounds.
-                    for indices in self._groupby_indices:
-                        item_slice = item.take(indices, dim)
-                        new_bounds_list.append(
-                            [
-                                item_slice.min(axis=maxmin_axis),
-                                item_slice.max(axis=maxmin_axis),
-                            ]
-                        )
+                    item_sorted = item.take(self._order, dim)
+                    lower = np.minimum.reduceat(item_sorted, self._offsets, axis=dim)
+                    upper = np.maximum.reduceat(item_sorted, self._offsets, axis=dim)
+                    if coord.has_bounds():
+                        lower = lower.min(axis=-1)
+                        upper = upper.max(axis=-1)
 
                 # Bounds needs to be an array with the length 2 start-stop
-                # dimension last, and the aggregated dimension back in its
-                # original position.
-                new_bounds = np.moveaxis(np.array(new_bounds_list), (0, 1), (dim, -1))
+                # dimension last, and the aggregated dimension in its original
+                # position.
+                new_bounds = np.stack([lower, upper], axis=-1)
 
                 # Now create the new bounded group shared coordinate.
                 try:
@@ -2571,7 +2587,8 @@ class _Groupby:
 
     def __len__(self) -> int:
         """Calculate the number of groups given the group-by coordinates."""
-        return len(self.group())
+        _, _, offsets = self.group_codes()
+        return len(offsets)
 
     def __repr__(self) -> str:
         groupby_coords = [coord.name() for coord in self._groupby_coords]
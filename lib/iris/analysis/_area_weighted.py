@@ -2,7 +2,15 @@
 #
 # This file is part of Iris and is released under the BSD license.
 # See LICENSE in the root of the repository for full licensing details.
+from collections import OrderedDict
+from contextlib import contextmanager
 import functools
+import hashlib
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Iterator
 
 import cf_units
 import numpy as np
@@ -71,8 +79,38 @@ class AreaWeightedRegridder:
             self.meshgrid_x,
             self.meshgrid_y,
             self.weights,
+            self._weights_key,
         ) = _regrid_info
 
+    @property
+    def fingerprint(self):
+        """A fingerprint of the source and target grids, as a hex string.
+
+        This identifies the regridding weights in the
+        :data:`AREA_WEIGHTS_CACHE`, and in a saved weights file.  It is
+        calculated when the regridder is created, so is not affected by any
+        later changes to the original cubes.
+
+        """
+        return self._weights_key
+
+    def save_weights(self, filename):
+        """Save the regridding weights, to reuse in another session.
+
+        The weights are saved as a sparse matrix, in a numpy ".npz" file,
+        with the :attr:`fingerprint` of the grids.  Loading the file with
+        :meth:`AreaWeightsCache.load` makes any later regridding between the
+        same grids use the saved weights, rather than calculating them.
+
+        Parameters
+        ----------
+        filename : str or Path
+            The file to save to.
+
+        """
+        with open(filename, "wb") as file:
+            _save_weights(file, self.fingerprint, self.weights)
+
     def __call__(self, cube):
         """Regrid :class:`~iris.cube.Cube` onto target grid :class:`AreaWeightedRegridder`.
 
@@ -122,12 +160,241 @@ class AreaWeightedRegridder:
             self.meshgrid_x,
             self.meshgrid_y,
             self.weights,
+            self._weights_key,
         )
         return _regrid_area_weighted_rectilinear_src_and_grid__perform(
             cube, _regrid_info, mdtol=self._mdtol
         )
 
 
+def _weights_key(src_x, src_y, grid_x, grid_y):
+    """Return a fingerprint of the source and target grids, as a hex string.
+
+    The regridding weights depend only on the bounds, units and coordinate
+    systems of the horizontal coordinates, so are identified by this.
+
+    """
+    digest = hashlib.sha1()
+    for coord in (src_x, src_y, grid_x, grid_y):
+        bounds = np.ascontiguousarray(coord.contiguous_bounds())
+        digest.update(str(coord.units).encode())
+        digest.update(repr(coord.coord_system).encode())
+        digest.update(f"{bounds.dtype.str}{bounds.shape}".encode())
+        digest.update(bounds.tobytes())
+    return digest.hexdigest()
+
+
+def _save_weights(file, key, weights):
+    # Save a weights matrix, and the fingerprint of its grids, as ".npz".
+    weights = csr_array(weights)
+    np.savez(
+        file,
+        key=np.array(key),
+        data=weights.data,
+        indices=weights.indices,
+        indptr=weights.indptr,
+        shape=np.array(weights.shape),
+    )
+
+
+def _load_weights(file):
+    # Load a weights matrix, and the fingerprint of its grids.
+    with np.load(file, allow_pickle=False) as content:
+        weights = csr_array(
+            (content["data"], content["indices"], content["indptr"]),
+            shape=tuple(content["shape"]),
+        )
+        return str(content["key"]), weights
+
+
+# The default directory of AreaWeightsCache.set, which keeps the current one.
+_KEEP_DIRECTORY = object()
+
+
+class AreaWeightsCache:
+    """A cache of area-weighted regridding weights, shared by all regridders.
+
+    The weights are keyed by a fingerprint of the source and target grids, so
+    that regridding between the same pair of grids, whether with an
+    :class:`AreaWeightedRegridder` or with
+    :meth:`iris.cube.Cube.regrid` and :class:`iris.analysis.AreaWeighted`,
+    only calculates the weights once.
+
+    The most recently used `maxsize` weights are kept in memory.  If a
+    :attr:`directory` is set, the weights are also saved there, as ".npz"
+    files named by the fingerprint, so that they persist between sessions.
+    The global :data:`AREA_WEIGHTS_CACHE` is disabled by default, with a
+    `maxsize` of 0 and no :attr:`directory`, since the weights for large grids
+    may need a lot of memory.
+    The :attr:`hits` and :attr:`misses` count the lookups, to show how
+    effective the cache is.
+
+    Parameters
+    ----------
+    maxsize : int, default=8
+        The maximum number of weights matrices to keep in memory.
+    directory : str or Path, optional
+        A directory in which to save the weights.
+
+    """
+
+    def __init__(self, maxsize: int = 8, directory: str | Path | None = None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._weights: OrderedDict[str, csr_array] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups that found cached weights."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """Discard all the weights held in memory, and reset the statistics.
+
+        Any weights saved in the :attr:`directory` are kept.
+
+        """
+        with self._lock:
+            self._weights.clear()
+            self.hits = self.misses = 0
+
+    @contextmanager
+    def set(
+        self,
+        directory: str | Path | None = _KEEP_DIRECTORY,  # type: ignore[assignment]
+        maxsize: int | None = None,
+    ) -> Iterator[None]:
+        """Change the cache settings, within a context.
+
+        Parameters
+        ----------
+        directory : str or Path or None, optional
+            A directory in which to save and find weights, which is created if
+            necessary.  If None, no directory is used.
+            If not given, the current :attr:`directory` is kept.
+        maxsize : int, optional
+            The maximum number of weights matrices to keep in memory.
+            If not given, the current :attr:`maxsize` is kept.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            from iris.analysis import AREA_WEIGHTS_CACHE
+
+            with AREA_WEIGHTS_CACHE.set(maxsize=4):
+                results = [cube.regrid(target, scheme) for cube in cubes]
+
+            with AREA_WEIGHTS_CACHE.set("/scratch/regrid_weights"):
+                result = cube.regrid(target, scheme)
+
+        """
+        old_directory, old_maxsize = self.directory, self.maxsize
+        if directory is not _KEEP_DIRECTORY:
+            self.directory = directory
+        if maxsize is not None:
+            self.maxsize = maxsize
+        try:
+            yield
+        finally:
+            self.directory, self.maxsize = old_directory, old_maxsize
+
+    def _path(self, key: str) -> Path:
+        return Path(self.directory) / f"{key}.npz"
+
+    def _remember(self, key: str, weights: csr_array) -> None:
+        with self._lock:
+            self._weights[key] = weights
+            self._weights.move_to_end(key)
+            while len(self._weights) > self.maxsize:
+                self._weights.popitem(last=False)
+
+    def get(self, key: str) -> csr_array | None:
+        """Return the cached weights for a grid fingerprint, or None.
+
+        Weights not held in memory are looked for in the :attr:`directory`.
+
+        """
+        with self._lock:
+            weights = self._weights.get(key)
+            if weights is not None:
+                self._weights.move_to_end(key)
+        if weights is None and self.directory is not None:
+            try:
+                file_key, weights = _load_weights(self._path(key))
+            except (OSError, KeyError, ValueError):
+                weights = None
+            else:
+                if file_key == key:
+                    self._remember(key, weights)
+                else:
+                    weights = None
+        with self._lock:
+            if weights is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return weights
+
+    def put(self, key: str, weights: csr_array) -> None:
+        """Cache the weights for a grid fingerprint.
+
+        The weights are also saved in the :attr:`directory`, if set.  Failure
+        to save them is not an error.
+
+        """
+        self._remember(key, weights)
+        if self.directory is not None:
+            try:
+                directory = Path(self.directory)
+                directory.mkdir(parents=True, exist_ok=True)
+                # Write to a temporary file, then rename, so that a concurrent
+                # reader never sees a partially-written file.
+                fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as temp_file:
+                        _save_weights(temp_file, key, weights)
+                    os.replace(temp_path, self._path(key))
+                except BaseException:
+                    os.remove(temp_path)
+                    raise
+            except OSError:
+                pass
+
+    def load(self, filename: str | Path) -> str:
+        """Add weights saved by :meth:`AreaWeightedRegridder.save_weights`.
+
+        Later regridding between the same grids will use these weights, while
+        they are held in memory, i.e. if the :attr:`maxsize` is at least 1.
+
+        Parameters
+        ----------
+        filename : str or Path
+            The weights file.
+
+        Returns
+        -------
+        str
+            The fingerprint of the grids of the weights.
+
+        """
+        key, weights = _load_weights(filename)
+        self._remember(key, weights)
+        return key
+
+
+#: The cache of area-weighted regridding weights used by all regridding.
+#:  Disabled by default : enable with e.g. ``AREA_WEIGHTS_CACHE.set(maxsize=8)``.
+AREA_WEIGHTS_CACHE = AreaWeightsCache(maxsize=0)
+
+
 #
 # Support routines, all originally in iris.experimental.regrid
 #
@@ -349,14 +616,19 @@ def _regrid_area_weighted_rectilinear_src_and_grid__prepare(src_cube, grid_cube)
         weights_matrix = _combine_xy_weights(x_info, y_info, src_shape, tgt_shape)
         return weights_matrix
 
-    weights = _calculate_regrid_area_weighted_weights(
-        src_x_bounds,
-        src_y_bounds,
-        grid_x_bounds,
-        grid_y_bounds,
-        spherical,
-        modulus,
-    )
+    # The weights depend only on the grids, so are cached for reuse.
+    key = _weights_key(src_x, src_y, grid_x, grid_y)
+    weights = AREA_WEIGHTS_CACHE.get(key)
+    if weights is None:
+        weights = _calculate_regrid_area_weighted_weights(
+            src_x_bounds,
+            src_y_bounds,
+            grid_x_bounds,
+            grid_y_bounds,
+            spherical,
+            modulus,
+        )
+        AREA_WEIGHTS_CACHE.put(key, weights)
     return (
         src_x,
         src_y,
@@ -367,6 +639,7 @@ def _regrid_area_weighted_rectilinear_src_and_grid__prepare(src_cube, grid_cube)
         meshgrid_x,
         meshgrid_y,
         weights,
+        key,
     )
 
 
@@ -388,6 +661,7 @@ def _regrid_area_weighted_rectilinear_src_and_grid__perform(
         meshgrid_x,
         meshgrid_y,
         weights,
+        _,
     ) = regrid_info
 
     tgt_shape = (len(grid_y.points), len(grid_x.points))
@@ -620,12 +894,19 @@ def _standard_regrid(data, weights, tgt_shape, mdtol):
     data_shape = data.shape
     if ma.is_masked(data):
         unmasked = ~ma.getmaskarray(data)
+        slices = unmasked.reshape((-1,) + data_shape[-2:])
+        if np.all(slices == slices[0]):
+            # The mask is the same for every horizontal slice (e.g. a land-sea
+            # mask), so the normalisations are calculated for a single 2D
+            # slice, which is then broadcast.
+            unmasked = slices[0]
         # Calculate contribution from unmasked sources to each target point.
         weight_sums = _standard_regrid_no_masks(unmasked, weights, tgt_shape)
     else:
         # If there are no masked points then all contributions will be
-        # from unmasked sources, so we can skip this calculation
-        weight_sums = np.ones(data_shape[:-2] + tgt_shape)
+        # from unmasked sources, so we can skip this calculation, and
+        # broadcast a 2D slice.
+        weight_sums = np.ones(tgt_shape)
     mdtol = max(mdtol, 1e-8)
     tgt_mask = weight_sums > 1 - mdtol
     # If out of bounds sources are treated the same as masked sources this
@@ -646,8 +927,8 @@ def _standard_regrid(data, weights, tgt_shape, mdtol):
             # the groundwork for future work which will make out of bounds
             # behaviour switchable.
             oob_mask = inbound_sums > 1 - mdtol
-        # Broadcast the mask to the shape of the full array
-        oob_slice = ((np.newaxis,) * len(data.shape[:-2])) + np.s_[:, :]
+        # Broadcast the mask to the shape of the target mask.
+        oob_slice = ((np.newaxis,) * (tgt_mask.ndim - 2)) + np.s_[:, :]
         tgt_mask = tgt_mask * oob_mask[oob_slice]
 
     # Calculate normalisations.
@@ -668,7 +949,8 @@ def _standard_regrid(data, weights, tgt_shape, mdtol):
 
     # Perform regridding on unmasked data.
     result = _standard_regrid_no_masks(ma.filled(data, 0.0), weights, tgt_shape)
-    # Apply normalisations and masks to the regridded data.
+    # Apply normalisations and masks to the regridded data, broadcasting them
+    # if they were calculated for a single 2D slice.
     result = result * normalisations
     result = result.astype(dtype)
     return result
@@ -0,0 +1,333 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Vectorised group reductions, for :meth:`iris.cube.Cube.aggregated_by`.
+
+Rather than aggregating each group separately, the data is reordered so that
+each group is contiguous along the grouped dimension, and all the groups are
+then reduced together by a segmented ("reduceat") numpy kernel.  For lazy
+data, the kernel is applied to each dask block with
+:func:`dask.array.map_blocks`, after rechunking so that no group spans more
+than one block.
+
+Only the common aggregators are handled in this way : see :func:`supported`.
+
+"""
+
+import dask.array as da
+import numpy as np
+import numpy.ma as ma
+
+import iris._lazy_data as _lazy
+import iris.analysis
+
+# The keywords accepted by each kind of reduction.
+_KWARGS = {
+    "mean": {"weights", "returned", "mdtol"},
+    "sum": {"weights", "returned", "mdtol"},
+    "max": {"mdtol"},
+    "min": {"mdtol"},
+    "count": {"function", "mdtol"},
+}
+
+
+def _kind(aggregator):
+    kinds = {
+        id(iris.analysis.MEAN): "mean",
+        id(iris.analysis.SUM): "sum",
+        id(iris.analysis.MAX): "max",
+        id(iris.analysis.MIN): "min",
+        id(iris.analysis.COUNT): "count",
+    }
+    return kinds.get(id(aggregator))
+
+
+def supported(aggregator, data, **kwargs):
+    """Return whether an aggregation can use :func:`aggregate_groups`.
+
+    Parameters
+    ----------
+    aggregator : :class:`iris.analysis.Aggregator`
+        The aggregator : one of MEAN, SUM, MAX, MIN or COUNT.
+    data : array or dask array
+        The data to aggregate, which must be of boolean or numeric type.
+    **kwargs : dict, optional
+        The aggregation keywords.
+
+    """
+    kind = _kind(aggregator)
+    result = (
+        kind is not None
+        and not aggregator._kwargs
+        and set(kwargs) <= _KWARGS[kind]
+        and data.dtype.kind in "biuf"
+    )
+    if result and kind == "count":
+        result = callable(kwargs.get("function"))
+    return result
+
+
+def _result_dtypes(aggregator, dtype, weights_dtype, returned, masked, lazy):
+    # The dtypes of the aggregated data and weights, found by applying the
+    # aggregator to a single point of the same kind of array as the data.
+    if aggregator is iris.analysis.COUNT:
+        return np.sum(np.ones(1, dtype=bool)).dtype, None
+    sample = np.ones(1, dtype=dtype)
+    if masked:
+        sample = ma.masked_array(sample, mask=[False])
+    kwargs = {}
+    if weights_dtype is not None:
+        kwargs["weights"] = np.ones(1, dtype=weights_dtype)
+    func = aggregator.call_func
+    if lazy:
+        # N.B. the dtypes of the lazy results are known without computing them.
+        sample = da.from_array(sample, chunks=1)
+        if "weights" in kwargs:
+            kwargs["weights"] = da.from_array(kwargs["weights"], chunks=1)
+        func = aggregator.lazy_func
+    if returned:
+        kwargs["returned"] = True
+        result, weights = func(sample, axis=0, **kwargs)
+        return _dtype(result), _dtype(weights)
+    return _dtype(func(sample, axis=0, **kwargs)), None
+
+
+def _dtype(array):
+    return array.dtype if hasattr(array, "dtype") else np.asarray(array).dtype
+
+
+def _reduce(
+    data,
+    weights,
+    offsets,
+    *,
+    kind,
+    axis,
+    dtypes,
+    masked,
+    function=None,
+    mdtol=None,
+    returns="data",
+):
+    """Reduce each contiguous group of the data along an axis.
+
+    Parameters
+    ----------
+    data : array
+        The data, with each group occupying a contiguous range along ``axis``.
+    weights : array or None
+        Weights of the same shape as ``data``.
+    offsets : array of int
+        The start index of each group, beginning with 0.
+    kind : str
+        The reduction : "mean", "sum", "max", "min" or "count".
+    axis : int
+        The grouped axis.
+    dtypes : tuple of dtype
+        The dtypes of the reduced data, and of the reduced weights.
+    masked : bool
+        Whether to return masked arrays.
+    function : callable, optional
+        The condition for a "count".
+    mdtol : float, optional
+        Mask any result with a greater fraction of masked input points.
+    returns : str, default="data"
+        Whether to return the reduced "data", the reduced "weights", or
+        "both".
+
+    """
+    values = ma.getdata(data)
+    mask = ma.getmaskarray(data) if ma.is_masked(data) else None
+    lengths = np.diff(np.append(offsets, data.shape[axis]))
+    shape = [1] * data.ndim
+    shape[axis] = len(offsets)
+    if mask is None:
+        counts = lengths.reshape(shape)
+    else:
+        counts = np.add.reduceat(~mask, offsets, axis=axis, dtype=np.intp)
+
+    def total(array, dtype):
+        if mask is not None:
+            array = np.where(mask, 0, array)
+        return np.add.reduceat(array, offsets, axis=axis, dtype=dtype)
+
+    result_weights = None
+    if kind in ("mean", "sum"):
+        terms = values if weights is None else values * weights
+        result = total(terms, dtypes[0])
+        if kind == "mean":
+            if weights is None:
+                result_weights = counts.astype(dtypes[0])
+            else:
+                result_weights = total(weights, dtypes[0])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result = result / result_weights
+        elif returns != "data":
+            if weights is None:
+                result_weights = counts.astype(dtypes[1])
+            else:
+                result_weights = total(weights, dtypes[1])
+    elif kind in ("max", "min"):
+        if kind == "max":
+            ufunc, fill_value = np.maximum, ma.maximum_fill_value(values)
+        else:
+            ufunc, fill_value = np.minimum, ma.minimum_fill_value(values)
+        if mask is not None:
+            values = np.where(mask, fill_value, values)
+        result = ufunc.reduceat(values, offsets, axis=axis)
+    else:
+        hits = ma.filled(function(data), False)
+        result = total(hits, dtypes[0])
+
+    empty = np.broadcast_to(counts == 0, result.shape)
+    result_mask = empty
+    if kind == "mean":
+        result_mask = result_mask | (result_weights == 0)
+    if mdtol is not None and mask is not None:
+        fractions = (lengths.reshape(shape) - counts) / lengths.reshape(shape)
+        result_mask = result_mask | (fractions > mdtol)
+
+    result = result.astype(dtypes[0], copy=False)
+    if masked:
+        result = ma.masked_array(result, mask=np.array(result_mask))
+    if returns == "data":
+        return result
+    result_weights = np.array(
+        np.broadcast_to(result_weights, result.shape), dtype=dtypes[1]
+    )
+    if masked:
+        result_weights = ma.masked_array(result_weights, mask=np.array(empty))
+    if returns == "weights":
+        return result_weights
+    return result, result_weights
+
+
+def _aligned_chunks(lengths, target):
+    # Divide contiguous groups of the given lengths into chunks of about the
+    # target size, without splitting any group.  Return the chunk sizes, and
+    # the number of groups in each chunk.
+    chunks, counts = [], []
+    size = count = 0
+    for length in lengths:
+        if size and size + length > target:
+            chunks.append(size)
+            counts.append(count)
+            size = count = 0
+        size += length
+        count += 1
+    chunks.append(size)
+    counts.append(count)
+    return tuple(chunks), tuple(counts)
+
+
+def _block_reduce(*arrays, block_offsets, axis, block_id=None, **kwargs):
+    data = arrays[0]
+    weights = arrays[1] if len(arrays) > 1 else None
+    offsets = block_offsets[block_id[axis]]
+    return _reduce(data, weights, offsets, axis=axis, **kwargs)
+
+
+def aggregate_groups(aggregator, data, order, offsets, axis, weights=None, **kwargs):
+    """Aggregate each group of points along an axis of the data.
+
+    This is equivalent to applying the aggregator to each group separately,
+    and stacking the results, but is much faster for many groups.
+
+    Parameters
+    ----------
+    aggregator : :class:`iris.analysis.Aggregator`
+        The aggregator, for which :func:`supported` must be true.
+    data : array or dask array
+        The data to aggregate.
+    order : array of int
+        The indices along ``axis`` of the points, sorted by group.
+    offsets : array of int
+        The start of each group within ``order``.
+    axis : int
+        The grouped axis.
+    weights : array or dask array, optional
+        Weights of the same shape as ``data``.
+    **kwargs : dict, optional
+        The aggregation keywords, excluding "weights".
+
+    Returns
+    -------
+    array or dask array, or a pair of them if "returned" is set
+        The aggregated data, and optionally the aggregated weights, with one
+        point along ``axis`` for each group.
+
+    """
+    returned = kwargs.get("returned", False)
+    masked = _lazy.is_masked_data(data)
+    dtypes = _result_dtypes(
+        aggregator,
+        data.dtype,
+        None if weights is None else weights.dtype,
+        returned,
+        masked,
+        _lazy.is_lazy_data(data),
+    )
+    options = dict(
+        kind=_kind(aggregator),
+        axis=axis,
+        dtypes=dtypes,
+        masked=masked,
+        function=kwargs.get("function"),
+        mdtol=kwargs.get("mdtol"),
+    )
+
+    lengths = np.diff(np.append(offsets, len(order)))
+    if np.array_equal(order, np.arange(data.shape[axis])):
+        # The groups are already contiguous.
+        order = None
+    key = (slice(None),) * axis
+
+    if not _lazy.is_lazy_data(data):
+        if weights is not None:
+            weights = _lazy.as_concrete_data(weights)
+        if order is not None:
+            data = data[key + (order,)]
+            if weights is not None:
+                weights = weights[key + (order,)]
+        returns = "both" if returned else "data"
+        return _reduce(data, weights, offsets, returns=returns, **options)
+
+    arrays = [data]
+    if weights is not None:
+        if _lazy.is_lazy_data(weights):
+            weights = weights.rechunk(data.chunks)
+        else:
+            weights = da.from_array(weights, chunks=data.chunks)
+        arrays.append(weights)
+    if order is not None:
+        arrays = [array[key + (order,)] for array in arrays]
+    # Rechunk so that each group is within a single block.
+    chunks, counts = _aligned_chunks(lengths, max(data.chunks[axis]))
+    arrays = [array.rechunk({axis: chunks}) for array in arrays]
+    block_offsets = [
+        offsets[stop - count : stop] - offsets[stop - count]
+        for count, stop in zip(counts, np.cumsum(counts))
+    ]
+
+    out_chunks = list(arrays[0].chunks)
+    out_chunks[axis] = counts
+    outputs = ["data", "weights"] if returned else ["data"]
+    results = []
+    for returns, dtype in zip(outputs, dtypes):
+        meta = np.empty((0,) * data.ndim, dtype=dtype)
+        if options["masked"]:
+            meta = ma.masked_array(meta)
+        results.append(
+            da.map_blocks(
+                _block_reduce,
+                *arrays,
+                block_offsets=block_offsets,
+                chunks=tuple(out_chunks),
+                dtype=dtype,
+                meta=meta,
+                returns=returns,
+                **options,
+            )
+        )
+    return tuple(results) if returned else results[0]
@@ -0,0 +1,332 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Streaming rolling-window reductions, for :meth:`iris.cube.Cube.rolling_window`.
+
+Rather than aggregating over a windowed view of the data, which has an extra
+dimension of the window length, each window statistic is calculated in a
+single pass along the rolled dimension : sums, means and counts from running
+(cumulative) sums, and maxima and minima with the van Herk/Gil-Werman
+algorithm.  For lazy data, the calculation is applied to each dask block with
+:func:`dask.array.map_overlap`, overlapping each block with the start of the
+next.
+
+Only the common aggregators are handled in this way : see :func:`supported`.
+
+"""
+
+import dask.array as da
+from dask.array.overlap import ensure_minimum_chunksize
+import numpy as np
+import numpy.ma as ma
+
+import iris._lazy_data as _lazy
+from iris.analysis._group_reduce import _kind
+
+# The keywords accepted by each kind of reduction.
+_KWARGS = {
+    "mean": {"weights", "mdtol"},
+    "sum": {"weights", "mdtol"},
+    "max": {"mdtol"},
+    "min": {"mdtol"},
+    "count": {"function", "mdtol"},
+}
+
+
+def supported(aggregator, data, window, axis, **kwargs):
+    """Return whether a rolling window aggregation can use :func:`rolling_aggregate`.
+
+    Parameters
+    ----------
+    aggregator : :class:`iris.analysis.Aggregator`
+        The aggregator : one of MEAN, SUM, MAX, MIN or COUNT.
+    data : array or dask array
+        The data to aggregate, which must be of boolean or numeric type.
+    window : int
+        The window length.
+    axis : int
+        The rolled axis.
+    **kwargs : dict, optional
+        The aggregation keywords.
+
+    """
+    kind = _kind(aggregator)
+    result = (
+        kind is not None
+        and not aggregator._kwargs
+        and set(kwargs) <= _KWARGS[kind]
+        and data.dtype.kind in "biuf"
+        and 2 <= window <= data.shape[axis]
+    )
+    if result and kind == "count":
+        result = callable(kwargs.get("function"))
+    return result
+
+
+def _result_type(aggregator, data, weights, **kwargs):
+    # The dtype of the aggregated data, and whether it is masked, found by
+    # aggregating a single window, of one point, of the same kind of array as
+    # the data.  The result of masked data is always masked.
+    masked = _lazy.is_masked_data(data)
+    sample = np.ones((1, 1), dtype=data.dtype)
+    if masked:
+        sample = ma.masked_array(sample, mask=[[False]])
+    if weights is not None:
+        kwargs["weights"] = np.ones((1, 1), dtype=weights.dtype)
+    if _lazy.is_lazy_data(data):
+        # N.B. the type of the lazy result is known without computing it.
+        result = aggregator.lazy_aggregate(_lazy.as_lazy_data(sample), 1, **kwargs)
+        return result.dtype, masked or ma.isMaskedArray(result._meta)
+    result = aggregator.aggregate(sample, 1, **kwargs)
+    return result.dtype, masked or ma.isMaskedArray(result)
+
+
+def _window(array, start, length, axis):
+    # Take a range of points along an axis.
+    key = [slice(None)] * array.ndim
+    key[axis] = slice(start, start + length)
+    return array[tuple(key)]
+
+
+def _running_sum(array, window, axis, dtype, weights=None):
+    # The sum over each window along an axis.
+    length = array.shape[axis] - window + 1
+    if weights is not None:
+        # Accumulate the weighted windows, one offset at a time.
+        result = np.zeros(_window(array, 0, length, axis).shape, dtype=dtype)
+        for offset, weight in enumerate(weights):
+            result += weight * _window(array, offset, length, axis)
+        return result
+    if dtype.kind in "fc":
+        # Accumulate floating-point values in double precision.
+        accumulator_dtype = np.promote_types(dtype, np.float64)
+    else:
+        accumulator_dtype = dtype
+    finite = array.dtype.kind not in "fc" or np.all(np.isfinite(array))
+    if not finite:
+        special = {
+            "nan": np.isnan(array),
+            "posinf": np.isposinf(array),
+            "neginf": np.isneginf(array),
+        }
+        array = np.where(np.isfinite(array), array, 0)
+    shape = list(array.shape)
+    shape[axis] = 1
+    totals = np.concatenate(
+        [
+            np.zeros(shape, dtype=accumulator_dtype),
+            np.cumsum(array, axis=axis, dtype=accumulator_dtype),
+        ],
+        axis=axis,
+    )
+    result = _window(totals, window, length, axis) - _window(totals, 0, length, axis)
+    if not finite:
+        # Restore the non-finite sums, as they would be in a direct sum.
+        counts = {
+            name: _running_sum(flags, window, axis, np.dtype(np.intp))
+            for name, flags in special.items()
+        }
+        result = np.where(counts["posinf"] > 0, np.inf, result)
+        result = np.where(counts["neginf"] > 0, -np.inf, result)
+        invalid = (counts["nan"] > 0) | (
+            (counts["posinf"] > 0) & (counts["neginf"] > 0)
+        )
+        result = np.where(invalid, np.nan, result)
+    return result.astype(dtype, copy=False)
+
+
+def _running_extreme(ufunc, array, window, axis, fill_value):
+    # The maximum or minimum over each window along an axis, by the van
+    # Herk/Gil-Werman algorithm : each window spans at most two consecutive
+    # window-length blocks, so is the combination of a running extreme
+    # backwards through the first block and one forwards through the second.
+    array = np.moveaxis(array, axis, 0)
+    size = array.shape[0]
+    length = size - window + 1
+    n_blocks = -(-size // window)
+    padding = np.full(
+        (n_blocks * window - size,) + array.shape[1:], fill_value, dtype=array.dtype
+    )
+    blocks = np.concatenate([array, padding]).reshape(
+        (n_blocks, window) + array.shape[1:]
+    )
+    forwards = ufunc.accumulate(blocks, axis=1).reshape((-1,) + array.shape[1:])
+    backwards = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1]
+    backwards = backwards.reshape((-1,) + array.shape[1:])
+    result = ufunc(backwards[:length], forwards[window - 1 : window - 1 + length])
+    return np.moveaxis(result, 0, axis)
+
+
+def _rolling_reduce(
+    data,
+    window,
+    *,
+    kind,
+    axis,
+    dtype,
+    masked,
+    weights=None,
+    function=None,
+    mdtol=None,
+):
+    """Reduce each window of points along an axis.
+
+    Parameters
+    ----------
+    data : array
+        The data.
+    window : int
+        The window length.
+    kind : str
+        The reduction : "mean", "sum", "max", "min" or "count".
+    axis : int
+        The rolled axis.
+    dtype : dtype
+        The dtype of the result.
+    masked : bool
+        Whether to return a masked array.
+    weights : array, optional
+        Weights for each point in a window.
+    function : callable, optional
+        The condition for a "count".
+    mdtol : float, optional
+        Mask any result with a greater fraction of masked input points.
+
+    Returns
+    -------
+    array
+        The result for each window, which is ``window - 1`` points shorter
+        than the data along ``axis``.
+
+    """
+    values = ma.getdata(data)
+    mask = ma.getmaskarray(data) if ma.is_masked(data) else None
+    if mask is None:
+        counts = window
+    else:
+        counts = _running_sum(~mask, window, axis, np.dtype(np.intp))
+
+    def window_sum(array, dtype, weights=None):
+        if mask is not None:
+            array = np.where(mask, 0, array)
+        return _running_sum(array, window, axis, np.dtype(dtype), weights=weights)
+
+    if kind == "sum":
+        result = window_sum(values, dtype, weights=weights)
+        result_mask = counts == 0
+    elif kind == "mean":
+        if weights is None:
+            totals = window_sum(values, np.promote_types(dtype, np.float64))
+            divisors = counts
+        else:
+            totals = window_sum(values, np.float64, weights=weights)
+            divisors = window_sum(np.ones_like(values), np.float64, weights=weights)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = totals / divisors
+        result_mask = (counts == 0) | (divisors == 0)
+    elif kind in ("max", "min"):
+        if kind == "max":
+            ufunc, fill_value = np.maximum, ma.maximum_fill_value(values)
+        else:
+            ufunc, fill_value = np.minimum, ma.minimum_fill_value(values)
+        if mask is not None:
+            values = np.where(mask, fill_value, values)
+        result = _running_extreme(ufunc, values, window, axis, fill_value)
+        result_mask = counts == 0
+    else:
+        hits = ma.filled(function(data), False)
+        result = window_sum(hits, dtype)
+        result_mask = counts == 0
+
+    if mdtol is not None and mask is not None:
+        result_mask = result_mask | ((window - counts) / window > mdtol)
+    result = result.astype(dtype, copy=False)
+    if masked:
+        result_mask = np.broadcast_to(result_mask, result.shape)
+        result = ma.masked_array(result, mask=np.array(result_mask))
+    return result
+
+
+def _block_reduce(block, *, window, axis, masked, block_info=None, **kwargs):
+    # Reduce the windows starting in a block, which is overlapped with the
+    # start of the next one.  The windows which run beyond the end of the
+    # data, in the last block, are padded, and later removed.
+    size = block_info[None]["chunk-shape"][axis]
+    dtype = block_info[None]["dtype"]
+    if block.shape[axis] >= window:
+        result = _rolling_reduce(
+            block, window, axis=axis, dtype=dtype, masked=masked, **kwargs
+        )
+    else:
+        result = _window(block, 0, 0, axis).astype(dtype)
+    shape = list(result.shape)
+    shape[axis] = size - result.shape[axis]
+    padding = np.zeros(shape, dtype=result.dtype)
+    if masked:
+        return ma.concatenate([result, ma.masked_array(padding, mask=True)], axis)
+    return np.concatenate([ma.getdata(result), padding], axis)
+
+
+def rolling_aggregate(aggregator, data, window, axis, weights=None, **kwargs):
+    """Aggregate each window of points along an axis of the data.
+
+    This is equivalent to aggregating over a rolling window view of the data,
+    from :func:`iris.util.rolling_window`, but needs no more memory than the
+    data itself.
+
+    Parameters
+    ----------
+    aggregator : :class:`iris.analysis.Aggregator`
+        The aggregator, for which :func:`supported` must be true.
+    data : array or dask array
+        The data to aggregate.
+    window : int
+        The window length.
+    axis : int
+        The rolled axis.
+    weights : array, optional
+        A 1-D array of weights for the points in each window.
+    **kwargs : dict, optional
+        The aggregation keywords, excluding "weights".
+
+    Returns
+    -------
+    array or dask array
+        The aggregated data, with one point along ``axis`` for each window.
+
+    """
+    if weights is not None:
+        weights = np.asarray(_lazy.as_concrete_data(weights))
+    dtype, masked = _result_type(aggregator, data, weights, **kwargs)
+    options = dict(
+        kind=_kind(aggregator),
+        axis=axis,
+        masked=masked,
+        weights=weights,
+        function=kwargs.get("function"),
+        mdtol=kwargs.get("mdtol"),
+    )
+    if not _lazy.is_lazy_data(data):
+        return _rolling_reduce(data, window, dtype=dtype, **options)
+
+    # Each block must be long enough to supply the overlap for the previous
+    # one.
+    chunks = ensure_minimum_chunksize(window - 1, data.chunks[axis])
+    data = data.rechunk({axis: chunks})
+    meta = np.empty((0,) * data.ndim, dtype=dtype)
+    if options["masked"]:
+        meta = ma.masked_array(meta)
+    result = da.map_overlap(
+        _block_reduce,
+        data,
+        depth={axis: (0, window - 1)},
+        boundary="none",
+        trim=False,
+        chunks=data.chunks,
+        dtype=dtype,
+        meta=meta,
+        window=window,
+        **options,
+    )
+    return _window(result, 0, data.shape[axis] - window + 1, axis)
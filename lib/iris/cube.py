@@ -34,7 +34,7 @@ from iris._data_manager import DataManager
 import iris._lazy_data as _lazy
 import iris._merge
 import iris.analysis
-from iris.analysis import _Weights
+from iris.analysis import _group_reduce, _rolling, _Weights
 from iris.analysis.cartography import wrap_lons
 import iris.analysis.maths
 import iris.aux_factory
@@ -409,20 +409,24 @@ class CubeList(list):
 
         """
         # Register each of our cubes with its appropriate ProtoCube.
+        # Only the ProtoCubes with the same merge key as a cube can accept it.
         proto_cubes_by_name = {}
+        proto_cubes_by_key = {}
         for c in self:
-            name = c.standard_name
-            proto_cubes = proto_cubes_by_name.setdefault(name, [])
+            source = iris._merge.ProtoCube.source_cube(c)
+            proto_cubes = proto_cubes_by_key.setdefault(source.key, [])
             proto_cube = None
 
             for target_proto_cube in proto_cubes:
-                if target_proto_cube.register(c):
+                if target_proto_cube.register(c, source=source):
                     proto_cube = target_proto_cube
                     break
 
             if proto_cube is None:
-                proto_cube = iris._merge.ProtoCube(c)
+                proto_cube = iris._merge.ProtoCube(c, source=source)
                 proto_cubes.append(proto_cube)
+                name = c.standard_name
+                proto_cubes_by_name.setdefault(name, []).append(proto_cube)
 
         # Emulate Python 2 behaviour.
         def _none_sort(item):
@@ -4657,44 +4661,66 @@ x            -              -
             input_data = self.data
             agg_method = aggregator.aggregate
 
-        # Create data and weights slices.
-        front_slice = (slice(None),) * dimension_to_groupby
-        back_slice = (slice(None),) * (len(data_shape) - dimension_to_groupby - 1)
+        if _group_reduce.supported(aggregator, input_data, **kwargs):
+            # Reduce all the groups together, for the common aggregators.
+            agg_kwargs = dict(kwargs)
+            agg_kwargs.pop("weights", None)
+            _, order, offsets = groupby.group_codes()
+            result = _group_reduce.aggregate_groups(
+                aggregator,
+                input_data,
+                order,
+                offsets,
+                dimension_to_groupby,
+                weights=weights,
+                **agg_kwargs,
+            )
+            if return_weights:
+                aggregateby_data, aggregateby_weights = result
+            else:
+                aggregateby_data, aggregateby_weights = result, None
+        else:
+            # Create data and weights slices.
+            front_slice = (slice(None),) * dimension_to_groupby
+            back_slice = (slice(None),) * (len(data_shape) - dimension_to_groupby - 1)
+
+            groupby_subarrs = (
+                iris.util._slice_data_with_keys(
+                    input_data, front_slice + (groupby_slice,) + back_slice
+                )[1]
+                for groupby_slice in groupby.group()
+            )
 
-        groupby_subarrs = (
-            iris.util._slice_data_with_keys(
-                input_data, front_slice + (groupby_slice,) + back_slice
-            )[1]
-            for groupby_slice in groupby.group()
-        )
+            if weights is not None:
+                groupby_subweights = (
+                    weights[front_slice + (groupby_slice,) + back_slice]
+                    for groupby_slice in groupby.group()
+                )
+            else:
+                groupby_subweights = (None for _ in range(len(groupby)))
 
-        if weights is not None:
-            groupby_subweights = (
-                weights[front_slice + (groupby_slice,) + back_slice]
-                for groupby_slice in groupby.group()
+            # Aggregate data slices.
+            agg = iris.analysis.create_weighted_aggregator_fn(
+                agg_method, axis=dimension_to_groupby, **kwargs
             )
-        else:
-            groupby_subweights = (None for _ in range(len(groupby)))
+            result = tuple(map(agg, groupby_subarrs, groupby_subweights))
+
+            # If weights are returned, "result" is a list of tuples (each tuple
+            # contains two elements; the first is the aggregated data, the
+            # second is the aggregated weights). Convert these to two lists
+            # (one for the aggregated data and one for the aggregated weights)
+            # before combining the different slices.
+            if return_weights:
+                data_result, weights_result = list(zip(*result))
+                aggregateby_weights = _lazy.stack(
+                    weights_result, axis=dimension_to_groupby
+                )
+            else:
+                data_result = result
+                aggregateby_weights = None
 
-        # Aggregate data slices.
-        agg = iris.analysis.create_weighted_aggregator_fn(
-            agg_method, axis=dimension_to_groupby, **kwargs
-        )
-        result = tuple(map(agg, groupby_subarrs, groupby_subweights))
-
-        # If weights are returned, "result" is a list of tuples (each tuple
-        # contains two elements; the first is the aggregated data, the
-        # second is the aggregated weights). Convert these to two lists
-        # (one for the aggregated data and one for the aggregated weights)
-        # before combining the different slices.
-        if return_weights:
-            data_result, weights_result = list(zip(*result))
-            aggregateby_weights = _lazy.stack(weights_result, axis=dimension_to_groupby)
-        else:
-            data_result = result
-            aggregateby_weights = None
+            aggregateby_data = _lazy.stack(data_result, axis=dimension_to_groupby)
 
-        aggregateby_data = _lazy.stack(data_result, axis=dimension_to_groupby)
         # Ensure plain ndarray is output if plain ndarray was input.
         if ma.isMaskedArray(aggregateby_data) and not ma.isMaskedArray(input_data):
             aggregateby_data = ma.getdata(aggregateby_data)
@@ -4883,13 +4909,6 @@ x            -               -
         key[dimension] = slice(None, self.shape[dimension] - window + 1)
         new_cube = new_cube[tuple(key)]
 
-        # take a view of the original data using the rolling_window function
-        # this will add an extra dimension to the data at dimension + 1 which
-        # represents the rolled window (i.e. will have a length of window)
-        rolling_window_data = iris.util.rolling_window(
-            self.core_data(), window=window, axis=dimension
-        )
-
         # now update all of the coordinates to reflect the aggregation
         for coord_ in self.coords(dimensions=dimension):
             if coord_.has_bounds():
@@ -4937,6 +4956,7 @@ x            -               -
         )
         # and perform the data transformation, generating weights first if
         # needed
+        weights = None
         if isinstance(
             aggregator, iris.analysis.WeightedAggregator
         ) and aggregator.uses_weighting(**kwargs):
@@ -4948,16 +4968,44 @@ x            -               -
                         "must be a 1d array with the same length "
                         "as the window."
                     )
-                kwargs = dict(kwargs)
-                kwargs["weights"] = iris.util.broadcast_to_shape(
+
+        if _rolling.supported(
+            aggregator, self.core_data(), window, dimension, **kwargs
+        ):
+            # Calculate the windows in a single pass, for the common
+            # aggregators.
+            agg_kwargs = dict(kwargs)
+            agg_kwargs.pop("weights", None)
+            data_result = _rolling.rolling_aggregate(
+                aggregator,
+                self.core_data(),
+                window,
+                dimension,
+                weights=weights,
+                **agg_kwargs,
+            )
+        else:
+            # take a view of the original data using the rolling_window
+            # function this will add an extra dimension to the data at
+            # dimension + 1 which represents the rolled window (i.e. will have
+            # a length of window)
+            rolling_window_data = iris.util.rolling_window(
+                self.core_data(), window=window, axis=dimension
+            )
+            agg_kwargs = kwargs
+            if weights is not None:
+                agg_kwargs = dict(kwargs)
+                agg_kwargs["weights"] = iris.util.broadcast_to_shape(
                     weights, rolling_window_data.shape, (dimension + 1,)
                 )
 
-        if aggregator.lazy_func is not None and self.has_lazy_data():
-            agg_method = aggregator.lazy_aggregate
-        else:
-            agg_method = aggregator.aggregate
-        data_result = agg_method(rolling_window_data, axis=dimension + 1, **kwargs)
+            if aggregator.lazy_func is not None and self.has_lazy_data():
+                agg_method = aggregator.lazy_aggregate
+            else:
+                agg_method = aggregator.aggregate
+            data_result = agg_method(
+                rolling_window_data, axis=dimension + 1, **agg_kwargs
+            )
         result = aggregator.post_process(new_cube, data_result, [coord], **kwargs)
         return result
 
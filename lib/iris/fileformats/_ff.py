@@ -14,6 +14,7 @@ from iris.exceptions import (
     NotYetImplementedError,
 )
 from iris.fileformats._ff_cross_references import STASH_TRANS
+from iris.fileformats._header_index import HEADER_INDEX
 
 from ..warnings import IrisDefaultingWarning, IrisLoadWarning
 from . import pp
@@ -669,14 +670,75 @@ class FF2PP:
 
             yield field
 
-    def _extract_field(self):
+    def _lookup_headers(self, ff_file):
+        """Return an iterator of the valid PP headers in the FF LOOKUP table.
+
+        The headers are taken from the header index of the file, if there is a
+        valid one.  Otherwise the LOOKUP table is read, and indexed.
+
+        """
+        index_kind = "ff{}".format(self._word_depth)
+        index = HEADER_INDEX.lookup(self._filename, index_kind)
+        if index is not None:
+            for header_longs, header_floats in zip(index["longs"], index["floats"]):
+                yield tuple(header_longs) + tuple(header_floats)
+            return
+
+        recording = HEADER_INDEX.enabled
+        all_longs, all_floats = [], []
+
         # FF table pointer initialisation based on FF LOOKUP table
         # configuration.
-
         lookup_table = self._ff_header.lookup_table
         table_index, table_entry_depth, table_count = lookup_table
         table_offset = (table_index - 1) * self._word_depth  # in bytes
         table_entry_depth = table_entry_depth * self._word_depth  # in bytes
+        ff_file_seek = ff_file.seek
+
+        # Process each FF LOOKUP table entry.
+        while table_count:
+            table_count -= 1
+            # Move file pointer to the start of the current FF LOOKUP
+            # table entry.
+            ff_file_seek(table_offset, os.SEEK_SET)
+
+            # Read the current PP header entry from the FF LOOKUP table.
+            header_longs = _parse_binary_stream(
+                ff_file,
+                dtype=">i{0}".format(self._word_depth),
+                count=pp.NUM_LONG_HEADERS,
+            )
+            # Check whether the current FF LOOKUP table entry is valid.
+            if header_longs[0] == _FF_LOOKUP_TABLE_TERMINATE:
+                # There are no more FF LOOKUP table entries to read.
+                break
+            header_floats = _parse_binary_stream(
+                ff_file,
+                dtype=">f{0}".format(self._word_depth),
+                count=pp.NUM_FLOAT_HEADERS,
+            )
+            if recording:
+                all_longs.append(header_longs)
+                all_floats.append(header_floats)
+
+            # Calculate next FF LOOKUP table entry.
+            table_offset += table_entry_depth
+
+            yield tuple(header_longs) + tuple(header_floats)
+
+        if recording:
+            HEADER_INDEX.store(
+                self._filename,
+                index_kind,
+                longs=np.array(
+                    all_longs, dtype="=i{}".format(self._word_depth)
+                ).reshape(-1, pp.NUM_LONG_HEADERS),
+                floats=np.array(
+                    all_floats, dtype="=f{}".format(self._word_depth)
+                ).reshape(-1, pp.NUM_FLOAT_HEADERS),
+            )
+
+    def _extract_field(self):
         # Open the FF for processing.
         with open(self._ff_header.ff_filename, "rb") as ff_file:
             ff_file_seek = ff_file.seek
@@ -686,32 +748,7 @@ class FF2PP:
             grid = self._ff_header.grid()
 
             # Process each FF LOOKUP table entry.
-            while table_count:
-                table_count -= 1
-                # Move file pointer to the start of the current FF LOOKUP
-                # table entry.
-                ff_file_seek(table_offset, os.SEEK_SET)
-
-                # Read the current PP header entry from the FF LOOKUP table.
-                header_longs = _parse_binary_stream(
-                    ff_file,
-                    dtype=">i{0}".format(self._word_depth),
-                    count=pp.NUM_LONG_HEADERS,
-                )
-                # Check whether the current FF LOOKUP table entry is valid.
-                if header_longs[0] == _FF_LOOKUP_TABLE_TERMINATE:
-                    # There are no more FF LOOKUP table entries to read.
-                    break
-                header_floats = _parse_binary_stream(
-                    ff_file,
-                    dtype=">f{0}".format(self._word_depth),
-                    count=pp.NUM_FLOAT_HEADERS,
-                )
-                header = tuple(header_longs) + tuple(header_floats)
-
-                # Calculate next FF LOOKUP table entry.
-                table_offset += table_entry_depth
-
+            for header in self._lookup_headers(ff_file):
                 # Construct a PPField object and populate using the header_data
                 # read from the current FF LOOKUP table.
                 # (The PPField sub-class will depend on the header release
@@ -0,0 +1,269 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Persistent indices of the field headers in PP and FieldsFiles.
+
+Loading a PP file or FieldsFile must first scan the headers of all its fields.
+For files which are loaded repeatedly, this module can record the decoded
+headers and data locations of each file in an "index" file, so that later
+loads can skip the header scan entirely.
+
+Indexing is controlled by the single instance of :class:`HeaderIndex`, the
+:data:`HEADER_INDEX` object, and is disabled by default.
+
+"""
+
+from contextlib import contextmanager
+import hashlib
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Iterable, Iterator
+
+import numpy as np
+
+#: Version of the index file content : indices of any other version are ignored.
+INDEX_VERSION = 2
+
+# Suffix of index filenames.
+_INDEX_SUFFIX = ".iris-hdr.npz"
+
+
+class HeaderIndex:
+    """Control the use of persistent field-header indices for PP and FieldsFiles.
+
+    Indices are stored in a given directory, with one index file per indexed
+    data file.  Each is keyed by the real path of the data file, and records
+    the file size and modification time : an index is only used if these still
+    match, otherwise the file is scanned as normal and the index is re-written.
+
+    Index files can be deleted at any time.  :meth:`prune` removes any which
+    are out of date, or whose data files no longer exist.
+
+    """
+
+    def __init__(self, directory: str | Path | None = None):
+        #: The directory where indices are stored. If ``None``, indexing is off.
+        self.directory = directory
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} directory={self.directory!r}>"
+
+    @property
+    def enabled(self) -> bool:
+        """Whether indices are being used."""
+        return self.directory is not None
+
+    def reset_stats(self):
+        """Zero the counts of index "hits", "misses" and "writes"."""
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counts of index "hits", "misses" (i.e. header scans) and "writes"."""
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes}
+
+    @contextmanager
+    def set(self, directory: str | Path | None) -> Iterator[None]:
+        """Use header indices stored in the given directory, within a context.
+
+        Parameters
+        ----------
+        directory : str or Path or None
+            The index directory, which is created if necessary.
+            If ``None``, indexing is disabled.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            from iris.fileformats.um import HEADER_INDEX
+
+            with HEADER_INDEX.set("/scratch/my_indices"):
+                cubes = iris.load(archive_files)
+
+        """
+        old_directory = self.directory
+        self.directory = directory
+        try:
+            yield
+        finally:
+            self.directory = old_directory
+
+    def _index_path(self, real_path: str, kind: str) -> Path:
+        key = hashlib.sha1(f"{kind}:{real_path}".encode()).hexdigest()
+        return Path(self.directory) / f"{key}{_INDEX_SUFFIX}"
+
+    @staticmethod
+    def _file_signature(real_path: str) -> tuple[int, int]:
+        stat = os.stat(real_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def lookup(self, filename: str, kind: str) -> dict[str, np.ndarray] | None:
+        """Return the valid index arrays for a file, or ``None``.
+
+        Parameters
+        ----------
+        filename : str
+            The data file.
+        kind : str
+            Identifies the type of index, i.e. how the file is being read.
+
+        """
+        if not self.enabled:
+            return None
+        try:
+            real_path = os.path.realpath(filename)
+            signature = self._file_signature(real_path)
+            with np.load(self._index_path(real_path, kind)) as npz:
+                index = {name: npz[name] for name in npz.files}
+            if (
+                int(index.pop("version")) != INDEX_VERSION
+                or str(index.pop("path")) != real_path
+                or str(index.pop("kind")) != kind
+                or (int(index.pop("size")), int(index.pop("mtime_ns"))) != signature
+            ):
+                index = None
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            # No index, an unreadable or foreign one, or not a local file.
+            index = None
+        with self._lock:
+            if index is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return index
+
+    def store(self, filename: str, kind: str, **arrays: np.ndarray) -> None:
+        """Record the index arrays for a file.
+
+        Does nothing if indexing is disabled.  Failure to write an index is
+        not an error.
+
+        """
+        if not self.enabled:
+            return
+        try:
+            real_path = os.path.realpath(filename)
+            size, mtime_ns = self._file_signature(real_path)
+            directory = Path(self.directory)
+            directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file, then rename, so that a concurrent
+            # reader never sees a partially-written index.
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp.npz")
+            try:
+                with os.fdopen(fd, "wb") as temp_file:
+                    np.savez(
+                        temp_file,
+                        version=INDEX_VERSION,
+                        path=real_path,
+                        kind=kind,
+                        size=size,
+                        mtime_ns=mtime_ns,
+                        **arrays,
+                    )
+                os.replace(temp_path, self._index_path(real_path, kind))
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            return
+        with self._lock:
+            self.writes += 1
+
+    def build(self, filenames: Iterable[str | Path]) -> list[str]:
+        """Create (or refresh) the indices of a set of PP or FieldsFiles.
+
+        Parameters
+        ----------
+        filenames : iterable of str or Path
+            The files to index.  Any which are not identified as PP or
+            FieldsFiles are skipped.
+
+        Returns
+        -------
+        list of str
+            The files that were indexed.
+
+        """
+        import iris.fileformats
+        from iris.fileformats import _ff, pp, um
+
+        # Index "kind", and a generator which scans (and indexes) a file, for
+        #  each of the PP and FieldsFile load handlers.
+        readers = {
+            pp.load_cubes: ("pp>", lambda path: pp._field_gen(path, False)),
+            pp.load_cubes_little_endian: (
+                "pp<",
+                lambda path: pp._field_gen(path, False, little_ended=True),
+            ),
+            um.load_cubes: (
+                f"ff{_ff.DEFAULT_FF_WORD_DEPTH}",
+                lambda path: _ff.FF2PP(path)._extract_field(),
+            ),
+            um.load_cubes_32bit_ieee: (
+                "ff4",
+                lambda path: _ff.FF2PP(path, word_depth=4)._extract_field(),
+            ),
+        }
+        if not self.enabled:
+            msg = "Cannot build header indices : no index directory is set."
+            raise ValueError(msg)
+        indexed = []
+        for filename in filenames:
+            filename = str(filename)
+            with open(filename, "rb") as fh:
+                try:
+                    spec = iris.fileformats.FORMAT_AGENT.get_spec(
+                        os.path.basename(filename), fh
+                    )
+                except (ValueError, EOFError):
+                    # Unrecognised file type.
+                    continue
+            kind, reader = readers.get(spec.handler, (None, None))
+            if reader is not None:
+                # Remove any existing index, so that the file is re-scanned.
+                real_path = os.path.realpath(filename)
+                self._index_path(real_path, kind).unlink(missing_ok=True)
+                for _ in reader(filename):
+                    pass
+                indexed.append(filename)
+        return indexed
+
+    def prune(self) -> list[Path]:
+        """Delete any indices which are invalid, or whose data file is gone.
+
+        Returns
+        -------
+        list of Path
+            The index files which were removed.
+
+        """
+        removed = []
+        if self.enabled and Path(self.directory).is_dir():
+            for path in Path(self.directory).glob(f"*{_INDEX_SUFFIX}"):
+                try:
+                    with np.load(path) as npz:
+                        real_path = str(npz["path"])
+                        valid = (
+                            int(npz["version"]) == INDEX_VERSION
+                            and path == self._index_path(real_path, str(npz["kind"]))
+                            and (int(npz["size"]), int(npz["mtime_ns"]))
+                            == self._file_signature(real_path)
+                        )
+                except (OSError, ValueError, KeyError):
+                    valid = False
+                if not valid:
+                    path.unlink(missing_ok=True)
+                    removed.append(path)
+        return removed
+
+
+#: The control for header indexing of PP and FieldsFiles.
+HEADER_INDEX = HeaderIndex()
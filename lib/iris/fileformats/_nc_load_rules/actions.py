@@ -39,7 +39,7 @@ longer useful, this can be considerably simplified.
 
 """
 
-from functools import wraps
+from functools import partial, wraps
 import warnings
 
 from iris.config import get_logger
@@ -199,7 +199,9 @@ def action_provides_grid_mapping(engine, gridmapping_fact):
             rule_name += f" --(FAILED check {checker.__name__})"
 
     if succeed:
-        coordinate_system = builder(engine, cf_var)
+        coordinate_system = hh.shared_part(
+            engine, ("coordinate_system", var_name), partial(builder, engine, cf_var)
+        )
         engine.cube_parts["coordinate_system"] = coordinate_system
 
         # Check there is not an existing one.
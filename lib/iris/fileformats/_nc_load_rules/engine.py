@@ -19,6 +19,8 @@ used in :meth:`iris.fileformats.netcdf._actions_activation_stats`.
 
 """
 
+from typing import Any
+
 from iris.coords import _DimensionalMetadata
 from iris.cube import Cube
 from iris.fileformats.cf import CFDataVariable
@@ -82,9 +84,13 @@ class Engine:
     cube: Cube | None
     cube_parts: dict[str, list[tuple[_DimensionalMetadata, str]]] | None
     filename: str | None
+    shared_parts: dict[tuple, Any]
 
     def __init__(self):
         """Init new engine."""
+        # Cube components already built from the current file : these persist
+        # between cubes, unlike the facts.
+        self.shared_parts = {}
         self.reset()
 
     def reset(self):
@@ -17,6 +17,7 @@ build routines, and which it does not use.
 from __future__ import annotations
 
 import contextlib
+import copy
 from functools import partial
 import re
 from typing import TYPE_CHECKING, Any, List, Optional
@@ -37,7 +38,7 @@ from iris.cube import Cube
 import iris.exceptions
 import iris.fileformats.cf as cf
 import iris.fileformats.netcdf
-from iris.fileformats.netcdf.loader import _get_cf_var_data
+from iris.fileformats.netcdf.loader import CHUNK_CONTROL, _get_cf_var_data
 from iris.loading import LOAD_PROBLEMS, LoadProblems
 import iris.std_names
 import iris.util
@@ -552,6 +553,42 @@ def _add_or_capture(
     return load_problems_entry
 
 
+################################################################################
+def shared_part(engine, key, build_func):
+    """Build a file component, or copy the one already built for another cube.
+
+    Coordinate systems, coordinates, cell measures and ancillary variables are
+    typically shared by many of the data variables of a file, so each is built
+    only once per file, and every cube gets its own copy.
+
+    Parameters
+    ----------
+    engine : :class:`iris.fileformats._nc_load_rules.engine.Engine`
+        The engine loading the file, whose ``shared_parts`` dictionary records
+        the components already built.
+    key : tuple or None
+        Identifies the component within the file.  If ``None``, the component
+        is specific to the cube being loaded, and is always built afresh.
+    build_func : callable
+        A function with no arguments, which builds the component.
+
+    """
+    if key is None:
+        return build_func()
+    if key not in engine.shared_parts:
+        engine.shared_parts[key] = build_func()
+    return copy.deepcopy(engine.shared_parts[key])
+
+
+def _chunking_key(cf_var):
+    # The chunk settings which apply to the lazy content of a cf variable, as
+    # part of a shared_part key.
+    dim_chunks = CHUNK_CONTROL.var_dim_chunksizes.get(
+        cf_var.cf_name
+    ) or CHUNK_CONTROL.var_dim_chunksizes.get("*", {})
+    return CHUNK_CONTROL.mode, tuple(sorted(dim_chunks.items()))
+
+
 ################################################################################
 def build_raw_cube(cf_var: cf.CFVariable, filename: str) -> Cube:
     """Build the most basic Cube possible - used as a 'last resort' fallback."""
@@ -1419,13 +1456,23 @@ def build_and_add_dimension_coordinate(
 ):
     assert engine.filename is not None
 
+    # The coord-system, if any, is the one built from the cube's grid-mapping.
+    grid_mapping_facts = []
+    if coord_system is not None:
+        grid_mapping_facts = engine.fact_list("grid_mapping")
+    key = ("coordinate", cf_coord_var.cf_name, coord_name, tuple(grid_mapping_facts))
     _ = _add_or_capture(
         build_func=partial(
-            _build_dimension_coordinate,
-            engine.filename,
-            cf_coord_var,
-            coord_name,
-            coord_system,
+            shared_part,
+            engine,
+            key,
+            partial(
+                _build_dimension_coordinate,
+                engine.filename,
+                cf_coord_var,
+                coord_name,
+                coord_system,
+            ),
         ),
         add_method=partial(_add_dimension_coordinate, engine, cf_coord_var),
         filename=engine.filename,
@@ -1440,34 +1487,69 @@ def build_auxiliary_coordinate(
     """Create an auxiliary coordinate (AuxCoord) and add it to the cube."""
     cf_var = engine.cf_var
     cube = engine.cube
-    attributes = {}
 
-    # Get units
-    attr_units = get_attr_units(cf_coord_var, attributes)
+    def build():
+        attributes = {}
 
-    # Get any coordinate point data.
-    if isinstance(cf_coord_var, cf.CFLabelVariable):
-        points_data = cf_coord_var.cf_label_data(cf_var)
-    else:
-        points_data = _get_cf_var_data(cf_coord_var, engine.filename)
+        # Get units
+        attr_units = get_attr_units(cf_coord_var, attributes)
 
-    # Get any coordinate bounds.
-    cf_bounds_var, climatological = get_cf_bounds_var(cf_coord_var)
-    if cf_bounds_var is not None:
-        bounds_data = _get_cf_var_data(cf_bounds_var, engine.filename)
+        # Get any coordinate point data.
+        if isinstance(cf_coord_var, cf.CFLabelVariable):
+            points_data = cf_coord_var.cf_label_data(cf_var)
+        else:
+            points_data = _get_cf_var_data(cf_coord_var, engine.filename)
+
+        # Get any coordinate bounds.
+        cf_bounds_var, climatological = get_cf_bounds_var(cf_coord_var)
+        if cf_bounds_var is not None:
+            bounds_data = _get_cf_var_data(cf_bounds_var, engine.filename)
+
+            # Handle transposed bounds where the vertex dimension is not
+            # the last one. Test based on shape to support different
+            # dimension names.
+            if cf_bounds_var.shape[:-1] != cf_coord_var.shape:
+                # Resolving the data to a numpy array (i.e. *not* masked) for
+                # compatibility with array creators (i.e. dask)
+                bounds_data = np.asarray(bounds_data)
+                bounds_data = reorder_bounds_data(
+                    bounds_data, cf_bounds_var, cf_coord_var
+                )
 
-        # Handle transposed bounds where the vertex dimension is not
-        # the last one. Test based on shape to support different
-        # dimension names.
-        if cf_bounds_var.shape[:-1] != cf_coord_var.shape:
-            # Resolving the data to a numpy array (i.e. *not* masked) for
-            # compatibility with array creators (i.e. dask)
-            bounds_data = np.asarray(bounds_data)
-            bounds_data = reorder_bounds_data(bounds_data, cf_bounds_var, cf_coord_var)
+            bounds_data = _normalise_bounds_units(
+                attr_units, cf_bounds_var, bounds_data
+            )
+        else:
+            bounds_data = None
 
-        bounds_data = _normalise_bounds_units(attr_units, cf_bounds_var, bounds_data)
-    else:
-        bounds_data = None
+        # Determine the standard_name, long_name and var_name
+        standard_name, long_name, var_name = get_names(
+            cf_coord_var, coord_name, attributes
+        )
+
+        # Create the coordinate
+        return iris.coords.AuxCoord(
+            points_data,
+            standard_name=standard_name,
+            long_name=long_name,
+            var_name=var_name,
+            units=attr_units,
+            bounds=bounds_data,
+            attributes=attributes,
+            coord_system=coord_system,
+            climatological=climatological,
+        )
+
+    # Label points are specific to the data variable, so are never shared.
+    key = None
+    if not isinstance(cf_coord_var, cf.CFLabelVariable) and coord_system is None:
+        key = (
+            "auxiliary_coordinate",
+            cf_coord_var.cf_name,
+            coord_name,
+            _chunking_key(cf_coord_var),
+        )
+    coord = shared_part(engine, key, build)
 
     # Determine the name of the dimension/s shared between the CF-netCDF data variable
     # and the coordinate being built.
@@ -1477,22 +1559,6 @@ def build_auxiliary_coordinate(
         # Calculate the offset of each common dimension.
         data_dims = [cf_var.dimensions.index(dim) for dim in common_dims]
 
-    # Determine the standard_name, long_name and var_name
-    standard_name, long_name, var_name = get_names(cf_coord_var, coord_name, attributes)
-
-    # Create the coordinate
-    coord = iris.coords.AuxCoord(
-        points_data,
-        standard_name=standard_name,
-        long_name=long_name,
-        var_name=var_name,
-        units=attr_units,
-        bounds=bounds_data,
-        attributes=attributes,
-        coord_system=coord_system,
-        climatological=climatological,
-    )
-
     # Add it to the cube
     try:
         cube.add_aux_coord(coord, data_dims)
@@ -1512,13 +1578,35 @@ def build_cell_measures(engine, cf_cm_var):
     """Create a CellMeasure instance and add it to the cube."""
     cf_var = engine.cf_var
     cube = engine.cube
-    attributes = {}
 
-    # Get units
-    attr_units = get_attr_units(cf_cm_var, attributes)
+    def build():
+        attributes = {}
+
+        # Get units
+        attr_units = get_attr_units(cf_cm_var, attributes)
+
+        # Get (lazy) content array
+        data = _get_cf_var_data(cf_cm_var, engine.filename)
+
+        # Determine the standard_name, long_name and var_name
+        standard_name, long_name, var_name = get_names(cf_cm_var, None, attributes)
+
+        # Obtain the cf_measure.
+        measure = cf_cm_var.cf_measure
+
+        # Create the CellMeasure
+        return iris.coords.CellMeasure(
+            data,
+            standard_name=standard_name,
+            long_name=long_name,
+            var_name=var_name,
+            units=attr_units,
+            attributes=attributes,
+            measure=measure,
+        )
 
-    # Get (lazy) content array
-    data = _get_cf_var_data(cf_cm_var, engine.filename)
+    key = ("cell_measure", cf_cm_var.cf_name, _chunking_key(cf_cm_var))
+    cell_measure = shared_part(engine, key, build)
 
     # Determine the name of the dimension/s shared between the CF-netCDF data variable
     # and the coordinate being built.
@@ -1528,23 +1616,6 @@ def build_cell_measures(engine, cf_cm_var):
         # Calculate the offset of each common dimension.
         data_dims = [cf_var.dimensions.index(dim) for dim in common_dims]
 
-    # Determine the standard_name, long_name and var_name
-    standard_name, long_name, var_name = get_names(cf_cm_var, None, attributes)
-
-    # Obtain the cf_measure.
-    measure = cf_cm_var.cf_measure
-
-    # Create the CellMeasure
-    cell_measure = iris.coords.CellMeasure(
-        data,
-        standard_name=standard_name,
-        long_name=long_name,
-        var_name=var_name,
-        units=attr_units,
-        attributes=attributes,
-        measure=measure,
-    )
-
     # Add it to the cube
     try:
         cube.add_cell_measure(cell_measure, data_dims)
@@ -1564,13 +1635,31 @@ def build_ancil_var(engine, cf_av_var):
     """Create an AncillaryVariable instance and add it to the cube."""
     cf_var = engine.cf_var
     cube = engine.cube
-    attributes = {}
 
-    # Get units
-    attr_units = get_attr_units(cf_av_var, attributes)
+    def build():
+        attributes = {}
+
+        # Get units
+        attr_units = get_attr_units(cf_av_var, attributes)
+
+        # Get (lazy) content array
+        data = _get_cf_var_data(cf_av_var, engine.filename)
 
-    # Get (lazy) content array
-    data = _get_cf_var_data(cf_av_var, engine.filename)
+        # Determine the standard_name, long_name and var_name
+        standard_name, long_name, var_name = get_names(cf_av_var, None, attributes)
+
+        # Create the AncillaryVariable
+        return iris.coords.AncillaryVariable(
+            data,
+            standard_name=standard_name,
+            long_name=long_name,
+            var_name=var_name,
+            units=attr_units,
+            attributes=attributes,
+        )
+
+    key = ("ancillary_variable", cf_av_var.cf_name, _chunking_key(cf_av_var))
+    av = shared_part(engine, key, build)
 
     # Determine the name of the dimension/s shared between the CF-netCDF data variable
     # and the AV being built.
@@ -1580,19 +1669,6 @@ def build_ancil_var(engine, cf_av_var):
         # Calculate the offset of each common dimension.
         data_dims = [cf_var.dimensions.index(dim) for dim in common_dims]
 
-    # Determine the standard_name, long_name and var_name
-    standard_name, long_name, var_name = get_names(cf_av_var, None, attributes)
-
-    # Create the AncillaryVariable
-    av = iris.coords.AncillaryVariable(
-        data,
-        standard_name=standard_name,
-        long_name=long_name,
-        var_name=var_name,
-        units=attr_units,
-        attributes=attributes,
-    )
-
     # Add it to the cube
     try:
         cube.add_ancillary_variable(av, data_dims)
@@ -63,6 +63,35 @@ reference_terms = dict(
 )
 
 
+#: NetCDF variable attributes which reference other variables, by name.
+_CF_REFERENCE_ATTRS = (
+    "ancillary_variables",
+    "bounds",
+    "climatology",
+    "coordinates",
+    "grid_mapping",
+)
+
+#: NetCDF variable attributes which reference other variables, as "term: name" pairs.
+_CF_PARSE_REFERENCE_ATTRS = ("cell_measures", "formula_terms")
+
+
+def _referenced_names(nc_var):
+    """Return the names of the variables referenced by a netCDF variable."""
+    result = set()
+    for attr in _CF_REFERENCE_ATTRS:
+        nc_var_att = getattr(nc_var, attr, None)
+        if nc_var_att is not None:
+            result.update(nc_var_att.split())
+    for attr in _CF_PARSE_REFERENCE_ATTRS:
+        nc_var_att = getattr(nc_var, attr, None)
+        if nc_var_att is not None:
+            result.update(
+                match_item.group("rhs") for match_item in _CF_PARSE.finditer(nc_var_att)
+            )
+    return result
+
+
 # NetCDF returns a different type for strings depending on Python version.
 def _is_str_dtype(var):
     return np.issubdtype(var.dtype, np.bytes_)
@@ -1282,6 +1311,20 @@ class CFReader:
     This class allows the contents of a netCDF file to be interpreted according
     to the 'NetCDF Climate and Forecast (CF) Metadata Conventions'.
 
+    Parameters
+    ----------
+    file_source : str or netCDF4.Dataset
+        The file path, or an open dataset.
+    warn : bool, default=False
+        Whether to warn of netCDF3 files, which are slower to load.
+    monotonic : bool, default=False
+        Whether CF coordinate variables must be monotonic.
+    var_callback : callable, optional
+        A test of whether a :class:`CFDataVariable` is required.  If given,
+        only the data variables passing this test, together with the variables
+        they depend on, are interpreted.  Other variables of the file may then
+        be missing from the :attr:`cf_group`.
+
     """
 
     # All CF variable types EXCEPT for the "special cases" of
@@ -1301,13 +1344,15 @@ class CFReader:
 
     CFGroup = CFGroup
 
-    def __init__(self, file_source, warn=False, monotonic=False):
+    def __init__(self, file_source, warn=False, monotonic=False, var_callback=None):
         # Ensure safe operation for destructor, should init fail.
         self._own_file = False
         if isinstance(file_source, str):
             # Create from filepath : open it + own it (=close when we die).
             self._filename = os.path.expanduser(file_source)
-            self._dataset = _thread_safe_nc.DatasetWrapper(self._filename, mode="r")
+            # N.B. may be a dataset shared via the pool, in which case "closing" it
+            #  just returns it to the pool.
+            self._dataset = _thread_safe_nc.DATASET_POOL.acquire_wrapper(self._filename)
             self._own_file = True
         else:
             # We have been passed an open dataset.
@@ -1338,6 +1383,8 @@ class CFReader:
 
         # Read the variables in the dataset only once to reduce runtime.
         variables = self._dataset.variables
+        if var_callback is not None and not self._with_ugrid and not monotonic:
+            variables = self._select_variables(variables, var_callback)
         self._translate(variables)
         self._build_cf_groups(variables)
         self._reset(variables)
@@ -1382,6 +1429,53 @@ class CFReader:
     def __repr__(self):
         return "%s(%r)" % (self.__class__.__name__, self._filename)
 
+    def _select_variables(self, variables, var_callback):
+        """Select the netCDF variables needed to interpret the selected data variables.
+
+        Only the attributes which reference other variables are read from every
+        variable.  The selection contains each variable that may be a required
+        data variable, together with any variables that refer to it, so that
+        it is classified as in the whole file, and all the variables that these
+        depend on.
+
+        """
+        referrers = {name: set() for name in variables}
+        for name, nc_var in variables.items():
+            for referenced in _referenced_names(nc_var):
+                if referenced in referrers:
+                    referrers[referenced].add(name)
+
+        selected = set()
+        for name, nc_var in variables.items():
+            # Coordinate variables are never data variables.
+            is_coordinate = (
+                nc_var.ndim == 1
+                and name in nc_var.dimensions
+                and not _is_str_dtype(nc_var)
+            )
+            if not is_coordinate and var_callback(CFDataVariable(name, nc_var)):
+                selected.add(name)
+
+        # Add the variables that refer to the candidate data variables.
+        pending = list(selected)
+        while pending:
+            for referrer in referrers[pending.pop()] - selected:
+                selected.add(referrer)
+                pending.append(referrer)
+
+        # Add the variables that the selected variables depend on.
+        pending = list(selected)
+        while pending:
+            nc_var = variables[pending.pop()]
+            dependencies = _referenced_names(nc_var) | set(nc_var.dimensions)
+            for name in dependencies - selected:
+                if name in variables:
+                    selected.add(name)
+                    pending.append(name)
+
+        # Preserve the order of the variables in the file.
+        return {name: nc_var for name, nc_var in variables.items() if name in selected}
+
     def _translate(self, variables):
         """Classify the netCDF variables into CF-netCDF variables."""
         netcdf_variable_names = list(variables.keys())
@@ -28,6 +28,7 @@ from .saver import (
     CFNameCoordMap,
     Saver,
     save,
+    save_sharded,
 )
 
 # Export all public elements from the loader and saver submodules.
@@ -46,4 +47,5 @@ __all__ = (
     "logger",
     "parse_cell_methods",
     "save",
+    "save_sharded",
 )
@@ -43,6 +43,11 @@ open for writing a file which is _already_ open for writing simply raises an
 access error.  In any case, Iris netcdf saver will not support this mode of
 operation, at present.
 
+N.B. with a local ('threads' or 'single-threaded') scheduler, the Saver in
+fact passes all the computed chunks to a single writer thread, a
+"NetCDFQueuedWriter", so no lock is needed there.  The NetCDFWriteProxy and
+lock are then used only for a distributed scheduler.
+
 We don't currently support a local "processes" type scheduler.  If we did, the
 behaviour should be very similar to a distributed scheduler.  It would need to
 use some other serialisable shared-lock solution in place of
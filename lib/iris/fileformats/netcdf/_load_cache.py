@@ -0,0 +1,299 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Persistent snapshots of the cubes loaded from netCDF files.
+
+Loading a netCDF file must first read and interpret all of its CF metadata.
+For files which are loaded repeatedly, this module can record the resulting
+cubes, whose data remains lazy and refers back to the file, in a "snapshot"
+file, so that later loads re-create the cubes without reading any netCDF
+metadata.
+
+Snapshots are controlled by the single instance of :class:`LoadCache`, the
+:data:`iris.fileformats.netcdf.loader.LOAD_CACHE` object, and are disabled by
+default.
+
+"""
+
+from contextlib import contextmanager
+import hashlib
+import os
+from pathlib import Path
+import pickle
+import tempfile
+import threading
+from typing import Any, Iterator
+
+import dask.config
+
+import iris
+
+#: Version of the snapshot file content : snapshots of any other version are ignored.
+SNAPSHOT_VERSION = 1
+
+# Suffix of snapshot filenames.
+_SNAPSHOT_SUFFIX = ".iris-nc.pkl"
+
+
+def _load_settings() -> str:
+    # The global settings which affect the loaded cubes : a snapshot is only
+    #  used if these are unchanged.
+    chunk_size = dask.config.get("array.chunk-size")
+    future = sorted(vars(iris.FUTURE).items())
+    return f"iris={iris.__version__} chunk-size={chunk_size} future={future}"
+
+
+class LoadCache:
+    """Control the use of persistent snapshots of the cubes loaded from netCDF files.
+
+    Snapshots are stored in a given directory, with one snapshot file per
+    loaded data file.  Each is keyed by the real path of the data file, and
+    records the file size and modification time : a snapshot is only used if
+    these still match, otherwise the file is loaded as normal and the snapshot
+    is re-written.
+
+    The total size of the snapshots is limited to :attr:`maxsize` bytes, by
+    deleting those least recently used.  Snapshot files can also be deleted at
+    any time, and :meth:`prune` removes any which are out of date, or whose
+    data files no longer exist.
+
+    Snapshots are only used for loads without a user callback, and without any
+    :data:`~iris.fileformats.netcdf.loader.CHUNK_CONTROL` settings.  They are
+    only written by loads without constraints, so that a constrained load of a
+    file with no snapshot still interprets only the variables it needs, and
+    never for files whose load records any
+    :data:`~iris.loading.LOAD_PROBLEMS`, so that those are always reported.
+    Any other warnings from interpreting a file are only issued when it is
+    actually read, and not when its cubes are re-created from a snapshot.
+
+    .. warning::
+
+        Snapshots are stored with :mod:`pickle`, so only use a directory which
+        cannot be written by untrusted users.
+
+    """
+
+    def __init__(
+        self, directory: str | Path | None = None, maxsize: int | None = 2**30
+    ):
+        #: The directory where snapshots are stored. If ``None``, caching is off.
+        self.directory = directory
+        #: The maximum total size of the snapshot files, in bytes, or ``None``.
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} directory={self.directory!r} "
+            f"maxsize={self.maxsize!r}>"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether snapshots are being used."""
+        return self.directory is not None
+
+    def reset_stats(self):
+        """Zero the counts of snapshot "hits", "misses", "writes" and "evictions"."""
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counts of snapshot "hits", "misses", "writes" and "evictions"."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
+
+    @contextmanager
+    def set(
+        self, directory: str | Path | None, maxsize: int | None = None
+    ) -> Iterator[None]:
+        """Use load snapshots stored in the given directory, within a context.
+
+        Parameters
+        ----------
+        directory : str or Path or None
+            The snapshot directory, which is created if necessary.
+            If ``None``, caching is disabled.
+        maxsize : int, optional
+            The maximum total size of the snapshots, in bytes.
+            If not given, the current :attr:`maxsize` is kept.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            from iris.fileformats.netcdf.loader import LOAD_CACHE
+
+            with LOAD_CACHE.set("/scratch/my_snapshots"):
+                cubes = iris.load(archive_files)
+
+        """
+        old_directory, old_maxsize = self.directory, self.maxsize
+        self.directory = directory
+        if maxsize is not None:
+            self.maxsize = maxsize
+        try:
+            yield
+        finally:
+            self.directory, self.maxsize = old_directory, old_maxsize
+
+    def _snapshot_path(self, real_path: str) -> Path:
+        key = hashlib.sha1(real_path.encode()).hexdigest()
+        return Path(self.directory) / f"{key}{_SNAPSHOT_SUFFIX}"
+
+    @staticmethod
+    def _file_signature(real_path: str) -> tuple[int, int]:
+        stat = os.stat(real_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _header(self, real_path: str) -> dict[str, Any]:
+        size, mtime_ns = self._file_signature(real_path)
+        return {
+            "version": SNAPSHOT_VERSION,
+            "path": real_path,
+            "settings": _load_settings(),
+            "size": size,
+            "mtime_ns": mtime_ns,
+        }
+
+    def lookup(self, filename: str | Path) -> list | None:
+        """Return the valid snapshot content for a file, or ``None``.
+
+        Parameters
+        ----------
+        filename : str or Path
+            The data file.
+
+        """
+        if not self.enabled:
+            return None
+        content = None
+        try:
+            real_path = os.path.realpath(filename)
+            path = self._snapshot_path(real_path)
+            with open(path, "rb") as fh:
+                # The header is read first, so that an invalid snapshot is
+                #  rejected without reading the cubes.
+                if pickle.load(fh) == self._header(real_path):
+                    content = pickle.load(fh)
+            if content is not None:
+                # Mark the snapshot as recently used.
+                os.utime(path)
+        except (
+            OSError,
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ImportError,
+        ):
+            # No snapshot, an unreadable one, or not a local file.
+            content = None
+        with self._lock:
+            if content is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return content
+
+    def store(self, filename: str | Path, content: list) -> None:
+        """Record the snapshot content for a file.
+
+        Does nothing if caching is disabled.  Failure to write a snapshot, or
+        a snapshot larger than :attr:`maxsize`, is not an error.
+
+        """
+        if not self.enabled:
+            return
+        try:
+            real_path = os.path.realpath(filename)
+            header = self._header(real_path)
+            data = pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL)
+            if self.maxsize is not None and len(data) > self.maxsize:
+                return
+            directory = Path(self.directory)
+            directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file, then rename, so that a concurrent
+            # reader never sees a partially-written snapshot.
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp.pkl")
+            try:
+                with os.fdopen(fd, "wb") as temp_file:
+                    pickle.dump(header, temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+                    temp_file.write(data)
+                os.replace(temp_path, self._snapshot_path(real_path))
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            return
+        with self._lock:
+            self.writes += 1
+        self._evict()
+
+    def _snapshots(self) -> list[tuple[int, int, Path]]:
+        # The (mtime, size, path) of each snapshot file, oldest first.
+        result = []
+        if self.enabled and Path(self.directory).is_dir():
+            for path in Path(self.directory).glob(f"*{_SNAPSHOT_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                result.append((stat.st_mtime_ns, stat.st_size, path))
+        return sorted(result)
+
+    def _evict(self) -> None:
+        if self.maxsize is None:
+            return
+        snapshots = self._snapshots()
+        total = sum(size for _, size, _ in snapshots)
+        for _, size, path in snapshots:
+            if total <= self.maxsize:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            with self._lock:
+                self.evictions += 1
+
+    def prune(self) -> list[Path]:
+        """Delete any snapshots which are invalid, or whose data file is gone.
+
+        Returns
+        -------
+        list of Path
+            The snapshot files which were removed.
+
+        """
+        removed = []
+        for _, _, path in self._snapshots():
+            try:
+                with open(path, "rb") as fh:
+                    header = pickle.load(fh)
+                valid = path == self._snapshot_path(
+                    header["path"]
+                ) and header == self._header(header["path"])
+            except (
+                OSError,
+                EOFError,
+                pickle.UnpicklingError,
+                KeyError,
+                TypeError,
+            ):
+                valid = False
+            if not valid:
+                path.unlink(missing_ok=True)
+                removed.append(path)
+        return removed
+
+    def clear(self) -> None:
+        """Delete all the snapshots."""
+        for _, _, path in self._snapshots():
+            path.unlink(missing_ok=True)
@@ -9,13 +9,91 @@ Intention is that no other Iris module should import the netCDF4 module.
 """
 
 from abc import ABC
-from threading import Lock
+from collections import OrderedDict
+from contextlib import contextmanager
+from enum import Enum, auto
+import os
+import queue
+from threading import Condition, Lock, RLock, Thread
+import time
 import typing
+from weakref import WeakValueDictionary
 
 import netCDF4
 import numpy as np
 
-_GLOBAL_NETCDF4_LOCK = Lock()
+from iris._concurrency import ConcurrencyControl
+
+
+class _SharedExclusiveLock:
+    """A lock for netCDF4 calls, which also allows shared access for chunk reads.
+
+    Used as a normal lock (``with lock:`` / ``acquire`` / ``release``), it gives
+    exclusive access, exactly like a :class:`threading.Lock`.
+
+    The :meth:`shared` context instead allows any number of holders at once,
+    but excludes all exclusive holders.  This is used only for lazy data reads
+    with :attr:`ReadConcurrency.Modes.PER_FILE`, which serialises reads of each
+    file separately.  New shared holders wait for any pending exclusive one.
+
+    """
+
+    def __init__(self):
+        self._exclusive = Lock()
+        self._readers = 0
+        self._readers_changed = Condition(Lock())
+
+    def acquire(self, blocking=True, timeout=-1):
+        if not blocking:
+            deadline = time.monotonic()
+        elif timeout >= 0:
+            deadline = time.monotonic() + timeout
+        else:
+            deadline = None
+        if not self._exclusive.acquire(blocking, timeout):
+            return False
+        if self._readers:
+            with self._readers_changed:
+                while self._readers:
+                    if deadline is None:
+                        self._readers_changed.wait()
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._readers_changed.wait(remaining):
+                        if self._readers:
+                            # Timed out waiting for the shared holders.
+                            self._exclusive.release()
+                            return False
+        return True
+
+    def release(self):
+        self._exclusive.release()
+
+    def locked(self):
+        return self._exclusive.locked()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    @contextmanager
+    def shared(self):
+        """Hold the lock in shared mode."""
+        with self._exclusive:
+            with self._readers_changed:
+                self._readers += 1
+        try:
+            yield
+        finally:
+            with self._readers_changed:
+                self._readers -= 1
+                if not self._readers:
+                    self._readers_changed.notify_all()
+
+
+_GLOBAL_NETCDF4_LOCK = _SharedExclusiveLock()
 
 # Doesn't need thread protection, but this allows all netCDF4 refs to be
 #  replaced with thread_safe refs.
@@ -307,6 +385,380 @@ class DatasetWrapper(GroupWrapper):
         return cls.from_existing(instance)
 
 
+class _PoolEntry:
+    """A single open dataset held by a :class:`DatasetPool`."""
+
+    __slots__ = ("dataset", "signature", "users", "stale")
+
+    def __init__(self, dataset, signature):
+        self.dataset = dataset
+        self.signature = signature
+        # Number of clients currently holding the dataset.
+        self.users = 0
+        # Set when the entry has been dropped from the pool while still in use,
+        #  so that the last user closes it.
+        self.stale = False
+
+
+class DatasetPool:
+    """A bounded, least-recently-used pool of open read-only netCDF4 datasets.
+
+    Re-opening a file for every lazy data chunk is expensive, so datasets can
+    instead be kept open and shared between reads of the same file.  Entries
+    are keyed by the (real) file path, and are validated against the file
+    modification time, size and inode on every access, so that a file which
+    has been re-written is re-opened rather than read through a stale handle.
+
+    The pool is disabled (``maxsize=0``) by default, in which case every
+    access opens and closes the file, as previously.
+
+    All methods which access datasets **must** be called while holding
+    ``_GLOBAL_NETCDF4_LOCK`` (possibly in shared mode, for reading), except
+    :meth:`clear`, :meth:`discard` and :meth:`acquire_wrapper`, which take the
+    lock themselves.
+
+    Notes
+    -----
+    The pool is fork-safe : a forked child process never uses, or closes, the
+    handles inherited from its parent, but opens its own.
+
+    Before writing to a file which may be held open by the pool, it should be
+    released with :meth:`discard` (as :class:`~iris.fileformats.netcdf.Saver`
+    does) or :meth:`clear`.
+
+    """
+
+    def __init__(self, maxsize=0):
+        self._maxsize = int(maxsize)
+        self._entries = OrderedDict()
+        # Entries no longer in the pool, but still in use.
+        self._detached = {}
+        self._pid = os.getpid()
+        # Datasets inherited across a fork : kept referenced, and never closed.
+        self._orphans = []
+        # Protects the pool state, for concurrent reads in "shared" mode.
+        self._lock = RLock()
+        self.reset_stats()
+
+    @property
+    def maxsize(self):
+        """The maximum number of open datasets retained (0 disables pooling)."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        with _GLOBAL_NETCDF4_LOCK, self._lock:
+            self._maxsize = int(maxsize)
+            self._evict()
+
+    @property
+    def stats(self) -> typing.Dict[str, int]:
+        """Access counts : pool "hits" and "misses", plus total dataset "opens"."""
+        return {"hits": self.hits, "misses": self.misses, "opens": self.opens}
+
+    def reset_stats(self):
+        """Zero the access counts."""
+        self.hits = 0
+        self.misses = 0
+        self.opens = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} maxsize={self.maxsize} size={len(self)}"
+            f" hits={self.hits} misses={self.misses} opens={self.opens}>"
+        )
+
+    @staticmethod
+    def _key_and_signature(path):
+        """Return a pool key and file signature, or None for a non-local file."""
+        try:
+            key = os.path.realpath(path)
+            stat = os.stat(key)
+        except (OSError, TypeError, ValueError):
+            # E.g. an OPeNDAP URL : never pooled.
+            return None
+        return key, (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _open(self, path):
+        with self._lock:
+            self.opens += 1
+        return netCDF4.Dataset(path, mode="r")
+
+    def _check_fork(self):
+        pid = os.getpid()
+        if pid != self._pid:
+            # Handles from the parent process must not be used or closed here.
+            self._orphans.extend(
+                entry.dataset
+                for entry in list(self._entries.values())
+                + list(self._detached.values())
+            )
+            self._entries.clear()
+            self._detached.clear()
+            self._pid = pid
+
+    def _close_entry(self, entry):
+        try:
+            entry.dataset.close()
+        except RuntimeError:
+            # Already closed.
+            pass
+
+    def _drop(self, key):
+        entry = self._entries.pop(key)
+        if entry.users:
+            entry.stale = True
+            self._detached[id(entry.dataset)] = entry
+        else:
+            self._close_entry(entry)
+
+    def _evict(self):
+        """Close least-recently-used idle datasets, to respect maxsize."""
+        excess = len(self._entries) - self._maxsize
+        for key in list(self._entries.keys()):
+            if excess <= 0:
+                break
+            if not self._entries[key].users:
+                self._drop(key)
+                excess -= 1
+
+    def acquire(self, path):
+        """Return an open dataset for the path, which must later be released.
+
+        Must be called while holding ``_GLOBAL_NETCDF4_LOCK``.
+
+        Returns
+        -------
+        :class:`netCDF4.Dataset` or None
+            A pooled dataset, or ``None`` if the path cannot be pooled, in which
+            case the caller should open (and close) the file itself.
+
+        """
+        if self._maxsize <= 0:
+            return None
+        key_signature = self._key_and_signature(path)
+        if key_signature is None:
+            return None
+        key, signature = key_signature
+        with self._lock:
+            self._check_fork()
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature != signature:
+                # The file has changed since it was opened.
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                entry = _PoolEntry(self._open(path), signature)
+                self._entries[key] = entry
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            entry.users += 1
+            self._evict()
+            return entry.dataset
+
+    def release(self, dataset):
+        """Return a dataset obtained from :meth:`acquire` to the pool.
+
+        Must be called while holding ``_GLOBAL_NETCDF4_LOCK``.
+
+        """
+        with self._lock:
+            self._check_fork()
+            entry = self._detached.get(id(dataset))
+            if entry is None:
+                for entry in self._entries.values():
+                    if entry.dataset is dataset:
+                        break
+                else:
+                    # Not ours, e.g. since dropped by a fork.
+                    return
+            entry.users -= 1
+            if entry.users <= 0:
+                if entry.stale:
+                    del self._detached[id(dataset)]
+                    self._close_entry(entry)
+                else:
+                    self._evict()
+
+    @contextmanager
+    def dataset(self, path):
+        """Provide an open dataset, pooled if possible, else opened and closed.
+
+        Must be called while holding ``_GLOBAL_NETCDF4_LOCK``.
+
+        """
+        dataset = self.acquire(path)
+        if dataset is not None:
+            try:
+                yield dataset
+            finally:
+                self.release(dataset)
+        else:
+            dataset = self._open(path)
+            try:
+                yield dataset
+            finally:
+                dataset.close()
+
+    def acquire_wrapper(self, path) -> "DatasetWrapper":
+        """Return a thread-safe wrapper of an open dataset for the path.
+
+        If the file is pooled, closing the wrapper returns the dataset to the
+        pool instead of closing it.
+
+        """
+        with _GLOBAL_NETCDF4_LOCK:
+            dataset = self.acquire(path)
+        if dataset is None:
+            return DatasetWrapper(path, mode="r")
+        return _PooledDatasetWrapper(dataset, self)
+
+    def discard(self, path):
+        """Close any pooled dataset for the path (once it is no longer in use)."""
+        key_signature = self._key_and_signature(path)
+        key = os.path.realpath(path) if key_signature is None else key_signature[0]
+        with _GLOBAL_NETCDF4_LOCK, self._lock:
+            self._check_fork()
+            if key in self._entries:
+                self._drop(key)
+
+    def clear(self):
+        """Close all pooled datasets (those in use are closed on release)."""
+        with _GLOBAL_NETCDF4_LOCK, self._lock:
+            self._check_fork()
+            for key in list(self._entries.keys()):
+                self._drop(key)
+
+
+class _PooledDatasetWrapper(DatasetWrapper):
+    """A :class:`DatasetWrapper` of a dataset borrowed from a :class:`DatasetPool`.
+
+    Closing it returns the dataset to the pool.
+    """
+
+    def __init__(self, dataset, pool):
+        super().__init__(dataset)
+        object.__setattr__(self, "_pool", pool)
+
+    def close(self):
+        """Return the dataset to the pool, rather than closing it."""
+        pool = object.__getattribute__(self, "_pool")
+        if pool is not None:
+            object.__setattr__(self, "_pool", None)
+            with _GLOBAL_NETCDF4_LOCK:
+                pool.release(self._contained_instance)
+
+
+#: The pool of open datasets used for all netCDF reads.
+DATASET_POOL = DatasetPool()
+
+
+def _read_variable(path, variable_name, keys):
+    """Read a slice of a file variable.
+
+    Must be called while holding ``_GLOBAL_NETCDF4_LOCK``.
+
+    """
+    # Using a DatasetWrapper causes problems with invalid ID's and the
+    # netCDF4 library, presumably because this gets called so many times by
+    # Dask. The caller uses _GLOBAL_NETCDF4_LOCK directly instead.
+    # The file may be held open in the DATASET_POOL, to save re-opening it.
+    with DATASET_POOL.dataset(path) as dataset:
+        variable = dataset.variables[variable_name]
+        # Get the NetCDF variable data and slice.
+        var = variable[keys]
+    return np.asanyarray(var)
+
+
+def _init_read_worker(pool_size):
+    """Initialise a :attr:`ReadConcurrency.Modes.PROCESSES` worker process."""
+    DATASET_POOL.maxsize = pool_size
+
+
+def _read_variable_in_worker(path, variable_name, keys):
+    """Read a slice of a file variable, in a worker process."""
+    with _GLOBAL_NETCDF4_LOCK:
+        return _read_variable(path, variable_name, keys)
+
+
+class ReadConcurrency(ConcurrencyControl):
+    """Control the concurrency of lazy netCDF data reads.
+
+    Lazy netCDF data reads are controlled by the single instance of this: the
+    :data:`~iris.fileformats.netcdf.loader.READ_CONCURRENCY` object.
+
+    By default, all netCDF4 library calls in the process are serialised by one
+    global lock, as libnetcdf is generally not thread-safe.  Other modes allow
+    lazy chunk reads from separate files to proceed in parallel.  In all modes,
+    every other file access (i.e. metadata loading, and all writing) is still
+    serialised in the same way.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from iris.fileformats.netcdf.loader import READ_CONCURRENCY
+
+        with READ_CONCURRENCY.set("PROCESSES", max_workers=8):
+            data = cube.data
+
+    """
+
+    class Modes(Enum):
+        """Modes Enums."""
+
+        #: All reads are serialised by the global lock.
+        GLOBAL_LOCK = auto()
+        #: Reads of *different* files may run concurrently, in multiple threads.
+        #: N.B. only safe with a thread-safe build of libnetcdf (and HDF5).
+        PER_FILE = auto()
+        #: Reads run in a pool of worker processes, which is safe with any
+        #: libnetcdf build.
+        PROCESSES = auto()
+
+    def __init__(self):
+        super().__init__(self.Modes.GLOBAL_LOCK)
+        # N.B. weakly held, so that a lock only exists while it is in use.
+        self._file_locks = WeakValueDictionary()
+
+    def _process_pool_options(self):
+        return dict(initializer=_init_read_worker, initargs=(DATASET_POOL.maxsize,))
+
+    def _file_lock(self, path):
+        # N.B. keyed by the real path, so that every name of a file shares one lock.
+        key = os.path.realpath(path)
+        with self._lock:
+            lock = self._file_locks.get(key)
+            if lock is None:
+                lock = self._file_locks[key] = Lock()
+        return lock
+
+    def read(self, path, variable_name, keys):
+        """Read a slice of a file variable, according to the current mode."""
+        mode = self.mode
+        if mode is self.Modes.PROCESSES:
+            future = self._get_executor().submit(
+                _read_variable_in_worker, path, variable_name, keys
+            )
+            result = future.result()
+        elif mode is self.Modes.PER_FILE:
+            with _GLOBAL_NETCDF4_LOCK.shared(), self._file_lock(path):
+                result = _read_variable(path, variable_name, keys)
+        else:
+            with _GLOBAL_NETCDF4_LOCK:
+                result = _read_variable(path, variable_name, keys)
+        return result
+
+
+#: The control for lazy netCDF data read concurrency.
+READ_CONCURRENCY = ReadConcurrency()
+
+
 class NetCDFDataProxy:
     """A reference to the data payload of a single NetCDF file variable."""
 
@@ -329,18 +781,8 @@ class NetCDFDataProxy:
         return np.ma.array(np.empty((0,) * self.ndim, dtype=self.dtype), mask=True)
 
     def __getitem__(self, keys):
-        # Using a DatasetWrapper causes problems with invalid ID's and the
-        # netCDF4 library, presumably because __getitem__ gets called so many
-        # times by Dask. Use _GLOBAL_NETCDF4_LOCK directly instead.
-        with _GLOBAL_NETCDF4_LOCK:
-            dataset = netCDF4.Dataset(self.path)
-            try:
-                variable = dataset.variables[self.variable_name]
-                # Get the NetCDF variable data and slice.
-                var = variable[keys]
-            finally:
-                dataset.close()
-        return np.asanyarray(var)
+        # N.B. may run in parallel with other reads, as set by READ_CONCURRENCY.
+        return READ_CONCURRENCY.read(self.path, self.variable_name, keys)
 
     def __repr__(self):
         fmt = (
@@ -367,7 +809,8 @@ class NetCDFWriteProxy:
     It encapsulates the netcdf file and variable which are actually to be
     written to.  This opens the file each time, to enable writing the data
     chunk, then closes it.
-    TODO: could be improved with a caching scheme, but this just about works.
+    With a local dask scheduler, the saver instead uses a
+    :class:`NetCDFQueuedWriter`, which opens the file only once.
     """
 
     def __init__(self, filepath, cf_var, file_write_lock):
@@ -399,3 +842,160 @@ class NetCDFWriteProxy:
 
     def __repr__(self):
         return f"<{self.__class__.__name__} path={self.path!r} var={self.varname!r}>"
+
+
+class NetCDFQueuedWriter:
+    """A single writer of data chunks to the variables of one netCDF file.
+
+    Computed chunks are passed to the writer, through a queue, by the
+    :class:`NetCDFQueuedWriteProxy` objects which it creates, and written by
+    a dedicated thread, which opens the file only once.  The queue holds at
+    most ``maxsize`` chunks : beyond that, the chunk producers wait, which
+    limits the memory used when computing is faster than writing.
+
+    The writer thread starts with the first chunk, and :meth:`close` waits for
+    all the queued chunks to be written, closes the file and raises any error
+    from the writes.  Any write while the writer is closing is an error.  The
+    writer can then be used again, unless it was stopped by :meth:`abort`.
+
+    The writer belongs to the process which created it, so it cannot be
+    pickled, e.g. to send to the workers of a distributed dask scheduler.
+
+    """
+
+    def __init__(self, filepath, maxsize=16):
+        self.path = filepath
+        #: The maximum number of chunks waiting to be written.
+        self.maxsize = maxsize
+        self._lock = Lock()
+        self._queue = None
+        self._thread = None
+        self._error = None
+        self._closing = False
+        self._aborted = False
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} path={self.path!r} maxsize={self.maxsize}>"
+
+    def __getstate__(self):
+        msg = (
+            f"{self!r} cannot be pickled : a delayed netCDF save created with "
+            "a local dask scheduler must also be computed with a local scheduler."
+        )
+        raise TypeError(msg)
+
+    def target(self, varname):
+        """Return a write target for a variable of the file."""
+        return NetCDFQueuedWriteProxy(self, varname)
+
+    def _run(self, chunks):
+        # Write the queued chunks, until the "None" which marks the end.
+        dataset = None
+        try:
+            while (chunk := chunks.get()) is not None:
+                if self._error is not None:
+                    # Keep emptying the queue after an error, so that no
+                    #  producer waits forever.
+                    continue
+                varname, keys, array_data = chunk
+                try:
+                    with _GLOBAL_NETCDF4_LOCK:
+                        if dataset is None:
+                            dataset = netCDF4.Dataset(self.path, "r+")
+                        dataset.variables[varname][keys] = array_data
+                except Exception as error:
+                    self._error = error
+                    # Release the file at once, as nothing more is written.
+                    if dataset is not None:
+                        with _GLOBAL_NETCDF4_LOCK:
+                            dataset.close()
+                        dataset = None
+        finally:
+            if dataset is not None:
+                with _GLOBAL_NETCDF4_LOCK:
+                    dataset.close()
+
+    def write(self, varname, keys, array_data):
+        """Queue a chunk of data to be written to a file variable."""
+        # N.B. the chunk is queued while holding the lock, so that it cannot
+        #  follow the end marker queued by close().  This does not stop other
+        #  producers, which would otherwise be waiting for the queue anyway.
+        with self._lock:
+            if self._closing or self._aborted:
+                msg = f"Cannot write to {self!r}, which is closed or closing."
+                raise ValueError(msg)
+            if self._thread is None:
+                self._error = None
+                self._queue = queue.Queue(maxsize=self.maxsize)
+                self._thread = Thread(
+                    target=self._run,
+                    args=(self._queue,),
+                    name=f"netcdf-writer:{os.path.basename(self.path)}",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._queue.put((varname, keys, array_data))
+        if self._error is not None:
+            raise self._error
+
+    def close(self, check=True):
+        """Wait until all queued chunks are written, and close the file.
+
+        Parameters
+        ----------
+        check : bool, default=True
+            Whether to raise any error from the writes.
+
+        """
+        with self._lock:
+            thread, chunks = self._thread, self._queue
+            self._thread = self._queue = None
+            self._closing = True
+        try:
+            if thread is not None:
+                chunks.put(None)
+                thread.join()
+        finally:
+            with self._lock:
+                self._closing = False
+        error, self._error = self._error, None
+        if check and error is not None:
+            raise error
+
+    def abort(self):
+        """Close the file, ignoring any errors, and reject all further writes.
+
+        This is for use after a failed computation, whose remaining chunks
+        may still be arriving.
+
+        """
+        with self._lock:
+            self._aborted = True
+        self.close(check=False)
+
+
+class NetCDFQueuedWriteProxy:
+    """A write target for one variable, passing chunks to a :class:`NetCDFQueuedWriter`.
+
+    Like :class:`NetCDFWriteProxy`, this mimics the data access of a
+    netCDF4.Variable, as a target for :func:`dask.array.store`, but it never
+    opens the file itself.
+
+    """
+
+    def __init__(self, writer, varname):
+        self.writer = writer
+        self.varname = varname
+
+    def __setitem__(self, keys, array_data):
+        self.writer.write(self.varname, keys, np.asanyarray(array_data))
+
+    def __dask_tokenize__(self):
+        writer = self.writer
+        return (self.__class__.__name__, writer.path, self.varname, id(writer))
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} path={self.writer.path!r} "
+            f"var={self.varname!r}>"
+        )
@@ -15,7 +15,10 @@ from collections.abc import Iterable, Iterator, Mapping
 from contextlib import contextmanager
 from copy import deepcopy
 from enum import Enum, auto
+import functools
+import os
 import threading
+from types import SimpleNamespace
 import warnings
 
 import numpy as np
@@ -35,9 +38,10 @@ import iris.config
 import iris.coord_systems
 import iris.coords
 import iris.fileformats.cf
-from iris.fileformats.netcdf import _thread_safe_nc
+from iris.fileformats.netcdf import _load_cache, _thread_safe_nc
 from iris.fileformats.netcdf.saver import _CF_ATTRS
 import iris.io
+from iris.loading import LOAD_PROBLEMS
 import iris.util
 import iris.warnings
 
@@ -51,6 +55,20 @@ from . import logger
 #  concerns so is housed in _thread_safe_nc.
 NetCDFDataProxy = _thread_safe_nc.NetCDFDataProxy
 
+# The pool of open datasets shared by lazy data reads and the CFReader.
+#  Disabled by default : enable with e.g. ``DATASET_POOL.maxsize = 32``.
+DATASET_POOL = _thread_safe_nc.DATASET_POOL
+
+# Control of the concurrency of lazy data reads : by default, all are serialised.
+READ_CONCURRENCY = _thread_safe_nc.READ_CONCURRENCY
+
+#: The control for persistent snapshots of the cubes loaded from netCDF files.
+#:  Disabled by default : enable with e.g. ``LOAD_CACHE.set("/scratch/snapshots")``.
+LOAD_CACHE = _load_cache.LoadCache()
+
+# The properties of a CF data-variable which may be tested by a "var_callback".
+_VAR_CALLBACK_NAMES = ("cf_name", "standard_name", "long_name")
+
 
 class _WarnComboIgnoringBoundsLoad(
     iris.warnings.IrisIgnoringBoundsWarning,
@@ -597,6 +615,144 @@ def _translate_constraints_to_var_callback(constraints):
     return result
 
 
+def _load_cf_cubes(file_source, engine, var_callback):
+    """Generate the (cf_var, cube) pairs of a single netCDF file."""
+    # Deferred import to avoid circular imports.
+    from iris.fileformats.cf import CFReader
+
+    from .ugrid_load import (
+        _build_mesh_coords,
+        _meshes_from_cf,
+    )
+
+    # Ingest the file.  At present may be a filepath or an open netCDF4.Dataset.
+    # Only the variables needed for the selected data variables are interpreted.
+    with CFReader(file_source, var_callback=var_callback) as cf:
+        meshes = _meshes_from_cf(cf)
+
+        # Cube components are shared only between the cubes of one file.
+        engine.shared_parts = {}
+
+        # Process each CF data variable.
+        data_variables = list(cf.cf_group.data_variables.values()) + list(
+            cf.cf_group.promoted.values()
+        )
+        for cf_var in data_variables:
+            if var_callback and not var_callback(cf_var):
+                # Deliver only selected results.
+                continue
+
+            # cf_var-specific mesh handling, if a mesh is present.
+            # Build the mesh_coords *before* loading the cube - avoids
+            # mesh-related attributes being picked up by
+            # _add_unused_attributes().
+            mesh_name = None
+            mesh = None
+            mesh_coords, mesh_dim = [], None
+            mesh_name = getattr(cf_var, "mesh", None)
+            if mesh_name is not None:
+                try:
+                    mesh = meshes[mesh_name]
+                except KeyError:
+                    message = (
+                        f"File does not contain mesh: '{mesh_name}' - "
+                        f"referenced by variable: '{cf_var.cf_name}' ."
+                    )
+                    logger.debug(message)
+            if mesh is not None:
+                mesh_coords, mesh_dim = _build_mesh_coords(mesh, cf_var)
+
+            cube = _load_cube(engine, cf, cf_var, cf.filename)
+
+            # Attach the mesh (if present) to the cube.
+            for mesh_coord in mesh_coords:
+                cube.add_aux_coord(mesh_coord, mesh_dim)
+
+            # Process any associated formula terms and attach
+            # the corresponding AuxCoordFactory.
+            try:
+                _load_aux_factory(engine, cube)
+            except ValueError as e:
+                warnings.warn(
+                    "{}".format(e),
+                    category=iris.warnings.IrisLoadWarning,
+                )
+
+            yield cf_var, cube
+
+
+def _snapshot_usable(file_source, callback):
+    """Whether a load can use the :data:`LOAD_CACHE` snapshot of a file."""
+    return (
+        LOAD_CACHE.enabled
+        and callback is None
+        and isinstance(file_source, (str, os.PathLike))
+        and CHUNK_CONTROL.mode is ChunkControl.Modes.DEFAULT
+        and not CHUNK_CONTROL.var_dim_chunksizes
+    )
+
+
+def _load_snapshot(file_source, engine, var_callback):
+    """Return the snapshot of all the cubes of a netCDF file, or ``None``.
+
+    This is a list of (names, cube) pairs, where "names" are the properties of
+    the CF data-variable which a "var_callback" may test.  It is read from the
+    :data:`LOAD_CACHE` if possible.  Otherwise, for an unconstrained load, the
+    whole file is loaded and the snapshot stored, unless that records any load
+    problems, so that these are reported again by later loads.
+
+    """
+    snapshot = LOAD_CACHE.lookup(file_source)
+    if snapshot is None and var_callback is None:
+        n_problems = len(LOAD_PROBLEMS.problems)
+        snapshot = [
+            (
+                {
+                    name: getattr(cf_var, name)
+                    for name in _VAR_CALLBACK_NAMES
+                    if hasattr(cf_var, name)
+                },
+                cube,
+            )
+            for cf_var, cube in _load_cf_cubes(file_source, engine, None)
+        ]
+        if len(LOAD_PROBLEMS.problems) == n_problems:
+            LOAD_CACHE.store(file_source, snapshot)
+    return snapshot
+
+
+def _load_file_source(file_source, engine, var_callback, callback):
+    """Generate the cubes of a single netCDF file, for :func:`load_cubes`."""
+    # Deferred import to avoid circular imports.
+    from iris.io import run_callback
+
+    snapshot = None
+    if _snapshot_usable(file_source, callback):
+        # Re-create the cubes without reading the file metadata, if possible.
+        snapshot = _load_snapshot(file_source, engine, var_callback)
+    if snapshot is not None:
+        for names, cube in snapshot:
+            if var_callback is None or var_callback(SimpleNamespace(**names)):
+                yield cube
+        return
+
+    for cf_var, cube in _load_cf_cubes(file_source, engine, var_callback):
+        # Perform any user registered callback function.
+        cube = run_callback(callback, cube, cf_var, file_source)
+
+        # Callback mechanism may return None, which must not be yielded
+        if cube is None:
+            continue
+
+        yield cube
+
+
+def _load_file(file_source, callback=None, constraints=None):
+    """Load the cubes of a single netCDF file, as a unit of parallel loading."""
+    var_callback = _translate_constraints_to_var_callback(constraints)
+    return _load_file_source(file_source, _actions_engine(), var_callback, callback)
+
+
 def load_cubes(file_sources, callback=None, constraints=None):
     """Load cubes from a list of NetCDF filenames/OPeNDAP URLs.
 
@@ -614,14 +770,23 @@ def load_cubes(file_sources, callback=None, constraints=None):
     Generator of loaded NetCDF :class:`iris.cube.Cube`.
 
     """
-    # Deferred import to avoid circular imports.
-    from iris.fileformats.cf import CFReader
-    from iris.io import run_callback
+    from iris.loading import LOAD_CONCURRENCY
 
-    from .ugrid_load import (
-        _build_mesh_coords,
-        _meshes_from_cf,
-    )
+    if isinstance(file_sources, str) or not isinstance(file_sources, Iterable):
+        file_sources = [file_sources]
+    file_sources = list(file_sources)
+
+    if LOAD_CONCURRENCY.mode is not LOAD_CONCURRENCY.Modes.SERIAL and all(
+        isinstance(file_source, (str, os.PathLike)) for file_source in file_sources
+    ):
+        # Load separate files in parallel.
+        file_results = LOAD_CONCURRENCY.map(
+            functools.partial(_load_file, callback=callback, constraints=constraints),
+            file_sources,
+        )
+        for cubes in file_results:
+            yield from cubes
+        return
 
     # Create a low-level data-var filter from the original load constraints, if they are suitable.
     var_callback = _translate_constraints_to_var_callback(constraints)
@@ -629,67 +794,8 @@ def load_cubes(file_sources, callback=None, constraints=None):
     # Create an actions engine.
     engine = _actions_engine()
 
-    if isinstance(file_sources, str) or not isinstance(file_sources, Iterable):
-        file_sources = [file_sources]
-
     for file_source in file_sources:
-        # Ingest the file.  At present may be a filepath or an open netCDF4.Dataset.
-        with CFReader(file_source) as cf:
-            meshes = _meshes_from_cf(cf)
-
-            # Process each CF data variable.
-            data_variables = list(cf.cf_group.data_variables.values()) + list(
-                cf.cf_group.promoted.values()
-            )
-            for cf_var in data_variables:
-                if var_callback and not var_callback(cf_var):
-                    # Deliver only selected results.
-                    continue
-
-                # cf_var-specific mesh handling, if a mesh is present.
-                # Build the mesh_coords *before* loading the cube - avoids
-                # mesh-related attributes being picked up by
-                # _add_unused_attributes().
-                mesh_name = None
-                mesh = None
-                mesh_coords, mesh_dim = [], None
-                mesh_name = getattr(cf_var, "mesh", None)
-                if mesh_name is not None:
-                    try:
-                        mesh = meshes[mesh_name]
-                    except KeyError:
-                        message = (
-                            f"File does not contain mesh: '{mesh_name}' - "
-                            f"referenced by variable: '{cf_var.cf_name}' ."
-                        )
-                        logger.debug(message)
-                if mesh is not None:
-                    mesh_coords, mesh_dim = _build_mesh_coords(mesh, cf_var)
-
-                cube = _load_cube(engine, cf, cf_var, cf.filename)
-
-                # Attach the mesh (if present) to the cube.
-                for mesh_coord in mesh_coords:
-                    cube.add_aux_coord(mesh_coord, mesh_dim)
-
-                # Process any associated formula terms and attach
-                # the corresponding AuxCoordFactory.
-                try:
-                    _load_aux_factory(engine, cube)
-                except ValueError as e:
-                    warnings.warn(
-                        "{}".format(e),
-                        category=iris.warnings.IrisLoadWarning,
-                    )
-
-                # Perform any user registered callback function.
-                cube = run_callback(callback, cube, cf_var, file_source)
-
-                # Callback mechanism may return None, which must not be yielded
-                if cube is None:
-                    continue
-
-                yield cube
+        yield from _load_file_source(file_source, engine, var_callback, callback)
 
 
 class ChunkControl(threading.local):
@@ -15,6 +15,8 @@ Also : `CF Conventions <https://cfconventions.org/>`_.
 """
 
 import collections
+from concurrent.futures import ThreadPoolExecutor
+import functools
 from itertools import repeat, zip_longest
 import os
 import os.path
@@ -22,6 +24,7 @@ import re
 import string
 import typing
 import warnings
+import zlib as _zlib
 
 import cf_units
 import dask
@@ -275,6 +278,110 @@ def _setncattr(variable, name, attribute):
 # but in the preferred order for coord/connectivity variables in the file.
 MESH_ELEMENTS = ("node", "edge", "face")
 
+# The maximum number of computed chunks of lazy data waiting to be written to a
+#  file, in a delayed save with a local dask scheduler.  This limits the memory
+#  used when computing the chunks is faster than writing them.
+WRITE_QUEUE_SIZE = 16
+
+
+def _store_queued(sources, targets, writer):
+    """Store the chunks of a delayed save through a queued writer, and close it.
+
+    If computing or writing any chunk fails, the writer is aborted, so that its
+    thread ends and the file is released.
+    """
+    try:
+        da.store(sources, targets, lock=False)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+
+
+# The target size of the file chunks chosen by ``chunksizes="auto"``.
+_AUTO_CHUNK_BYTES = 4 * 2**20
+
+# The size of the data sample compressed by ``complevel="auto"``.
+_AUTO_SAMPLE_BYTES = 2**20
+
+# The compression levels compared by ``complevel="auto"``.
+_AUTO_COMPLEVELS = (1, 3, 5, 9)
+
+
+def _auto_chunksizes(cube, access="map"):
+    """Choose the file chunk sizes for the data of a cube.
+
+    The chunks span the dimensions read together : the horizontal dimensions
+    for "map" access, or the time dimension for "timeseries" access.  They then
+    extend along the other dimensions, innermost first, up to a size of
+    ``_AUTO_CHUNK_BYTES``.  Chunks are never larger than the dask chunks of
+    lazy data, though they need not divide them exactly.
+
+    Returns ``None`` (i.e. the netCDF default) for scalar or non-numeric data.
+
+    """
+    axes = {"map": ("X", "Y"), "timeseries": ("T",)}.get(access)
+    if axes is None:
+        msg = f"'access' must be 'map' or 'timeseries', got {access!r}."
+        raise ValueError(msg)
+    if cube.ndim == 0 or cube.dtype.kind not in "biuf":
+        return None
+
+    data = cube.core_data()
+    limits = list(data.chunksize if is_lazy_data(data) else data.shape)
+    spanned = {
+        dim
+        for axis in axes
+        for coord in cube.coords(axis=axis)
+        for dim in cube.coord_dims(coord)
+    }
+    if not spanned:
+        # Assume the usual order of dimensions, e.g. (time, height, y, x).
+        spanned = set(range(cube.ndim)[-2:]) if access == "map" else {0}
+
+    target = max(_AUTO_CHUNK_BYTES // cube.dtype.itemsize, 1)
+    chunks = [limits[dim] if dim in spanned else 1 for dim in range(cube.ndim)]
+    # Halve the largest spanned dimension, while the chunk is too large.
+    while np.prod(chunks) > target:
+        dim = max(spanned, key=lambda dim: chunks[dim])
+        chunks[dim] = -(-chunks[dim] // 2)
+    # Extend along the other dimensions, while the chunk is small enough.
+    for dim in reversed(range(cube.ndim)):
+        if dim not in spanned:
+            chunks[dim] = max(1, min(limits[dim], target // int(np.prod(chunks))))
+    return tuple(int(size) for size in chunks)
+
+
+def _auto_complevel(cube, chunksizes=None, shuffle=True):
+    """Choose a zlib compression level for the data of a cube, from a sample.
+
+    The first file chunk of data, or else the first dask chunk of lazy data, is
+    compressed at each of ``_AUTO_COMPLEVELS``, and the lowest level is chosen
+    whose result is within 1% of the sample size of the best.  Returns 0 if the
+    data does not compress usefully.
+
+    """
+    data = cube.core_data()
+    shape = chunksizes or (data.chunksize if is_lazy_data(data) else data.shape)
+    sample = data[tuple(slice(0, size) for size in shape)]
+    if is_lazy_data(sample):
+        sample = sample.compute()
+    itemsize = max(sample.dtype.itemsize, 1)
+    sample = np.ravel(np.ma.getdata(sample))[: _AUTO_SAMPLE_BYTES // itemsize]
+    sample = np.ascontiguousarray(sample)
+    if sample.dtype.kind not in "biuf" or sample.size == 0:
+        return 0
+    raw = sample.view(np.uint8)
+    if shuffle:
+        # Emulate the HDF5 shuffle filter, which groups the bytes by significance.
+        raw = raw.reshape(-1, itemsize).T
+    raw = raw.tobytes()
+    sizes = {level: len(_zlib.compress(raw, level)) for level in _AUTO_COMPLEVELS}
+    best = min(sizes.values())
+    if best > 0.9 * len(raw):
+        return 0
+    return min(level for level, size in sizes.items() if size - best <= 0.01 * len(raw))
+
 
 class SaverFillValueWarning(iris.warnings.IrisSaverFillValueWarning):
     """Backwards compatible form of :class:`iris.warnings.IrisSaverFillValueWarning`."""
@@ -379,6 +486,11 @@ class Saver:
         # A list of delayed writes for lazy saving
         # a list of couples (source, target).
         self._delayed_writes = []
+        # The writer of the latest delayed completion, if it uses one.
+        self._writer = None
+        #: The chunking and compression settings chosen for each data variable
+        #: saved with `chunksizes="auto"` or `complevel="auto"`.
+        self.auto_settings = {}
 
         # Detect if we were passed a pre-opened dataset (or something like one)
         self._to_open_dataset = hasattr(filename, "createVariable")
@@ -407,6 +519,8 @@ class Saver:
             # Given a filepath string/path : create a dataset from that
             try:
                 self.filepath = os.path.abspath(filename)
+                # Release any read handle held on a file we are about to overwrite.
+                _thread_safe_nc.DATASET_POOL.discard(self.filepath)
                 self._dataset = _thread_safe_nc.DatasetWrapper(
                     self.filepath, mode="w", format=netcdf_format
                 )
@@ -451,6 +565,7 @@ class Saver:
         least_significant_digit=None,
         packing=None,
         fill_value=None,
+        access="map",
     ):
         """Wrap for saving cubes to a NetCDF file.
 
@@ -475,9 +590,12 @@ class Saver:
         zlib : bool, default=False
             If `True`, the data will be compressed in the netCDF file using
             gzip compression (default `False`).
-        complevel : int, default=4
+        complevel : int or "auto", default=4
             An integer between 1 and 9 describing the level of compression
             desired (default 4). Ignored if `zlib=False`.
+            If "auto", the level is chosen by compressing a sample of the data,
+            which is computed if lazy, and compression is turned off if the
+            sample does not compress usefully.
         shuffle : bool, default=True
             If `True`, the HDF5 shuffle filter will be applied before
             compressing the data (default `True`). This significantly improves
@@ -497,6 +615,8 @@ class Saver:
             Basically, you want the chunk size for each dimension to match
             as closely as possible the size of the data block that users will
             read from the file. `chunksizes` cannot be set if `contiguous=True`.
+            If "auto", the chunk sizes are chosen to suit the `access` pattern,
+            and to fit within the dask chunks of lazy data.
         endian : str, default="native"
             Used to control whether the data is stored in little or big endian
             format on disk. Possible values are 'little', 'big' or 'native'
@@ -536,6 +656,10 @@ class Saver:
             The value to use for the `_FillValue` attribute on the netCDF
             variable. If `packing` is specified the value of `fill_value`
             should be in the domain of the packed data.
+        access : str, default="map"
+            The expected way of reading the data, for `chunksizes="auto"` :
+            either "map", reading whole horizontal fields, or "timeseries",
+            reading all times at a few points.
 
         Returns
         -------
@@ -545,7 +669,11 @@ class Saver:
         -----
         The `zlib`, `complevel`, `shuffle`, `fletcher32`, `contiguous`,
         `chunksizes` and `endian` keywords are silently ignored for netCDF
-        3 files that do not use HDF5.
+        3 files that do not use HDF5, except that `chunksizes="auto"` or
+        `complevel="auto"` give a warning.
+
+        The settings chosen by `chunksizes="auto"` or `complevel="auto"` are
+        logged, and recorded in :attr:`auto_settings`.
 
         """
         # TODO: when iris.FUTURE.save_split_attrs defaults to True, we can deprecate the
@@ -585,6 +713,46 @@ class Saver:
         # data-vars in the file.
         cf_mesh_name = self._add_mesh(cube)
 
+        # Choose any "auto" chunking and compression settings.
+        auto_chunksizes = isinstance(chunksizes, str)
+        auto_complevel = isinstance(complevel, str)
+        for name, value in (("chunksizes", chunksizes), ("complevel", complevel)):
+            if isinstance(value, str) and value != "auto":
+                msg = f"{name!r} must be 'auto' if a string, got {value!r}."
+                raise ValueError(msg)
+        auto_settings = {}
+        if getattr(self._dataset, "data_model", "NETCDF4").startswith("NETCDF3"):
+            ignored = [
+                f'{name}="auto"'
+                for name, auto in (
+                    ("chunksizes", auto_chunksizes),
+                    ("complevel", auto_complevel),
+                )
+                if auto
+            ]
+            if ignored:
+                msg = (
+                    f"Ignoring {' and '.join(ignored)}, since "
+                    f"{self._dataset.data_model} files are not chunked or compressed."
+                )
+                warnings.warn(msg, category=iris.warnings.IrisSaveWarning)
+        else:
+            if auto_chunksizes:
+                chunksizes = None if contiguous else _auto_chunksizes(cube, access)
+                auto_settings["chunksizes"] = chunksizes
+            if auto_complevel and not zlib:
+                msg = 'Ignoring complevel="auto", since zlib=False.'
+                warnings.warn(msg, category=iris.warnings.IrisSaveWarning)
+            elif auto_complevel:
+                complevel = _auto_complevel(cube, chunksizes, shuffle)
+                zlib = complevel > 0
+                complevel = complevel or 4
+                auto_settings.update(zlib=zlib, complevel=complevel)
+        if isinstance(chunksizes, str):
+            chunksizes = None
+        if isinstance(complevel, str):
+            complevel = 4
+
         # Create the associated cube CF-netCDF data variable.
         cf_var_cube = self._create_cf_data_variable(
             cube,
@@ -602,6 +770,12 @@ class Saver:
             fill_value=fill_value,
         )
 
+        if auto_settings:
+            self.auto_settings[cf_var_cube.name] = auto_settings
+            logger.info(
+                f"Saving variable {cf_var_cube.name!r} with settings {auto_settings}."
+            )
+
         # Associate any mesh with the data-variable.
         # N.B. _add_mesh cannot do this, as we want to put mesh variables
         # before data-variables in the file.
@@ -2350,11 +2524,36 @@ class Saver:
         -----
         The dataset *must* be closed (saver has exited its context) before the
         result can be computed, otherwise computation will hang (never return).
+
+        With a local ("threads" or "single-threaded") dask scheduler, the data
+        chunks are computed in parallel and passed, through a queue of at most
+        :data:`WRITE_QUEUE_SIZE` chunks, to a single writer thread, which opens
+        the file only once, and which stops if any chunk fails.  The result
+        must then also be computed with a local scheduler : computing it with a
+        distributed scheduler raises a ``TypeError``, since the writer cannot be
+        sent to the workers.
+        Otherwise, each chunk is written by re-opening the file, under a
+        per-file lock.
         """
         if self._delayed_writes:
-            # Create a single delayed da.store operation to complete the file.
             sources, targets = zip(*self._delayed_writes)
-            result = da.store(sources, targets, compute=False, lock=False)
+            scheduler_type = _dask_locks.get_dask_array_scheduler_type()
+            if scheduler_type in ("threads", "single-threaded"):
+                # Create a delayed operation which stores the chunks through one
+                # writer, and waits for the writes to finish.
+                # N.B. the store is computed within the delayed operation, so
+                #  that the writer is also closed if any chunk fails.
+                self._writer = _thread_safe_nc.NetCDFQueuedWriter(
+                    self.filepath, maxsize=WRITE_QUEUE_SIZE
+                )
+                targets = [self._writer.target(target.varname) for target in targets]
+                result = dask.delayed(
+                    functools.partial(_store_queued, sources, targets, self._writer),
+                    pure=False,
+                )()
+            else:
+                # Create a single delayed da.store operation to complete the file.
+                result = da.store(sources, targets, compute=False, lock=False)
 
         else:
             # Return a do-nothing delayed, for usage consistency.
@@ -2380,7 +2579,12 @@ class Saver:
             raise ValueError(msg)
 
         # Complete the saves now
-        self.delayed_completion().compute()
+        try:
+            self.delayed_completion().compute()
+        finally:
+            if self._writer is not None:
+                # Release the file, if the computation failed.
+                self._writer.abort()
 
 
 def save(
@@ -2400,6 +2604,7 @@ def save(
     packing=None,
     fill_value=None,
     compute=True,
+    access="map",
 ):
     r"""Save cube(s) to a netCDF file, given the cube and the filename.
 
@@ -2455,9 +2660,10 @@ def save(
     zlib : bool, default=False
         If `True`, the data will be compressed in the netCDF file using gzip
         compression (default `False`).
-    complevel : int, default=4
+    complevel : int or "auto", default=4
         An integer between 1 and 9 describing the level of compression desired
-        (default 4). Ignored if `zlib=False`.
+        (default 4). Ignored if `zlib=False`.  If "auto", the level is chosen
+        by compressing a sample of the data, which is computed if lazy.
     shuffle : bool, default=True
         If `True`, the HDF5 shuffle filter will be applied before compressing
         the data (default `True`). This significantly improves compression.
@@ -2477,6 +2683,8 @@ def save(
         Basically, you want the chunk size for each dimension to match as
         closely as possible the size of the data block that users will read
         from the file. `chunksizes` cannot be set if `contiguous=True`.
+        If "auto", the chunk sizes are chosen to suit the `access` pattern, and
+        to fit within the dask chunks of lazy data.
     endian : str, default="native"
         Used to control whether the data is stored in little or big endian
         format on disk. Possible values are 'little', 'big' or 'native'
@@ -2539,6 +2747,10 @@ def save(
             This is because delayed saves may be performed in other processes : These
             must (re-)open the dataset for writing, which will fail if the file is
             still open for writing by the caller.
+    access : str, default="map"
+        The expected way of reading the data, for `chunksizes="auto"` : either
+        "map", reading whole horizontal fields, or "timeseries", reading all
+        times at a few points.
 
     Returns
     -------
@@ -2760,6 +2972,7 @@ def save(
                 least_significant_digit,
                 packing=packspec,
                 fill_value=fill_value,
+                access=access,
             )
 
         if iris.config.netcdf.conventions_override:
@@ -2801,6 +3014,138 @@ def save(
     return result
 
 
+def save_sharded(
+    cubes,
+    filename_template,
+    dim="time",
+    max_shard_bytes=2**30,
+    max_in_flight=2,
+    **kwargs,
+):
+    """Save cube(s) to a series of netCDF files, each holding part of a dimension.
+
+    The cubes are split along the dimension of a chosen coordinate into
+    "shards", each of which is saved to a separate file.  The shards are
+    saved one after another, with only a limited number being computed at
+    once, so the memory needed is set by the size of a shard rather than the
+    size of the cubes.
+
+    Parameters
+    ----------
+    cubes : :class:`iris.cube.Cube` or :class:`iris.cube.CubeList`
+        The cube(s) to save.  Every cube must map the coordinate ``dim`` to
+        one dimension, all of the same length.
+    filename_template : str
+        The name of each file, as a template for :meth:`str.format`, which is
+        given the number of the shard as ``index``, e.g. ``"out_{index:03d}.nc"``.
+    dim : str, default="time"
+        The name of the coordinate along whose dimension to split the cubes.
+    max_shard_bytes : int, default=2**30
+        The maximum size of the data of all the cubes in each shard.  A shard
+        always includes at least one point of the dimension.
+    max_in_flight : int, default=2
+        The maximum number of shards being computed and written at once.
+    **kwargs : dict, optional
+        Any other keywords are passed to :func:`save`, except ``compute``.
+
+    Returns
+    -------
+    list of dict
+        A manifest of the saved files, in order.  Each is described by a
+        dictionary with the ``"filename"``; the ``"start"`` and ``"stop"``
+        indices of the dimension; the ``"first"`` and ``"last"`` points of the
+        coordinate; and the ``"nbytes"`` of the cube data.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from iris.fileformats.netcdf import save_sharded
+
+        manifest = save_sharded(cubes, "tas_{index:04d}.nc", max_shard_bytes=10**8)
+
+    """
+    from iris.cube import Cube, CubeList
+
+    if isinstance(cubes, Cube):
+        cubes = [cubes]
+    cubes = CubeList(cubes)
+    if not cubes:
+        raise ValueError("Cannot save; no cubes.")
+    if max_in_flight < 1:
+        msg = f"'max_in_flight' must be at least 1, got {max_in_flight!r}."
+        raise ValueError(msg)
+    if filename_template.format(index=0) == filename_template.format(index=1):
+        # Otherwise every shard would overwrite the same file.
+        msg = (
+            "'filename_template' must contain an '{index}' field, "
+            f"got {filename_template!r}."
+        )
+        raise ValueError(msg)
+
+    # Find the split dimension of each cube.
+    cube_dims = []
+    for cube in cubes:
+        cube_dim = cube.coord_dims(dim)
+        if len(cube_dim) != 1:
+            msg = (
+                f"Cannot split cube {cube.name()!r} along coordinate {dim!r} : "
+                f"it maps to {len(cube_dim)} dimensions, not 1."
+            )
+            raise ValueError(msg)
+        cube_dims.append(cube_dim[0])
+    lengths = {cube.shape[cube_dim] for cube, cube_dim in zip(cubes, cube_dims)}
+    if len(lengths) != 1:
+        msg = f"Cannot split cubes along {dim!r} : the dimension lengths differ."
+        raise ValueError(msg)
+    (length,) = lengths
+
+    # Fix the number of points in each shard, from the data size of one point.
+    def data_nbytes(cube):
+        return 0 if cube.is_dataless() else cube.core_data().nbytes
+
+    point_nbytes = sum(data_nbytes(cube) for cube in cubes) / max(length, 1)
+    shard_length = max(1, int(max_shard_bytes // max(point_nbytes, 1)))
+    coord = cubes[0].coord(dim)
+
+    manifest = []
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        pending = collections.deque()
+        try:
+            for index, start in enumerate(range(0, length, shard_length)):
+                stop = min(start + shard_length, length)
+                if len(pending) >= max_in_flight:
+                    # Wait for the oldest shard before creating another.
+                    pending.popleft().result()
+                shard = CubeList()
+                for cube, cube_dim in zip(cubes, cube_dims):
+                    keys = [slice(None)] * cube.ndim
+                    keys[cube_dim] = slice(start, stop)
+                    shard.append(cube[tuple(keys)])
+                filename = filename_template.format(index=index)
+                delayed = save(shard, filename, compute=False, **kwargs)
+                pending.append(executor.submit(delayed.compute))
+                manifest.append(
+                    {
+                        "filename": filename,
+                        "start": start,
+                        "stop": stop,
+                        "first": coord.points[start].item(),
+                        "last": coord.points[stop - 1].item(),
+                        "nbytes": sum(data_nbytes(cube) for cube in shard),
+                    }
+                )
+            while pending:
+                pending.popleft().result()
+        except BaseException:
+            # Don't start any more shards after a failure.
+            for future in pending:
+                future.cancel()
+            raise
+
+    return manifest
+
+
 def save_mesh(mesh, filename, netcdf_format="NETCDF4"):
     """Save mesh(es) to a netCDF file.
 
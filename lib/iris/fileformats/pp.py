@@ -6,11 +6,15 @@
 
 from abc import ABCMeta, abstractmethod
 import collections
+import contextlib
 from copy import deepcopy
+from enum import Enum, auto
+import mmap
 import operator
 import os
 import re
 import struct
+import threading
 from typing import Any
 import warnings
 
@@ -21,10 +25,12 @@ import dask.array as da
 import numpy as np
 import numpy.ma as ma
 
+from iris._concurrency import ConcurrencyControl
 from iris._lazy_data import as_concrete_data, as_lazy_data, is_lazy_data
 import iris.config
 import iris.coord_systems
 import iris.exceptions
+from iris.fileformats._header_index import HEADER_INDEX
 
 # NOTE: this is for backwards-compatitibility *ONLY*
 # We could simply remove it for v2.0 ?
@@ -548,6 +554,105 @@ class SplittableInt:
         return self._compare(other, operator.ge)
 
 
+class PayloadMaps:
+    """A cache of read-only memory maps of the files containing field data.
+
+    These give direct access to unpacked field payloads, which then only read
+    those pages of the file which are actually needed.  Maps are shared
+    between all the fields of a file, and are re-made if the file changes.
+
+    Mapping is controlled by the single instance of this class, the
+    :data:`PAYLOAD_MAPS` object, and is disabled by default.
+
+    .. note::
+
+        A mapped file stays open until its map is released, which on Windows
+        prevents it being deleted or replaced, and a mapped file must not be
+        truncated or rewritten in place while it is being read.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from iris.fileformats.pp import PAYLOAD_MAPS
+
+        with PAYLOAD_MAPS.set(maxsize=32):
+            data = iris.load_cube(pp_files).data
+
+    """
+
+    def __init__(self, maxsize=0):
+        #: The maximum number of files kept mapped.  If 0, mapping is disabled.
+        self.maxsize = maxsize
+        self._maps = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} maxsize={self.maxsize}>"
+
+    @contextlib.contextmanager
+    def set(self, maxsize):
+        """Map up to the given number of files, within a context.
+
+        Any maps beyond the previous :attr:`maxsize` are released on exit.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of files kept mapped.  If 0, mapping is disabled.
+
+        """
+        old_maxsize = self.maxsize
+        self.maxsize = maxsize
+        try:
+            yield
+        finally:
+            self.maxsize = old_maxsize
+            with self._lock:
+                self._trim()
+
+    def _trim(self):
+        # Release the least recently used maps, beyond the maximum number.
+        while len(self._maps) > self.maxsize:
+            self._maps.popitem(last=False)
+
+    def get(self, path):
+        """Return a uint8 memmap of the whole file, or None if unavailable."""
+        if not self.maxsize:
+            return None
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError, ValueError):
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with self._lock:
+            entry = self._maps.get(path)
+            if entry is not None and entry[0] == signature:
+                self._maps.move_to_end(path)
+                return entry[1]
+        if stat.st_size == 0:
+            return None
+        try:
+            file_map = np.memmap(path, dtype=np.uint8, mode="r")
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            self._maps[path] = (signature, file_map)
+            self._maps.move_to_end(path)
+            self._trim()
+        return file_map
+
+    def clear(self):
+        """Release all the file maps."""
+        with self._lock:
+            self._maps.clear()
+
+
+#: The control of the memory maps used to read unpacked field data.
+#:  Disabled by default : enable with e.g. ``PAYLOAD_MAPS.set(maxsize=32)``.
+PAYLOAD_MAPS = PayloadMaps()
+
+
 class PPDataProxy:
     """A reference to the data payload of a single PP field."""
 
@@ -560,6 +665,7 @@ class PPDataProxy:
         "_lbpack",
         "boundary_packing",
         "mdi",
+        "_has_mdi",
     )
 
     def __init__(
@@ -581,6 +687,8 @@ class PPDataProxy:
         self.lbpack = lbpack
         self.boundary_packing = boundary_packing
         self.mdi = mdi
+        # Whether the mapped field contains any missing data, once known.
+        self._has_mdi = None
 
     # lbpack
     @property
@@ -611,18 +719,60 @@ class PPDataProxy:
     def dask_meta(self):
         return np.empty((0,) * self.ndim, dtype=self.dtype)
 
+    def _mapped_payload(self):
+        """Return a read-only view of unpacked data on a file map, or None.
+
+        The view is in the byte order of the file.
+
+        """
+        lbpack = self.lbpack
+        if (
+            lbpack.n1 not in (0, 2)
+            or lbpack.n2 == 2
+            or self.boundary_packing is not None
+        ):
+            return None
+        n_values = int(np.prod(self.shape))
+        n_bytes = n_values * self.src_dtype.itemsize
+        # N.B. the payload may be longer than needed, as padded by mule.
+        if n_bytes == 0 or self.data_len < n_bytes:
+            return None
+        file_map = PAYLOAD_MAPS.get(self.path)
+        if file_map is None or self.offset + n_bytes > len(file_map):
+            return None
+        payload = file_map[self.offset : self.offset + n_bytes]
+        return payload.view(self.src_dtype).reshape(self.shape)
+
+    def _unpack(self, data_bytes):
+        """Convert the payload bytes of the field into a shaped array."""
+        return _data_bytes_to_shaped_array(
+            data_bytes,
+            self.lbpack,
+            self.boundary_packing,
+            self.shape,
+            self.src_dtype,
+            self.mdi,
+        )
+
     def __getitem__(self, keys):
+        payload = self._mapped_payload()
+        if payload is not None:
+            # Copy out only the requested points, converting to native byte
+            # order at the same time.
+            result = np.array(payload[keys], dtype=self.dtype)
+            # N.B. mask according to the whole field, so that every part of
+            # it is a masked array if any of it is missing.  The field is only
+            # checked once, rather than for every part read.
+            if self._has_mdi is None:
+                self._has_mdi = bool(self.mdi in payload)
+            if self._has_mdi:
+                result = ma.masked_values(result, self.mdi, copy=False)
+            return result
+
         with open(self.path, "rb") as pp_file:
             pp_file.seek(self.offset, os.SEEK_SET)
             data_bytes = pp_file.read(self.data_len)
-            data = _data_bytes_to_shaped_array(
-                data_bytes,
-                self.lbpack,
-                self.boundary_packing,
-                self.shape,
-                self.src_dtype,
-                self.mdi,
-            )
+            data = self._unpack(data_bytes)
         result = data.__getitem__(keys)
 
         return np.asanyarray(result, dtype=self.dtype)
@@ -637,19 +787,25 @@ class PPDataProxy:
 
     def __getstate__(self):
         # Because we have __slots__, this is needed to support Pickle.dump()
-        return [(name, getattr(self, name)) for name in self.__slots__]
+        # (The cached missing data check is left out, and made afresh.)
+        return [(name, getattr(self, name)) for name in self._state_slots()]
 
     def __setstate__(self, state):
         # Because we have __slots__, this is needed to support Pickle.load()
         # (Use setattr, as there is no object dictionary.)
+        self._has_mdi = None
         for key, value in state:
             setattr(self, key, value)
 
+    @classmethod
+    def _state_slots(cls):
+        return [name for name in cls.__slots__ if name != "_has_mdi"]
+
     def __eq__(self, other):
         result = NotImplemented
         if isinstance(other, PPDataProxy):
             result = True
-            for attr in self.__slots__:
+            for attr in self._state_slots():
                 if getattr(self, attr) != getattr(other, attr):
                     result = False
                     break
@@ -662,6 +818,216 @@ class PPDataProxy:
         return result
 
 
+def _decompress_wgdos(data_bytes, data_shape, mdi):
+    """Unpack a WGDOS packed field payload."""
+    if mo_pack is None:
+        msg = "Unpacking PP fields with LBPACK of 1 requires mo_pack to be installed"
+        raise ValueError(msg)
+    try:
+        decompress_wgdos = mo_pack.decompress_wgdos
+    except AttributeError:
+        decompress_wgdos = mo_pack.unpack_wgdos
+    return decompress_wgdos(data_bytes, data_shape[0], data_shape[1], mdi)
+
+
+def _decompress_rle(data_bytes, data_shape, mdi):
+    """Unpack a run-length encoded field payload.
+
+    Uses mo_pack if available, otherwise a numpy implementation.
+
+    """
+    if mo_pack is not None and hasattr(mo_pack, "decompress_rle"):
+        return mo_pack.decompress_rle(data_bytes, data_shape[0], data_shape[1], mdi)
+    return _decompress_rle_numpy(data_bytes, data_shape, mdi)
+
+
+def _decompress_rle_numpy(data_bytes, data_shape, mdi):
+    """Unpack a run-length encoded field payload, with numpy only.
+
+    In the packed form, each run of missing data points is replaced by a
+    single MDI value, followed by the length of the run.
+
+    """
+    packed = np.frombuffer(data_bytes, dtype=">f4")
+    mdi = np.array(mdi, dtype=packed.dtype)
+    repeats = np.ones(packed.shape, dtype=np.intp)
+    i_count = -1
+    for i_mdi in np.flatnonzero(packed == mdi):
+        if i_mdi == i_count:
+            # This is the length of the previous run, which happens to match.
+            continue
+        i_count = i_mdi + 1
+        if i_count == packed.size:
+            raise ValueError("Run-length encoded PP data ends without a run length.")
+        repeats[i_mdi] = int(packed[i_count])
+        repeats[i_count] = 0
+    return np.repeat(packed, repeats).astype(np.float32)
+
+
+#: Functions which unpack packed PP field payloads, by the value of lbpack.n1.
+#: Each is called as ``unpacker(data_bytes, data_shape, mdi)``, and returns an
+#: array of the field values.  Unpacked payloads (lbpack.n1 of 0 or 2) are
+#: handled directly.
+UNPACKERS = {
+    1: _decompress_wgdos,
+    4: _decompress_rle,
+}
+
+
+def _unpack_payload(proxy, data_bytes):
+    """Unpack the payload of a field, possibly in a worker."""
+    return np.asanyarray(proxy._unpack(data_bytes), dtype=proxy.dtype)
+
+
+class UnpackConcurrency(ConcurrencyControl):
+    """Control the concurrency of unpacking packed PP field payloads.
+
+    This is controlled by the single instance of this: the
+    :data:`~iris.fileformats.pp.UNPACK_CONCURRENCY` object.
+
+    It applies where the payloads of several fields are unpacked together, as
+    when realising the data of a structured UM load.  By default, they are
+    unpacked one at a time, within the calling thread.  Other modes unpack
+    them in parallel, in a pool of threads or of worker processes.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from iris.fileformats.pp import UNPACK_CONCURRENCY
+
+        with UNPACK_CONCURRENCY.set("THREADS", max_workers=8):
+            data = cube.data
+
+    """
+
+    class Modes(Enum):
+        """Modes Enums."""
+
+        #: Payloads are unpacked in turn, in the calling thread.
+        SERIAL = auto()
+        #: Payloads are unpacked in a pool of threads.
+        THREADS = auto()
+        #: Payloads are unpacked in a pool of worker processes.
+        #: N.B. workers only see the :data:`UNPACKERS` set up on import.
+        PROCESSES = auto()
+
+    _THREAD_NAME_PREFIX = "iris-pp-unpack"
+
+    def __init__(self):
+        super().__init__(self.Modes.SERIAL)
+
+    def unpack(self, proxies, payloads):
+        """Unpack field payloads, according to the current mode.
+
+        Parameters
+        ----------
+        proxies : list of :class:`PPDataProxy`
+            The fields.
+        payloads : list of bytes
+            The payload of each field.
+
+        Returns
+        -------
+        list of :class:`numpy.ndarray`
+
+        """
+        if self.mode is self.Modes.SERIAL or len(proxies) < 2:
+            result = list(map(_unpack_payload, proxies, payloads))
+        else:
+            executor = self._get_executor()
+            result = list(executor.map(_unpack_payload, proxies, payloads))
+        return result
+
+
+#: The control for the concurrency of PP payload unpacking.
+UNPACK_CONCURRENCY = UnpackConcurrency()
+
+
+#: The largest gap, in bytes, between the payloads of successive fields in a
+#: file which are still fetched with a single read.
+_MAX_COALESCED_READ_GAP = 64 * 1024
+
+
+def _read_proxies(proxies):
+    """Read the data of several fields with a single read of their file.
+
+    The proxies must all reference the same file, in order of increasing
+    offset, without overlapping.  Returns a tuple of arrays, one per proxy.
+
+    """
+    start = proxies[0].offset
+    stop = proxies[-1].offset + proxies[-1].data_len
+    with open(proxies[0].path, "rb") as pp_file:
+        pp_file.seek(start, os.SEEK_SET)
+        buffer = pp_file.read(stop - start)
+    payloads = []
+    for proxy in proxies:
+        position = proxy.offset - start
+        payloads.append(buffer[position : position + proxy.data_len])
+    # Packed payloads are unpacked as a batch, possibly in parallel.
+    i_packed = [i for i, proxy in enumerate(proxies) if proxy.lbpack.n1 in UNPACKERS]
+    result = [None] * len(proxies)
+    arrays = UNPACK_CONCURRENCY.unpack(
+        [proxies[i] for i in i_packed], [payloads[i] for i in i_packed]
+    )
+    for i_proxy, array in zip(i_packed, arrays):
+        result[i_proxy] = array
+    for i_proxy, proxy in enumerate(proxies):
+        if result[i_proxy] is None:
+            result[i_proxy] = _unpack_payload(proxy, payloads[i_proxy])
+    return tuple(result)
+
+
+def _coalesced_lazy_arrays(fields):
+    """Return the lazy data arrays of fields, fetching neighbouring fields together.
+
+    Successive fields with deferred payloads lying close together in the same
+    file are read by a single task, which makes one contiguous read and then
+    unpacks all the payloads.  The array of each field is then a chunk taken
+    from the result of that task, so computing the data of many fields makes
+    a few large sequential reads instead of many small ones.
+
+    Fields which cannot be read in this way keep their own lazy data.
+
+    """
+    max_bytes = dask.utils.parse_bytes(dask.config.get("array.chunk-size"))
+
+    # Gather runs of neighbouring field payloads.
+    runs = []
+    for field in fields:
+        proxy = getattr(field, "_data_proxy", None)
+        run = runs[-1] if runs else None
+        if (
+            proxy is not None
+            and run is not None
+            and run[0][1] is not None
+            and proxy.path == run[0][1].path
+            and proxy.shape == run[0][1].shape
+            and proxy.dtype == run[0][1].dtype
+        ):
+            last = run[-1][1]
+            gap = proxy.offset - (last.offset + last.data_len)
+            span = proxy.offset + proxy.data_len - run[0][1].offset
+            if 0 <= gap <= _MAX_COALESCED_READ_GAP and span <= max_bytes:
+                run.append((field, proxy))
+                continue
+        runs.append([(field, proxy)])
+
+    arrays = []
+    for run in runs:
+        if len(run) == 1:
+            arrays.append(as_lazy_data(run[0][0].core_data()))
+            continue
+        proxies = [proxy for _, proxy in run]
+        fetch = dask.delayed(_read_proxies)(proxies)
+        for i_field, proxy in enumerate(proxies):
+            arrays.append(
+                da.from_delayed(fetch[i_field], proxy.shape, meta=proxy.dask_meta)
+            )
+    return arrays
+
+
 def _data_bytes_to_shaped_array(
     data_bytes, lbpack, boundary_packing, data_shape, data_type, mdi, mask=None
 ):
@@ -672,29 +1038,8 @@ def _data_bytes_to_shaped_array(
     """
     if lbpack.n1 in (0, 2):
         data = np.frombuffer(data_bytes, dtype=data_type)
-    elif lbpack.n1 == 1:
-        if mo_pack is not None:
-            try:
-                decompress_wgdos = mo_pack.decompress_wgdos
-            except AttributeError:
-                decompress_wgdos = mo_pack.unpack_wgdos
-        else:
-            msg = (
-                "Unpacking PP fields with LBPACK of {} "
-                "requires mo_pack to be installed".format(lbpack.n1)
-            )
-            raise ValueError(msg)
-        data = decompress_wgdos(data_bytes, data_shape[0], data_shape[1], mdi)
-    elif lbpack.n1 == 4:
-        if mo_pack is not None and hasattr(mo_pack, "decompress_rle"):
-            decompress_rle = mo_pack.decompress_rle
-        else:
-            msg = (
-                "Unpacking PP fields with LBPACK of {} "
-                "requires mo_pack to be installed".format(lbpack.n1)
-            )
-            raise ValueError(msg)
-        data = decompress_rle(data_bytes, data_shape[0], data_shape[1], mdi)
+    elif lbpack.n1 in UNPACKERS:
+        data = UNPACKERS[lbpack.n1](data_bytes, data_shape, mdi)
     else:
         raise iris.exceptions.NotYetImplementedError(
             "PP fields with LBPACK of %s are not yet supported." % lbpack
@@ -847,6 +1192,7 @@ def _pp_attribute_names(header_defn):
         "raw_lbpack",
         "boundary_packing",
         "_index_in_structured_load_file",
+        "_data_proxy",
     ]
     return normal_headers + special_headers + extra_data + special_attributes
 
@@ -882,6 +1228,8 @@ class PPField(metaclass=ABCMeta):
         self.raw_lbpack = None
         self.boundary_packing = None
         self._index_in_structured_load_file = None
+        # The PPDataProxy of deferred data, if any.
+        self._data_proxy = None
         if header is not None:
             self.raw_lbtim = header[self.HEADER_DICT["lbtim"][0]]
             self.raw_lbpack = header[self.HEADER_DICT["lbpack"][0]]
@@ -1085,6 +1433,7 @@ class PPField(metaclass=ABCMeta):
     @data.setter
     def data(self, value):
         self._data = value
+        self._data_proxy = None
 
     def core_data(self):
         return self._data
@@ -1449,6 +1798,9 @@ class PPField(metaclass=ABCMeta):
         if isinstance(other, PPField):
             result = True
             for attr in self.__slots__:
+                if attr == "_data_proxy":
+                    # Only a record of where the data came from.
+                    continue
                 attrs = [hasattr(self, attr), hasattr(other, attr)]
                 if all(attrs):
                     self_attr = getattr(self, attr)
@@ -1662,6 +2014,24 @@ def load(filename, read_data=False, little_ended=False):
     )
 
 
+def _load_prefiltered(
+    filename, read_data=False, little_ended=False, header_filter=None
+):
+    """Return an iterator of PPFields, as :func:`load`, but with a header filter.
+
+    See :func:`_field_gen` for details of `header_filter`.
+
+    """
+    return _interpret_fields(
+        _field_gen(
+            filename,
+            read_data_bytes=read_data,
+            little_ended=little_ended,
+            header_filter=header_filter,
+        )
+    )
+
+
 def _interpret_fields(fields):
     """Turn the fields read with load and FF2PP._extract_field into usable fields.
 
@@ -1776,6 +2146,8 @@ def _create_field_data(field, data_shape, land_mask_field=None):
             # For a "normal" (non-landsea-masked) field, the proxy can be
             # wrapped directly as a deferred array.
             field.data = as_lazy_data(proxy, meta=proxy.dask_meta, chunks=block_shape)
+            if 0 not in data_shape:
+                field._data_proxy = proxy
         else:
             # This is a landsea-masked field, and its data must be handled in
             # a different way :  Because data shape/size is not known in
@@ -1836,126 +2208,232 @@ def _create_field_data(field, data_shape, land_mask_field=None):
             field.data = lazy_result_array
 
 
-def _field_gen(filename, read_data_bytes, little_ended=False):
-    """Return generator of "half-formed" PPField instances derived from given filename.
+def _header_dtype():
+    """Make a structured dtype for PP headers, with one named field per word.
 
-    A field returned by the generator is only "half-formed" because its
-    `_data` attribute represents a simple one-dimensional stream of
-    bytes. (Encoded either as an instance of LoadedArrayBytes or as a
-    'deferred array bytes' tuple, depending on the value of `read_data_bytes`.)
-    This is because fields encoded with a land/sea mask do not contain
-    sufficient information within the field to determine the final
-    two-dimensional shape of the data.
+    Single-word elements take their header release 3 names, e.g. "lbproc", and
+    multi-word ones are numbered from 1, e.g. "lbuser1" to "lbuser7".
 
-    The callers of this routine are the 'load' routines (both PP and FF).
-    They both filter the resulting stream of fields with `_interpret_fields`,
-    which replaces each field.data with an actual array (real or lazy).
-    This is done separately so that `_interpret_fields` can detect land-mask
-    fields and use them to construct data arrays for any fields which use
-    land/sea-mask packing.
+    """
+    names = []
+    for name, positions in UM_HEADER_3:
+        if len(positions) == 1:
+            names.append(name)
+        else:
+            names.extend(f"{name}{i_word}" for i_word in range(1, len(positions) + 1))
+    formats = ["i4"] * NUM_LONG_HEADERS + ["f4"] * NUM_FLOAT_HEADERS
+    return np.dtype({"names": names, "formats": formats})
+
+
+#: A structured dtype for a PP header, i.e. each field is a single header word.
+_PP_HEADER_DTYPE = _header_dtype()
+
+# Total length in bytes of the header record, plus the following length word.
+_PP_HEADER_RECORD_DEPTH = PP_HEADER_DEPTH + 3 * PP_WORD_DEPTH
+
+
+def _header_array(words):
+    """View an (N, 64) array of native-endian header words as structured records."""
+    return np.ascontiguousarray(words).view(_PP_HEADER_DTYPE).reshape(-1)
+
+
+def _scan_headers(filename, little_ended=False):
+    """Read the headers and data locations of all the fields in a PP file.
+
+    This reads only the header records and length words, by mapping the file
+    into memory, and gathers all the headers with a single array operation.
+
+    Returns
+    -------
+    headers : dict of str: ndarray
+        An (N, 64) array of native-endian header "words" (int32 values, of
+        which the final 19 are really float32), plus arrays of "data_offsets",
+        "data_lengths" and "extra_lengths" in bytes, all of length N.
+    complete : bool
+        Whether the whole file was successfully scanned.  If not, a warning
+        was issued and the result includes only the fields before the problem.
 
     """
-    dtype_endian_char = "<" if little_ended else ">"
+    endian = "<" if little_ended else ">"
+    read_word = struct.Struct("%ci" % endian).unpack_from
+    read_length = struct.Struct("%cL" % endian).unpack_from
+    i_lbrel = UM_HEADER_3.index(("lbrel", (22,)))
+    header_starts, data_offsets, data_lengths, extra_lengths = [], [], [], []
+    complete = False
     with open(filename, "rb") as pp_file:
-        # Get a reference to the seek method on the file
-        # (this is accessed 3* #number of headers so can provide a small
-        # performance boost)
-        pp_file_seek = pp_file.seek
-        pp_file_read = pp_file.read
-
+        try:
+            buffer = mmap.mmap(pp_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Cannot map an empty file.
+            buffer = b""
+        file_size = len(buffer)
+        position = 0
         field_count = 0
-        # Keep reading until we reach the end of file
         while True:
-            # Move past the leading header length word
-            pp_file_seek(PP_WORD_DEPTH, os.SEEK_CUR)
-            # Get the LONG header entries
-            dtype = "%ci%d" % (dtype_endian_char, PP_WORD_DEPTH)
-            header_longs = np.fromfile(pp_file, dtype=dtype, count=NUM_LONG_HEADERS)
-            # Nothing returned => EOF
-            if len(header_longs) == 0:
+            # Skip the leading header length word.
+            header_start = position + PP_WORD_DEPTH
+            if header_start >= file_size:
+                # Nothing left => EOF.  The scan is complete unless the last
+                # field was cut short.
+                complete = position == file_size
                 break
-            # Get the FLOAT header entries
-            dtype = "%cf%d" % (dtype_endian_char, PP_WORD_DEPTH)
-            header_floats = np.fromfile(pp_file, dtype=dtype, count=NUM_FLOAT_HEADERS)
-            header = tuple(header_longs) + tuple(header_floats)
-
-            # Make a PPField of the appropriate sub-class (depends on header
-            # release number)
-            try:
-                pp_field = make_pp_field(header)
-            except ValueError as e:
+            if header_start + PP_HEADER_DEPTH > file_size:
+                problem = "Truncated header"
+            else:
+                lbrel = read_word(buffer, header_start + i_lbrel * PP_WORD_DEPTH)[0]
+                problem = None
+                if lbrel not in PP_CLASSES:
+                    problem = "Unsupported header release number: {}".format(lbrel)
+                elif position + _PP_HEADER_RECORD_DEPTH > file_size:
+                    problem = "Truncated header"
+            if problem:
                 msg = (
                     "Unable to interpret field {}. {}. Skipping "
-                    "the remainder of the file.".format(field_count, str(e))
-                )
-                warnings.warn(
-                    msg,
-                    category=_WarnComboIgnoringLoad,
+                    "the remainder of the file.".format(field_count, problem)
                 )
+                warnings.warn(msg, category=_WarnComboIgnoringLoad)
                 break
 
-            # Skip the trailing 4-byte word containing the header length
-            pp_file_seek(PP_WORD_DEPTH, os.SEEK_CUR)
-
             # Read the word telling me how long the data + extra data is
             # This value is # of bytes
-            len_of_data_plus_extra = struct.unpack_from(
-                "%cL" % dtype_endian_char, pp_file_read(PP_WORD_DEPTH)
+            len_of_data_plus_extra = read_length(
+                buffer, position + _PP_HEADER_RECORD_DEPTH - PP_WORD_DEPTH
             )[0]
-            if len_of_data_plus_extra != pp_field.lblrec * PP_WORD_DEPTH:
+            lblrec = read_word(buffer, header_start + 14 * PP_WORD_DEPTH)[0]
+            if len_of_data_plus_extra != lblrec * PP_WORD_DEPTH:
                 wmsg = (
                     "LBLREC has a different value to the integer recorded "
                     "after the header in the file ({} and {}). "
                     "Skipping the remainder of the file."
                 )
                 warnings.warn(
-                    wmsg.format(
-                        pp_field.lblrec * PP_WORD_DEPTH, len_of_data_plus_extra
-                    ),
+                    wmsg.format(lblrec * PP_WORD_DEPTH, len_of_data_plus_extra),
                     category=_WarnComboIgnoringLoad,
                 )
                 break
 
             # calculate the extra length in bytes
-            extra_len = pp_field.lbext * PP_WORD_DEPTH
+            lbext = read_word(buffer, header_start + 19 * PP_WORD_DEPTH)[0]
+            extra_len = lbext * PP_WORD_DEPTH
+
+            header_starts.append(header_start)
+            data_offsets.append(position + _PP_HEADER_RECORD_DEPTH)
+            data_lengths.append(len_of_data_plus_extra - extra_len)
+            extra_lengths.append(extra_len)
+            # Skip the data, extra data and the final length word.
+            position += _PP_HEADER_RECORD_DEPTH + len_of_data_plus_extra + PP_WORD_DEPTH
+            field_count += 1
 
-            # Derive size and datatype of payload
-            data_len = len_of_data_plus_extra - extra_len
-            dtype = LBUSER_DTYPE_LOOKUP.get(
-                pp_field.lbuser[0], LBUSER_DTYPE_LOOKUP["default"]
-            )
-            if little_ended:
-                # Change data dtype for a little-ended file.
-                dtype = str(dtype)
-                if dtype[0] != ">":
-                    msg = "Unexpected dtype {!r} can't be converted to little-endian"
-                    raise ValueError(msg)
+        # Gather all the headers at once.
+        all_words = np.frombuffer(
+            buffer, dtype="%ci4" % endian, count=file_size // PP_WORD_DEPTH
+        )
+        word_indices = np.array(header_starts, dtype=np.int64) // PP_WORD_DEPTH
+        words = all_words[word_indices[:, np.newaxis] + np.arange(64)].astype("=i4")
+        del all_words
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+
+    headers = {
+        "words": words,
+        "data_offsets": np.array(data_offsets, dtype=np.int64),
+        "data_lengths": np.array(data_lengths, dtype=np.int64),
+        "extra_lengths": np.array(extra_lengths, dtype=np.int64),
+    }
+    return headers, complete
+
+
+def _field_gen(filename, read_data_bytes, little_ended=False, header_filter=None):
+    """Return generator of "half-formed" PPField instances derived from given filename.
 
-                dtype = np.dtype("<" + dtype[1:])
+    A field returned by the generator is only "half-formed" because its
+    `_data` attribute represents a simple one-dimensional stream of
+    bytes. (Encoded either as an instance of LoadedArrayBytes or as a
+    'deferred array bytes' tuple, depending on the value of `read_data_bytes`.)
+    This is because fields encoded with a land/sea mask do not contain
+    sufficient information within the field to determine the final
+    two-dimensional shape of the data.
+
+    The callers of this routine are the 'load' routines (both PP and FF).
+    They both filter the resulting stream of fields with `_interpret_fields`,
+    which replaces each field.data with an actual array (real or lazy).
+    This is done separately so that `_interpret_fields` can detect land-mask
+    fields and use them to construct data arrays for any fields which use
+    land/sea-mask packing.
 
+    If given, `header_filter` is called with a structured array of all the
+    field headers (see :func:`_header_array`), and must return a boolean mask
+    of the fields to keep.  Fields are only created for those.
+
+    """
+    index_kind = "pp<" if little_ended else "pp>"
+    headers = HEADER_INDEX.lookup(filename, index_kind)
+    if headers is None:
+        headers, complete = _scan_headers(filename, little_ended=little_ended)
+        # Only index files which were read completely, without problems.
+        if complete:
+            HEADER_INDEX.store(filename, index_kind, **headers)
+
+    if header_filter is not None and len(headers["words"]):
+        keep = header_filter(_header_array(headers["words"]))
+        headers = {name: array[keep] for name, array in headers.items()}
+
+    yield from _fields_from_headers(filename, headers, read_data_bytes, little_ended)
+
+
+def _payload_dtype(pp_field, little_ended=False):
+    """Return the datatype of a field payload, as stored in the file."""
+    dtype = LBUSER_DTYPE_LOOKUP.get(pp_field.lbuser[0], LBUSER_DTYPE_LOOKUP["default"])
+    if little_ended:
+        # Change data dtype for a little-ended file.
+        dtype = str(dtype)
+        if dtype[0] != ">":
+            msg = "Unexpected dtype {!r} can't be converted to little-endian"
+            raise ValueError(msg)
+
+        dtype = np.dtype("<" + dtype[1:])
+    return dtype
+
+
+def _fields_from_headers(filename, headers, read_data_bytes, little_ended=False):
+    """Return generator of "half-formed" PPFields, from pre-read headers.
+
+    Only reads the file to fetch data, or "extra data" vectors.
+
+    """
+    words = headers["words"]
+    longs = words[:, :NUM_LONG_HEADERS]
+    floats = words[:, NUM_LONG_HEADERS:].view("=f4")
+    extra_lengths = headers["extra_lengths"]
+    with contextlib.ExitStack() as stack:
+        if read_data_bytes or np.any(extra_lengths):
+            pp_file = stack.enter_context(open(filename, "rb"))
+        for header_longs, header_floats, data_offset, data_len, extra_len in zip(
+            longs,
+            floats,
+            headers["data_offsets"].tolist(),
+            headers["data_lengths"].tolist(),
+            extra_lengths.tolist(),
+        ):
+            pp_field = make_pp_field(tuple(header_longs) + tuple(header_floats))
+            dtype = _payload_dtype(pp_field, little_ended)
             if read_data_bytes:
                 # Read the actual bytes. This can then be converted to a numpy
                 # array at a higher level.
+                pp_file.seek(data_offset)
                 pp_field.data = LoadedArrayBytes(pp_file.read(data_len), dtype)
             else:
                 # Provide enough context to read the data bytes later on,
                 # as a 'deferred array bytes' tuple.
                 # N.B. this used to be a namedtuple called DeferredArrayBytes,
                 # but it no longer is. Possibly for performance reasons?
-                pp_field.data = (filename, pp_file.tell(), data_len, dtype)
-                # Seek over the actual data payload.
-                pp_file_seek(data_len, os.SEEK_CUR)
-
+                pp_field.data = (filename, data_offset, data_len, dtype)
             # Do we have any extra data to deal with?
             if extra_len:
+                pp_file.seek(data_offset + data_len)
                 pp_field._read_extra_data(
-                    pp_file, pp_file_read, extra_len, little_ended=little_ended
+                    pp_file, pp_file.read, extra_len, little_ended=little_ended
                 )
-
-            # Skip that last 4 byte record telling me the length of the field I
-            # have already read
-            pp_file_seek(PP_WORD_DEPTH, os.SEEK_CUR)
-            field_count += 1
             yield pp_field
 
 
@@ -1963,6 +2441,54 @@ def _field_gen(filename, read_data_bytes, little_ended=False):
 _STASH_ALLOW = [STASH(1, 0, 33), STASH(1, 0, 1)]
 
 
+class _StashFilter:
+    """A filter of PP fields by STASH code, from the STASH load constraints.
+
+    This is picklable, unless any STASH constraint is an arbitrary callable,
+    so that it can be passed to worker processes for parallel loading.
+
+    """
+
+    def __init__(self):
+        # The STASH objects or codes, and any callables, of the constraints.
+        self.stash_codes = []
+        self.stash_funcs = []
+
+    def stash_filter(self, stash):
+        """Return True if a field with this STASH is to be kept."""
+        res = True
+        if stash not in _STASH_ALLOW and (self.stash_codes or self.stash_funcs):
+            code = str(stash)
+            res = any(code == stashobj for stashobj in self.stash_codes) or any(
+                call_func(code) for call_func in self.stash_funcs
+            )
+        return res
+
+    def __call__(self, field):
+        """Return True if field is to be kept, False if field does not match filter."""
+        return self.stash_filter(field.stash)
+
+    def header_mask(self, headers):
+        """Return a boolean mask of the fields to keep, from an array of headers.
+
+        The mask form is applied to the file headers, before fields are created.
+        Each distinct STASH code is tested only once.  Any land-mask fields are
+        also kept, as other fields may need them to decode their data.
+
+        """
+        codes = np.stack([headers["lbuser7"], headers["lbuser4"]], axis=-1)
+        unique_codes, inverse = np.unique(codes, axis=0, return_inverse=True)
+        keep = np.array(
+            [
+                self.stash_filter(STASH(model, lbuser4 // 1000, lbuser4 % 1000))
+                or (model, lbuser4) == (1, 30)
+                for model, lbuser4 in unique_codes.tolist()
+            ],
+            dtype=bool,
+        )
+        return keep[inverse.reshape(-1)]
+
+
 def _convert_constraints(constraints):
     """Convert known constraints from Iris semantics to PP semantics.
 
@@ -1971,13 +2497,9 @@ def _convert_constraints(constraints):
 
     """
     constraints = iris._constraints.list_of_constraints(constraints)
-    pp_constraints = {}
+    pp_filter = _StashFilter()
     unhandled_constraints = False
 
-    def _make_func(stashobj):
-        """Provide unique name-space for each lambda function's stashobj variable."""
-        return lambda stash: stash == stashobj
-
     for con in constraints:
         if isinstance(con, iris.AttributeConstraint) and list(
             con._attributes.keys()
@@ -1987,37 +2509,20 @@ def _convert_constraints(constraints):
             # callable.
             stashobj = con._attributes["STASH"]
             if callable(stashobj):
-                call_func = stashobj
+                pp_filter.stash_funcs.append(stashobj)
             elif isinstance(stashobj, (str, STASH)):
-                call_func = _make_func(stashobj)
+                pp_filter.stash_codes.append(stashobj)
             else:
                 raise TypeError(
                     "STASH constraints should be either a"
                     " callable, string or STASH object"
                 )
-
-            if "stash" not in pp_constraints:
-                pp_constraints["stash"] = [call_func]
-            else:
-                pp_constraints["stash"].append(call_func)
         else:
             # only keep the pp constraints set if they are all handled as
             # pp constraints
             unhandled_constraints = True
 
-    def pp_filter(field):
-        """Return True if field is to be kept, False if field does not match filter."""
-        res = True
-        if field.stash not in _STASH_ALLOW:
-            if pp_constraints.get("stash"):
-                res = False
-                for call_func in pp_constraints["stash"]:
-                    if call_func(str(field.stash)):
-                        res = True
-                        break
-        return res
-
-    if pp_constraints and not unhandled_constraints:
+    if (pp_filter.stash_codes or pp_filter.stash_funcs) and not unhandled_constraints:
         result = pp_filter
     else:
         result = None
@@ -2154,6 +2659,13 @@ def _load_cubes_variable_loader(
             um_fast_load._convert_collation,
         )
     else:
+        header_filter = getattr(pp_filter, "header_mask", None)
+        if loading_function is load and header_filter is not None:
+            # Also filter the PP file headers, before fields are created.
+            loading_function = _load_prefiltered
+            loading_function_kwargs = dict(
+                loading_function_kwargs or {}, header_filter=header_filter
+            )
         loader = iris.fileformats.rules.Loader(
             loading_function,
             loading_function_kwargs or {},
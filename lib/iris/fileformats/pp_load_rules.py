@@ -856,6 +856,100 @@ def _convert_scalar_pseudo_level_coords(lbuser5):
     return coords_and_dims
 
 
+_all_other_rules_cache = {}
+_all_other_rules_cache_max_size = 1024
+
+
+def _all_other_rules_signature(f):
+    """Return the header values which determine the :func:`_all_other_rules` result.
+
+    Returns None if the field is not of a kind whose results are cached.
+
+    """
+    from iris.fileformats.pp import PPField
+
+    if not isinstance(f, PPField) or len(f.lbcode) == 5:
+        # Cross-sections depend on the values of extra data vectors.
+        return None
+    if f.bdx in (0.0, f.bmdi) or f.bdy in (0.0, f.bmdi):
+        # Irregular grids depend on the values of extra data vectors.
+        return None
+    lbtim = f.lbtim
+    if lbtim.ib in (2, 3):
+        # Season and month coordinates depend on the validity dates.
+        dates = (
+            f.lbyr,
+            f.lbmon,
+            f.lbdat,
+            f.lbhr,
+            f.lbmin,
+            f.lbyrd,
+            f.lbmond,
+            f.lbdatd,
+            f.lbhrd,
+            f.lbmind,
+            f.lbft,
+        )
+    else:
+        dates = None
+    return (
+        type(f),
+        int(lbtim),
+        int(f.lbcode),
+        dates,
+        (f.bdx, f.bzx, f.lbnpt, f.bdy, f.bzy, f.lbrow, f.bmdi, f.lbhem),
+        (f.bplat, f.bplon),
+        f.lbproc,
+        f.lbsrce,
+        tuple(f.lbuser),
+        f.lbfc,
+    )
+
+
+def _cached_all_other_rules(f):
+    """Return the result of :func:`_all_other_rules`, re-using it for similar fields.
+
+    Fields of the same type all produce the same results, so the rules are
+    only evaluated for the first such field, and later ones get copies.
+
+    """
+    key = _all_other_rules_signature(f)
+    if key is None:
+        return _all_other_rules(f)
+
+    result = _all_other_rules_cache.get(key)
+    if result is None:
+        result = _all_other_rules(f)
+        _all_other_rules_cache[key] = result
+
+        # Limit cache size
+        while len(_all_other_rules_cache) > _all_other_rules_cache_max_size:
+            oldest_item = next(iter(_all_other_rules_cache))
+            _all_other_rules_cache.pop(oldest_item, None)
+
+    # Return copies, as the results are modified when making cubes.
+    (
+        references,
+        standard_name,
+        long_name,
+        units,
+        attributes,
+        cell_methods,
+        dim_coords_and_dims,
+        aux_coords_and_dims,
+    ) = result
+    return (
+        list(references),
+        standard_name,
+        long_name,
+        units,
+        attributes.copy(),
+        list(cell_methods),
+        [(coord.copy(), dims) for coord, dims in dim_coords_and_dims],
+        [(coord.copy(), dims) for coord, dims in aux_coords_and_dims],
+    )
+
+
 def convert(f):
     """Convert a PP field into the corresponding items of Cube metadata.
 
@@ -915,7 +1009,7 @@ def convert(f):
         cell_methods,
         dim_coords_and_dims,
         other_aux_coords_and_dims,
-    ) = _all_other_rules(f)
+    ) = _cached_all_other_rules(f)
     aux_coords_and_dims.extend(other_aux_coords_and_dims)
 
     return ConversionMetadata(
@@ -5,6 +5,8 @@
 """Generalised mechanisms for metadata translation and cube construction."""
 
 import collections
+import functools
+import itertools
 import threading
 import warnings
 
@@ -405,16 +407,11 @@ class MultipleReferenceFieldDetector(threading.local):
 _MULTIREF_DETECTION = MultipleReferenceFieldDetector()
 
 
-def _load_pairs_from_fields_and_filenames(
+def _convert_fields_and_filenames(
     fields_and_filenames, converter, user_callback_wrapper=None
 ):
-    # The underlying mechanism for the public 'load_pairs_from_fields' and
-    # 'load_cubes'.
-    # Slightly more complicated than 'load_pairs_from_fields', only because it
-    # needs a filename associated with each field to support the load callback.
-    concrete_reference_targets = {}
-    results_needing_reference = []
-
+    # Convert each field to a cube, and apply the load callback.
+    # Yields (cube, factories, references, field) for each resulting cube.
     for field, filename in fields_and_filenames:
         # Convert the field to a Cube, passing down the 'converter' function.
         cube, factories, references = _make_cube(field, converter)
@@ -426,6 +423,16 @@ def _load_pairs_from_fields_and_filenames(
         if cube is None:
             continue
 
+        yield cube, factories, references, field
+
+
+def _resolve_references(converted):
+    # Cross-reference converted cubes, and build the factories which need
+    # references.  Yields (cube, field) pairs.
+    concrete_reference_targets = {}
+    results_needing_reference = []
+
+    for cube, factories, references, field in converted:
         # Cross referencing.
         for reference in references:
             name = reference.name
@@ -449,6 +456,20 @@ def _load_pairs_from_fields_and_filenames(
         yield (cube, field)
 
 
+def _load_pairs_from_fields_and_filenames(
+    fields_and_filenames, converter, user_callback_wrapper=None
+):
+    # The underlying mechanism for the public 'load_pairs_from_fields' and
+    # 'load_cubes'.
+    # Slightly more complicated than 'load_pairs_from_fields', only because it
+    # needs a filename associated with each field to support the load callback.
+    return _resolve_references(
+        _convert_fields_and_filenames(
+            fields_and_filenames, converter, user_callback_wrapper
+        )
+    )
+
+
 def load_pairs_from_fields(fields, converter):
     """Convert iterable of fields into iterable of Cubes using the provided converter.
 
@@ -470,26 +491,64 @@ def load_pairs_from_fields(fields, converter):
     )
 
 
+def _fields_and_filenames(filename, loader, filter_function=None):
+    # Generate the fields of a file, with the file name.
+    for field in loader.field_generator(filename, **loader.field_generator_kwargs):
+        # evaluate field against format specific desired attributes
+        # load if no format specific desired attributes are violated
+        if filter_function is None or filter_function(field):
+            yield (field, filename)
+
+
+def _loadcubes_user_callback_wrapper(user_callback, cube, field, filename):
+    # Run user-provided original callback function.
+    # N.B. at module level, so that it can be pickled for parallel loading.
+    result = cube
+    if user_callback is not None:
+        result = user_callback(cube, field, filename)
+    return result
+
+
+def _convert_file(filename, loader, filter_function=None, user_callback_wrapper=None):
+    # Convert the fields of a single file, as a unit of parallel loading.
+    # The fields themselves are not returned, as they are not needed.
+    for cube, factories, references, _ in _convert_fields_and_filenames(
+        _fields_and_filenames(filename, loader, filter_function),
+        converter=loader.converter,
+        user_callback_wrapper=user_callback_wrapper,
+    ):
+        yield cube, factories, references, None
+
+
 def load_cubes(filenames, user_callback, loader, filter_function=None):
+    from iris.loading import LOAD_CONCURRENCY
+
     if isinstance(filenames, str):
         filenames = [filenames]
 
+    loadcubes_user_callback_wrapper = functools.partial(
+        _loadcubes_user_callback_wrapper, user_callback
+    )
+
+    if LOAD_CONCURRENCY.mode is not LOAD_CONCURRENCY.Modes.SERIAL:
+        # Convert separate files in parallel, but still resolve references
+        # across all of them.
+        file_results = LOAD_CONCURRENCY.map(
+            functools.partial(
+                _convert_file,
+                loader=loader,
+                filter_function=filter_function,
+                user_callback_wrapper=loadcubes_user_callback_wrapper,
+            ),
+            filenames,
+        )
+        for cube, _ in _resolve_references(itertools.chain(*file_results)):
+            yield cube
+        return
+
     def _generate_all_fields_and_filenames():
         for filename in filenames:
-            for field in loader.field_generator(
-                filename, **loader.field_generator_kwargs
-            ):
-                # evaluate field against format specific desired attributes
-                # load if no format specific desired attributes are violated
-                if filter_function is None or filter_function(field):
-                    yield (field, filename)
-
-    def loadcubes_user_callback_wrapper(cube, field, filename):
-        # Run user-provided original callback function.
-        result = cube
-        if user_callback is not None:
-            result = user_callback(cube, field, filename)
-        return result
+            yield from _fields_and_filenames(filename, loader, filter_function)
 
     all_fields_and_filenames = _generate_all_fields_and_filenames()
     for cube, field in _load_pairs_from_fields_and_filenames(
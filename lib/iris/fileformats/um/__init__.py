@@ -9,6 +9,7 @@ Other types of UM file may fail to load correctly (or at all).
 
 """
 
+from .._header_index import HEADER_INDEX
 from ._fast_load import FieldCollation, structured_um_loading
 
 # Publish the FF-replacement features here, and include documentation.
@@ -16,6 +17,7 @@ from ._ff_replacement import load_cubes, load_cubes_32bit_ieee, um_to_pp
 
 __all__ = [
     "FieldCollation",
+    "HEADER_INDEX",
     "load_cubes",
     "load_cubes_32bit_ieee",
     "structured_um_loading",
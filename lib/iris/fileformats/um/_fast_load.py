@@ -116,7 +116,7 @@ def _basic_load_function(filename, pp_filter=None, **kwargs):
         # 'recreates' that information by calling the format picker again.
         # NOTE: this may be inefficient, especially for web resources.
         from iris.fileformats import FORMAT_AGENT
-        from iris.fileformats.pp import load as pp_load
+        from iris.fileformats.pp import _load_prefiltered as pp_load
         from iris.fileformats.um import um_to_pp
 
         with open(fname, "rb") as fh:
@@ -130,7 +130,13 @@ def _basic_load_function(filename, pp_filter=None, **kwargs):
             raise ValueError(emsg.format(fname))
         return loader
 
+    from iris.fileformats import pp
+
     loader = _select_raw_fields_loader(filename)
+    header_filter = getattr(pp_filter, "header_mask", None)
+    if loader is pp._load_prefiltered and header_filter is not None:
+        # Also filter the PP file headers, before fields are created.
+        kwargs = dict(kwargs, header_filter=header_filter)
 
     def iter_fields_decorated_with_load_indices(fields_iter):
         for i_field, field in enumerate(fields_iter):
@@ -15,7 +15,8 @@ import itertools
 import cftime
 import numpy as np
 
-from iris._lazy_data import as_lazy_data, multidim_lazy_stack
+from iris._lazy_data import multidim_lazy_stack
+from iris.fileformats.pp import _coalesced_lazy_arrays
 from iris.fileformats.um._optimal_array_structuring import optimal_array_structure
 
 
@@ -72,9 +73,11 @@ class BasicFieldCollation:
         if not self._structure_calculated:
             self._calculate_structure()
         if self._data_cache is None:
+            # Neighbouring fields in a file are read together.
+            arrays = _coalesced_lazy_arrays(self.fields)
             stack = np.empty(self.vector_dims_shape, "object")
-            for nd_index, field in zip(np.ndindex(self.vector_dims_shape), self.fields):
-                stack[nd_index] = as_lazy_data(field._data)
+            for nd_index, array in zip(np.ndindex(self.vector_dims_shape), arrays):
+                stack[nd_index] = array
             self._data_cache = multidim_lazy_stack(stack)
         return self._data_cache
 
@@ -5,12 +5,15 @@
 """Iris general file loading mechanism."""
 
 from dataclasses import dataclass
+from enum import Enum, auto
 import itertools
+import pickle
 import threading
 from traceback import TracebackException
 from typing import Any, Iterable
 import warnings
 
+from iris._concurrency import ConcurrencyControl
 from iris.common import CFVariableMixin
 from iris.warnings import IrisLoadWarning
 
@@ -604,3 +607,140 @@ LOAD_PROBLEMS = LoadProblems()
 
 See :class:`LoadProblems` for more details.
 """
+
+
+def _load_controls():
+    """Return the thread-local objects which control loading, by name."""
+    import iris
+    from iris.fileformats.netcdf.loader import CHUNK_CONTROL
+    from iris.fileformats.um._fast_load import STRUCTURED_LOAD_CONTROLS
+
+    return {
+        "FUTURE": iris.FUTURE,
+        "CHUNK_CONTROL": CHUNK_CONTROL,
+        "STRUCTURED_LOAD_CONTROLS": STRUCTURED_LOAD_CONTROLS,
+    }
+
+
+def _is_picklable(obj):
+    """Return whether an object can be passed to a worker process."""
+    try:
+        pickle.dumps(obj)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        result = False
+    else:
+        result = True
+    return result
+
+
+def _load_in_worker(settings, function, item):
+    """Run a per-file load function in a worker, with the caller's load controls.
+
+    Returns the results, and any load problems recorded.
+
+    """
+    controls = _load_controls()
+    old_settings = {name: dict(control.__dict__) for name, control in controls.items()}
+    problems = LOAD_PROBLEMS.problems
+    n_old_problems = len(problems)
+    try:
+        for name, control in controls.items():
+            control.__dict__.update(settings[name])
+        result = list(function(item))
+    finally:
+        for name, control in controls.items():
+            control.__dict__.clear()
+            control.__dict__.update(old_settings[name])
+    new_problems = problems[n_old_problems:]
+    del problems[n_old_problems:]
+    return result, new_problems
+
+
+class LoadConcurrency(ConcurrencyControl):
+    """Control the concurrency of loading from multiple files.
+
+    This is controlled by the single instance of this: the
+    :data:`~iris.loading.LOAD_CONCURRENCY` object.
+
+    By default, files are loaded one after another.  Other modes load separate
+    files in parallel, in a pool of threads or of worker processes.  This
+    applies to netCDF files, and to PP and FieldsFiles, for which references
+    between fields (e.g. to orography) are still resolved across all the files.
+    The resulting cubes are the same, in the same order, in all modes.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from iris.loading import LOAD_CONCURRENCY
+
+        with LOAD_CONCURRENCY.set("PROCESSES", max_workers=8):
+            cubes = iris.load("/data/run_*.pp")
+
+    """
+
+    class Modes(Enum):
+        """Modes Enums."""
+
+        #: Files are loaded in turn, in the calling thread.
+        SERIAL = auto()
+        #: Files are loaded in a pool of threads.
+        THREADS = auto()
+        #: Files are loaded in a pool of worker processes.
+        #: N.B. the constraints and callback of a load must then be picklable,
+        #: so not, for instance, lambdas or locally defined functions.
+        #: Otherwise, the files are loaded in turn, as for ``SERIAL``.
+        PROCESSES = auto()
+
+    _THREAD_NAME_PREFIX = "iris-load"
+
+    def __init__(self):
+        super().__init__(self.Modes.SERIAL)
+
+    def map(self, function, items):
+        """Apply a per-file load function to each item, according to the current mode.
+
+        Parameters
+        ----------
+        function : callable
+            Called as ``function(item)``, returning an iterable of results.
+            For ``PROCESSES`` mode, it must be picklable, or else the items
+            are loaded in turn.
+        items : iterable
+            The items, typically file names.
+
+        Returns
+        -------
+        list of list
+            The results for each item, in the order of the items.
+
+        """
+        items = list(items)
+        if (
+            self.mode is self.Modes.SERIAL
+            or len(items) < 2
+            or (self.mode is self.Modes.PROCESSES and not _is_picklable(function))
+        ):
+            results = [list(function(item)) for item in items]
+        else:
+            settings = {
+                name: dict(control.__dict__)
+                for name, control in _load_controls().items()
+            }
+            results = []
+            for result, problems in self._get_executor().map(
+                _load_in_worker,
+                itertools.repeat(settings),
+                itertools.repeat(function),
+                items,
+            ):
+                LOAD_PROBLEMS.problems.extend(problems)
+                results.append(result)
+        return results
+
+
+LOAD_CONCURRENCY = LoadConcurrency()
+"""The global run-time instance of :class:`LoadConcurrency`.
+
+See :class:`LoadConcurrency` for more details.
+"""
@@ -47,7 +47,7 @@ class Test(tests.IrisTest):
         _regrid_info = _regrid_area_weighted_rectilinear_src_and_grid__prepare(
             src_grid, target_grid
         )
-        self.assertEqual(len(_regrid_info), 9)
+        self.assertEqual(len(_regrid_info), 10)
         with mock.patch(
             "iris.analysis._area_weighted."
             "_regrid_area_weighted_rectilinear_src_and_grid__prepare",
@@ -0,0 +1,126 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for :class:`iris.analysis._area_weighted.AreaWeightsCache`."""
+
+import numpy as np
+import pytest
+from scipy.sparse import csr_array
+
+from iris.analysis import _area_weighted
+from iris.analysis._area_weighted import AreaWeightedRegridder, AreaWeightsCache
+from iris.coords import DimCoord
+from iris.cube import Cube
+
+
+def _cube(x, y):
+    cube = Cube(np.arange(len(x) * len(y), dtype=float).reshape(len(y), len(x)))
+    cube.add_dim_coord(DimCoord(y, "latitude", units="degrees"), 0)
+    cube.add_dim_coord(DimCoord(x, "longitude", units="degrees"), 1)
+    cube.coord("latitude").guess_bounds()
+    cube.coord("longitude").guess_bounds()
+    return cube
+
+
+@pytest.fixture
+def grids():
+    src = _cube(np.linspace(20, 30, 3), np.linspace(10, 25, 4))
+    target = _cube(np.linspace(22, 28, 8), np.linspace(11, 22, 9))
+    return src, target
+
+
+@pytest.fixture
+def cache(mocker):
+    cache = AreaWeightsCache()
+    mocker.patch.object(_area_weighted, "AREA_WEIGHTS_CACHE", cache)
+    return cache
+
+
+def _weights():
+    return csr_array(np.array([[0.5, 0.0, 0.5], [0.0, 1.0, 0.0]]))
+
+
+def _assert_same(weights, expected):
+    np.testing.assert_array_equal(weights.toarray(), expected.toarray())
+
+
+def test_reuse(cache, grids, mocker):
+    spy = mocker.spy(_area_weighted, "_combine_xy_weights")
+    first = AreaWeightedRegridder(*grids)
+    second = AreaWeightedRegridder(*grids)
+    assert spy.call_count == 1
+    assert second.weights is first.weights
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+
+
+def test_fingerprint(cache, grids):
+    src, target = grids
+    regridder = AreaWeightedRegridder(src, target)
+    same = AreaWeightedRegridder(src.copy(), target.copy())
+    assert regridder.fingerprint == same.fingerprint
+    fingerprint = regridder.fingerprint
+    target.coord("latitude").bounds = target.coord("latitude").bounds + 0.1
+    assert regridder.fingerprint != AreaWeightedRegridder(src, target).fingerprint
+    # The regridder is not affected by changes to the original cubes.
+    assert regridder.fingerprint == fingerprint
+
+
+def test_disabled(grids, mocker):
+    # The global cache holds no weights by default.
+    spy = mocker.spy(_area_weighted, "_combine_xy_weights")
+    AreaWeightedRegridder(*grids)
+    AreaWeightedRegridder(*grids)
+    assert spy.call_count == 2
+    assert len(_area_weighted.AREA_WEIGHTS_CACHE) == 0
+
+
+def test_save_load(cache, grids, mocker, tmp_path):
+    filename = tmp_path / "weights.npz"
+    regridder = AreaWeightedRegridder(*grids)
+    regridder.save_weights(filename)
+    cache.clear()
+    assert cache.load(filename) == regridder.fingerprint
+    spy = mocker.spy(_area_weighted, "_combine_xy_weights")
+    _assert_same(AreaWeightedRegridder(*grids).weights, regridder.weights)
+    assert spy.call_count == 0
+
+
+def test_directory(cache, tmp_path):
+    with cache.set(directory=tmp_path):
+        cache.put("abc", _weights())
+        assert (tmp_path / "abc.npz").exists()
+        cache.clear()
+        _assert_same(cache.get("abc"), _weights())
+        assert cache.hits == 1
+    assert cache.directory is None
+
+
+def test_directory__kept(cache, tmp_path):
+    with cache.set(directory=tmp_path):
+        with cache.set(maxsize=4):
+            assert cache.directory == tmp_path
+            cache.put("abc", _weights())
+        with cache.set(directory=None):
+            assert cache.directory is None
+        assert cache.directory == tmp_path
+    assert (tmp_path / "abc.npz").exists()
+
+
+def test_directory__mismatched_file(cache, tmp_path):
+    with cache.set(directory=tmp_path):
+        cache.put("abc", _weights())
+        (tmp_path / "abc.npz").rename(tmp_path / "xyz.npz")
+        cache.clear()
+        assert cache.get("xyz") is None
+        assert cache.misses == 1
+
+
+def test_maxsize(cache):
+    with cache.set(maxsize=2):
+        for key in "abc":
+            cache.put(key, _weights())
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
@@ -0,0 +1,69 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for :func:`iris.analysis._area_weighted._standard_regrid`."""
+
+import numpy as np
+import numpy.ma as ma
+import pytest
+from scipy.sparse import csr_array
+
+from iris.analysis import _area_weighted
+from iris.analysis._area_weighted import _standard_regrid
+
+# Each target point is the mean of two source points, or of one source point
+# which only half covers it.
+WEIGHTS = csr_array(
+    np.array(
+        [
+            [0.5, 0.5, 0.0, 0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.5, 0.5, 0.0, 0.0],
+            [0.0, 0.0, 0.0, 0.0, 0.5, 0.0],
+        ]
+    )
+)
+TGT_SHAPE = (1, 3)
+
+
+def _data(mask):
+    data = np.arange(24, dtype=np.float32).reshape(4, 2, 3)
+    return ma.masked_array(data, mask=np.array(np.broadcast_to(mask, data.shape)))
+
+
+def _by_slice(data, mdtol):
+    # Regrid each horizontal slice separately.
+    results = [_standard_regrid(part, WEIGHTS, TGT_SHAPE, mdtol) for part in data]
+    return ma.stack(results)
+
+
+def _check(result, expected):
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(ma.getmaskarray(result), ma.getmaskarray(expected))
+    np.testing.assert_allclose(ma.filled(result, 0), ma.filled(expected, 0))
+
+
+@pytest.mark.parametrize("mdtol", [0, 0.5, 1])
+def test_invariant_mask(mdtol, mocker):
+    data = _data([[True, False, False], [False, False, True]])
+    spy = mocker.spy(_area_weighted, "_standard_regrid_no_masks")
+    result = _standard_regrid(data, WEIGHTS, TGT_SHAPE, mdtol)
+    # The weight sums are calculated for a single slice.
+    assert spy.call_args_list[0].args[0].shape == (2, 3)
+    assert result.shape == (4,) + TGT_SHAPE
+    _check(result, _by_slice(data, mdtol))
+
+
+def test_varying_mask():
+    data = _data([[True, False, False], [False, False, True]])
+    data[2, 0, 1] = ma.masked
+    _check(_standard_regrid(data, WEIGHTS, TGT_SHAPE, 0.5), _by_slice(data, 0.5))
+
+
+def test_unmasked():
+    data = np.arange(24, dtype=np.float64).reshape(4, 2, 3)
+    result = _standard_regrid(data, WEIGHTS, TGT_SHAPE, 1)
+    _check(result, _by_slice(data, 1))
+    # Only the partly covered target point is masked.
+    assert ma.getmaskarray(result)[..., -1].all()
+    assert not ma.getmaskarray(result)[..., :-1].any()
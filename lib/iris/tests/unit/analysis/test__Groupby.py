@@ -0,0 +1,68 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the :class:`iris.analysis._Groupby` class."""
+
+import numpy as np
+import pytest
+
+from iris.analysis import _Groupby
+from iris.coords import AuxCoord, DimCoord
+
+
+@pytest.fixture
+def groupby_coords():
+    # Composite keys (1, 0), (1, 1), (2, 1), (2, 1), (1, 1), (1, 0).
+    return [
+        AuxCoord([1, 1, 2, 2, 1, 1], long_name="a"),
+        AuxCoord([0, 1, 1, 1, 1, 0], long_name="b"),
+    ]
+
+
+def test_group_codes(groupby_coords):
+    codes, order, offsets = _Groupby(groupby_coords).group_codes()
+    np.testing.assert_array_equal(codes, [0, 1, 2, 2, 1, 0])
+    np.testing.assert_array_equal(order, [0, 5, 1, 4, 2, 3])
+    np.testing.assert_array_equal(offsets, [0, 2, 4])
+
+
+def test_group(groupby_coords):
+    groupby = _Groupby(groupby_coords)
+    assert groupby.group() == [(0, 5), (1, 4), (2, 3)]
+    assert len(groupby) == 3
+
+
+def test_single_coord():
+    groupby = _Groupby([AuxCoord(["x", "y", "y", "x", "z"], long_name="c")])
+    assert groupby.group() == [(0, 3), (1, 2), (4,)]
+    assert groupby.coords[0] == AuxCoord(["x", "y", "z"], long_name="c")
+
+
+def test_groupby_coords(groupby_coords):
+    groupby = _Groupby(groupby_coords)
+    groupby.group()
+    np.testing.assert_array_equal(groupby.coords[0].points, [1, 1, 2])
+    np.testing.assert_array_equal(groupby.coords[1].points, [0, 1, 1])
+
+
+def test_shared_monotonic(groupby_coords):
+    time = DimCoord(np.arange(6), long_name="time")
+    groupby = _Groupby(groupby_coords, [(time, 0)])
+    groupby.group()
+    np.testing.assert_array_equal(groupby.coords[-1].bounds, [[0, 5], [1, 4], [2, 3]])
+
+
+def test_shared_non_monotonic(groupby_coords):
+    other = AuxCoord([3, 0, 5, 1, 4, 2], long_name="other")
+    groupby = _Groupby(groupby_coords, [(other, 0)])
+    groupby.group()
+    np.testing.assert_array_equal(groupby.coords[-1].bounds, [[2, 3], [0, 4], [1, 5]])
+
+
+def test_shared_circular():
+    group = AuxCoord([0, 0, 1, 1], long_name="group")
+    longitude = DimCoord([0, 90, 180, 270], "longitude", units="degrees", circular=True)
+    groupby = _Groupby([group], [(longitude, 0)])
+    groupby.group()
+    np.testing.assert_array_equal(groupby.coords[-1].bounds, [[0, 90], [180, 360]])
@@ -0,0 +1,185 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the :mod:`iris.analysis._group_reduce` module."""
+
+import dask.array as da
+import numpy as np
+import numpy.ma as ma
+import pytest
+
+from iris._lazy_data import as_concrete_data, is_lazy_data
+import iris.analysis
+from iris.analysis import COUNT, MAX, MEAN, MIN, SUM, _group_reduce
+import iris.coords
+import iris.cube
+
+# Groups along axis 1 : contiguous, then interleaved.
+CONTIGUOUS = [(0, 1, 2), (3,), (4, 5), (6, 7, 8, 9)]
+INTERLEAVED = [(0, 3, 6, 9), (1, 4, 7), (2, 5, 8)]
+
+
+def _data(masked=False, dtype=np.float64):
+    data = np.arange(30, dtype=dtype).reshape(3, 10) % 7
+    if masked:
+        mask = np.zeros(data.shape, dtype=bool)
+        mask[0, :3] = True
+        mask[1, ::2] = True
+        data = ma.masked_array(data, mask=mask)
+    return data
+
+
+def _expected(aggregator, data, groups, weights=None, **kwargs):
+    # The result of aggregating each group separately.
+    results = []
+    for group in groups:
+        if weights is not None:
+            kwargs["weights"] = weights[:, group]
+        results.append(aggregator.aggregate(data[:, group], axis=1, **kwargs))
+    if kwargs.get("returned"):
+        return tuple(ma.stack(result, axis=1) for result in zip(*results))
+    return ma.stack(results, axis=1)
+
+
+def _aggregate(aggregator, data, groups, **kwargs):
+    # Aggregate the groups along axis 1.
+    order = np.concatenate(groups)
+    lengths = np.array([len(group) for group in groups])
+    offsets = np.cumsum(lengths) - lengths
+    return _group_reduce.aggregate_groups(aggregator, data, order, offsets, 1, **kwargs)
+
+
+def _check(result, expected):
+    result = as_concrete_data(result)
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(ma.getmaskarray(result), ma.getmaskarray(expected))
+    np.testing.assert_allclose(ma.filled(result, 0), ma.filled(expected, 0))
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["real", "lazy"])
+@pytest.mark.parametrize("groups", [CONTIGUOUS, INTERLEAVED], ids=["sorted", "mixed"])
+@pytest.mark.parametrize("masked", [False, True], ids=["plain", "masked"])
+@pytest.mark.parametrize("aggregator", [MEAN, SUM, MAX, MIN], ids=lambda a: a.name())
+def test_aggregators(aggregator, masked, groups, lazy):
+    data = _data(masked=masked)
+    expected = _expected(aggregator, data, groups)
+    if lazy:
+        data = da.from_array(data, chunks=(2, 4))
+    result = _aggregate(aggregator, data, groups)
+    assert is_lazy_data(result) is lazy
+    assert ma.isMaskedArray(as_concrete_data(result)) is masked
+    _check(result, expected)
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["real", "lazy"])
+@pytest.mark.parametrize("aggregator", [MEAN, SUM], ids=lambda a: a.name())
+def test_weighted_returned(aggregator, lazy):
+    data = _data(masked=True)
+    weights = np.linspace(0.5, 2.0, data.size).reshape(data.shape)
+    expected = _expected(aggregator, data, INTERLEAVED, weights=weights, returned=True)
+    if lazy:
+        data = da.from_array(data, chunks=(3, 3))
+    result = _aggregate(aggregator, data, INTERLEAVED, weights=weights, returned=True)
+    _check(result[0], expected[0])
+    # The weights of fully masked groups may or may not be masked.
+    result_weights = as_concrete_data(result[1])
+    assert result_weights.dtype == expected[1].dtype
+    np.testing.assert_allclose(ma.filled(result_weights, 0), ma.filled(expected[1], 0))
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["real", "lazy"])
+def test_mdtol(lazy):
+    data = _data(masked=True)
+    expected = _expected(MEAN, data, CONTIGUOUS, mdtol=0.4)
+    if lazy:
+        data = da.from_array(data, chunks=(3, 5))
+    result = _aggregate(MEAN, data, CONTIGUOUS, mdtol=0.4)
+    _check(result, expected)
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["real", "lazy"])
+def test_count(lazy):
+    data = _data(masked=True)
+    function = lambda values: values > 2  # noqa: E731
+    expected = _expected(COUNT, data, INTERLEAVED, function=function)
+    if lazy:
+        data = da.from_array(data, chunks=(3, 4))
+    result = _aggregate(COUNT, data, INTERLEAVED, function=function)
+    _check(result, expected)
+
+
+def test_integer_sum():
+    data = np.full((2, 4), 2**30, dtype=np.int32)
+    result = _aggregate(SUM, data, [(0, 1, 2, 3)])
+    assert result.dtype == np.sum(data).dtype
+    np.testing.assert_array_equal(result, [[2**32], [2**32]])
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["real", "lazy"])
+@pytest.mark.parametrize("masked", [False, True], ids=["plain", "masked"])
+def test_float32_mean(masked, lazy):
+    # The result dtype is that of the aggregator, for the same kind of array.
+    data = _data(masked=masked, dtype=np.float32)
+    if lazy:
+        data = da.from_array(data, chunks=(2, 4))
+        expected = MEAN.lazy_aggregate(data[:, :3], axis=1)
+    else:
+        expected = MEAN.aggregate(data[:, :3], axis=1)
+    result = _aggregate(MEAN, data, CONTIGUOUS)
+    assert result.dtype == expected.dtype
+    assert as_concrete_data(result).dtype == expected.dtype
+
+
+def test_lazy_chunks():
+    # The grouped dimension is rechunked on group boundaries.
+    data = da.zeros((2, 10), chunks=(2, 4))
+    result = _aggregate(MEAN, data, CONTIGUOUS)
+    assert result.chunks == ((2,), (2, 1, 1))
+
+
+@pytest.mark.parametrize(
+    "aggregator, kwargs, expected",
+    [
+        (MEAN, {"weights": None, "mdtol": 0.5}, True),
+        (MAX, {"returned": True}, False),
+        (COUNT, {}, False),
+        (COUNT, {"function": np.isnan}, True),
+        (iris.analysis.MEDIAN, {}, False),
+        (iris.analysis.PERCENTILE, {"percent": 50}, False),
+    ],
+)
+def test_supported(aggregator, kwargs, expected):
+    assert _group_reduce.supported(aggregator, _data(), **kwargs) is expected
+
+
+def test_supported__dtype():
+    assert not _group_reduce.supported(MAX, np.array(["a", "b"]))
+
+
+class TestCubeAggregatedBy:
+    @pytest.fixture
+    def cube(self):
+        cube = iris.cube.Cube(_data(masked=True), long_name="foo")
+        group = iris.coords.AuxCoord(np.arange(10) % 3, long_name="group")
+        cube.add_aux_coord(group, 1)
+        return cube
+
+    def test_vectorised(self, cube, mocker):
+        spy = mocker.spy(_group_reduce, "aggregate_groups")
+        result = cube.aggregated_by("group", MEAN)
+        assert spy.call_count == 1
+        _check(result.data, _expected(MEAN, cube.data, INTERLEAVED))
+
+    def test_same_as_loop(self, cube, mocker):
+        result = cube.aggregated_by("group", SUM, returned=True)
+        mocker.patch.object(_group_reduce, "supported", return_value=False)
+        expected = cube.aggregated_by("group", SUM, returned=True)
+        assert result[0] == expected[0]
+        np.testing.assert_allclose(ma.filled(result[1], 0), ma.filled(expected[1], 0))
+
+    def test_lazy(self, cube):
+        cube.data = da.from_array(cube.data, chunks=(3, 4))
+        result = cube.aggregated_by("group", MAX)
+        assert result.has_lazy_data()
+        _check(result.data, _expected(MAX, cube.data, INTERLEAVED))
@@ -0,0 +1,174 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the :mod:`iris.analysis._rolling` module."""
+
+import dask.array as da
+import numpy as np
+import numpy.ma as ma
+import pytest
+
+from iris._lazy_data import as_concrete_data, is_lazy_data
+import iris.analysis
+from iris.analysis import COUNT, MAX, MEAN, MIN, SUM, _rolling
+import iris.coords
+import iris.cube
+from iris.util import rolling_window
+
+
+def _data(masked=False):
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(3, 17))
+    if masked:
+        mask = np.zeros(data.shape, dtype=bool)
+        mask[0, 2:9] = True
+        mask[1, ::3] = True
+        data = ma.masked_array(data, mask=mask)
+    return data
+
+
+def _expected(aggregator, data, window, weights=None, **kwargs):
+    # The result of aggregating over a rolling window view.
+    rolled = rolling_window(data, window=window, axis=1)
+    if weights is not None:
+        kwargs["weights"] = np.broadcast_to(weights, rolled.shape)
+    return aggregator.aggregate(rolled, axis=2, **kwargs)
+
+
+def _check(result, expected):
+    result = as_concrete_data(result)
+    expected = ma.masked_array(expected)
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(ma.getmaskarray(result), ma.getmaskarray(expected))
+    np.testing.assert_allclose(ma.filled(result, 0), ma.filled(expected, 0))
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["real", "lazy"])
+@pytest.mark.parametrize("window", [2, 5, 17])
+@pytest.mark.parametrize("masked", [False, True], ids=["plain", "masked"])
+@pytest.mark.parametrize("aggregator", [MEAN, SUM, MAX, MIN], ids=lambda a: a.name())
+def test_aggregators(aggregator, masked, window, lazy):
+    data = _data(masked=masked)
+    expected = _expected(aggregator, data, window)
+    if lazy:
+        data = da.from_array(data, chunks=(2, 3))
+    result = _rolling.rolling_aggregate(aggregator, data, window, 1)
+    assert is_lazy_data(result) is lazy
+    assert result.shape == (3, 18 - window)
+    _check(result, expected)
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["real", "lazy"])
+@pytest.mark.parametrize("aggregator", [MEAN, SUM], ids=lambda a: a.name())
+def test_weighted(aggregator, lazy):
+    data = _data(masked=True)
+    weights = np.array([0.5, 1.0, 2.0, 1.0])
+    expected = _expected(aggregator, data, 4, weights=weights)
+    if lazy:
+        data = da.from_array(data, chunks=(3, 5))
+    result = _rolling.rolling_aggregate(aggregator, data, 4, 1, weights=weights)
+    _check(result, expected)
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["real", "lazy"])
+def test_mdtol(lazy):
+    data = _data(masked=True)
+    expected = _expected(MEAN, data, 3, mdtol=0.5)
+    if lazy:
+        data = da.from_array(data, chunks=(3, 4))
+    result = _rolling.rolling_aggregate(MEAN, data, 3, 1, mdtol=0.5)
+    _check(result, expected)
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["real", "lazy"])
+def test_count(lazy):
+    data = _data(masked=True)
+    function = lambda values: values > 0  # noqa: E731
+    expected = _expected(COUNT, data, 6, function=function)
+    if lazy:
+        data = da.from_array(data, chunks=(3, 7))
+    result = _rolling.rolling_aggregate(COUNT, data, 6, 1, function=function)
+    _check(result, expected)
+
+
+@pytest.mark.parametrize("aggregator", [SUM, MAX, MIN], ids=lambda a: a.name())
+def test_non_finite(aggregator):
+    data = np.array([1.0, np.nan, 2.0, np.inf, 3.0, -np.inf, 4.0, 5.0, 6.0])
+    expected = _expected(aggregator, data[np.newaxis], 2)
+    result = _rolling.rolling_aggregate(aggregator, data[np.newaxis], 2, 1)
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_integer_sum():
+    data = np.full((1, 6), 2**30, dtype=np.int32)
+    result = _rolling.rolling_aggregate(SUM, data, 4, 1)
+    assert result.dtype == np.sum(data).dtype
+    np.testing.assert_array_equal(result, [[2**32] * 3])
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["real", "lazy"])
+@pytest.mark.parametrize("aggregator", [MEAN, SUM, MAX, MIN], ids=lambda a: a.name())
+def test_result_type(aggregator, lazy):
+    # The dtype and array type are those of aggregating a rolling window view.
+    data = _data().astype(np.float32)
+    if lazy:
+        data = da.from_array(data, chunks=(2, 5))
+        expected = aggregator.lazy_aggregate(rolling_window(data, 3, axis=1), 2)
+    else:
+        expected = _expected(aggregator, data, 3)
+    result = as_concrete_data(_rolling.rolling_aggregate(aggregator, data, 3, 1))
+    expected = as_concrete_data(expected)
+    assert result.dtype == expected.dtype
+    assert type(result) is type(expected)
+
+
+def test_lazy_small_chunks():
+    # Blocks shorter than the window are merged.
+    data = _data()
+    expected = _expected(MAX, data, 6)
+    result = _rolling.rolling_aggregate(MAX, da.from_array(data, chunks=2), 6, 1)
+    _check(result, expected)
+
+
+@pytest.mark.parametrize(
+    "aggregator, window, kwargs, expected",
+    [
+        (MEAN, 3, {"weights": None, "mdtol": 0.5}, True),
+        (SUM, 3, {"returned": True}, False),
+        (COUNT, 3, {}, False),
+        (MAX, 18, {}, False),
+        (iris.analysis.STD_DEV, 3, {}, False),
+    ],
+)
+def test_supported(aggregator, window, kwargs, expected):
+    assert _rolling.supported(aggregator, _data(), window, 1, **kwargs) is expected
+
+
+class TestCubeRollingWindow:
+    @pytest.fixture
+    def cube(self):
+        cube = iris.cube.Cube(_data(masked=True), long_name="foo")
+        time = iris.coords.DimCoord(np.arange(17), "time", units="days since 2000-1-1")
+        cube.add_dim_coord(time, 1)
+        return cube
+
+    def test_streaming(self, cube, mocker):
+        spy = mocker.spy(_rolling, "rolling_aggregate")
+        result = cube.rolling_window("time", MEAN, 5)
+        assert spy.call_count == 1
+        _check(result.data, _expected(MEAN, cube.data, 5))
+
+    def test_same_as_view(self, cube, mocker):
+        weights = np.array([1.0, 2.0, 1.0])
+        result = cube.rolling_window("time", SUM, 3, weights=weights)
+        mocker.patch.object(_rolling, "supported", return_value=False)
+        expected = cube.rolling_window("time", SUM, 3, weights=weights)
+        assert result.coord("time") == expected.coord("time")
+        _check(result.data, expected.data)
+
+    def test_lazy(self, cube):
+        cube.data = da.from_array(cube.data, chunks=(3, 4))
+        result = cube.rolling_window("time", MIN, 4)
+        assert result.has_lazy_data()
+        _check(result.data, _expected(MIN, cube.data, 4))
@@ -0,0 +1,130 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the :class:`iris._concatenate.ArrayHashCache` class."""
+
+import dask.array as da
+import numpy as np
+import pytest
+
+from iris import _concatenate
+from iris._concatenate import ArrayHashCache, _ArrayHash
+
+
+@pytest.fixture
+def cache(mocker):
+    return mocker.patch.object(_concatenate, "ARRAY_HASH_CACHE", ArrayHashCache())
+
+
+def _read_only(array):
+    array = np.array(array)
+    array.flags.writeable = False
+    return array
+
+
+class TestCacheable:
+    def test_lazy(self, cache):
+        assert cache.cacheable(da.arange(3))
+
+    def test_read_only(self, cache):
+        assert cache.cacheable(_read_only([1, 2]))
+
+    def test_writeable(self, cache):
+        assert not cache.cacheable(np.arange(3))
+
+    def test_read_only_view_of_writeable(self, cache):
+        array = np.arange(3)
+        view = array[:]
+        view.flags.writeable = False
+        assert not cache.cacheable(view)
+
+    def test_masked(self, cache):
+        array = np.ma.masked_array([1, 2], mask=[0, 1])
+        array.flags.writeable = False
+        assert not cache.cacheable(array)
+
+
+class TestGetPut:
+    def test_stats(self, cache):
+        array = _read_only([1, 2])
+        array_hash = _ArrayHash(1, ((2,),))
+        assert cache.get(array, array.dtype) is None
+        cache.put(array, array.dtype, array_hash)
+        assert cache.get(array, array.dtype) == array_hash
+        assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+    def test_dtype_in_key(self, cache):
+        array = _read_only([1, 2])
+        cache.put(array, np.float64, _ArrayHash(1, ((2,),)))
+        assert cache.get(array, array.dtype) is None
+
+    def test_lazy_by_name(self, cache):
+        array_hash = _ArrayHash(1, ((2,),))
+        cache.put(da.arange(2), np.int64, array_hash)
+        assert cache.get(da.arange(2), np.int64) == array_hash
+
+    def test_maxsize(self, cache):
+        cache.maxsize = 2
+        arrays = [_read_only([i]) for i in range(3)]
+        for i, array in enumerate(arrays):
+            cache.put(array, array.dtype, _ArrayHash(i, ((1,),)))
+        assert len(cache) == 2
+        assert cache.get(arrays[0], arrays[0].dtype) is None
+        assert cache.get(arrays[2], arrays[2].dtype).value == 2
+
+    def test_clear(self, cache):
+        array = _read_only([1, 2])
+        cache.put(array, array.dtype, _ArrayHash(1, ((2,),)))
+        cache.get(array, array.dtype)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.hits == cache.misses == 0
+
+
+def test_hashes(cache):
+    arrays = [_read_only([1, 2]), da.arange(1, 3), np.arange(2)]
+    result = cache.hashes(*arrays)
+    assert result[0] == _ArrayHash(_concatenate._hash_array(arrays[0]), ((2,),))
+    assert result[1].chunks == ((2,),)
+    assert result[2] is None
+    assert len(cache) == 2
+    assert cache.hashes(*arrays[:2]) == result[:2]
+    assert cache.hits == 2
+
+
+def test_compute_hashes_cached(cache, mocker):
+    arrays = {"a": _read_only([1, 2]), "b": da.arange(2)}
+    expected = _concatenate._compute_hashes(arrays)
+    spy = mocker.spy(_concatenate, "_hash_array")
+    assert _concatenate._compute_hashes(arrays) == expected
+    spy.assert_not_called()
+    assert cache.hits == 2
+
+
+@pytest.mark.parametrize(
+    "array_a,array_b,eq",
+    [
+        (_read_only([1, 2, 3]), _read_only([1, 2, 3]), True),
+        (_read_only([1, 2, 3]), _read_only([1, 2, 4]), False),
+        (_read_only([1.0, 0.0]), _read_only([1.0, -0.0]), True),
+        (da.arange(4, chunks=2), da.arange(1, 5, chunks=2), False),
+        (da.arange(4, chunks=2), da.arange(4, chunks=2) + 0, True),
+    ],
+)
+def test_array_equal__hashed(array_a, array_b, eq, cache, mocker):
+    mocker.patch.object(_concatenate, "_HASH_EQUAL_MIN_SIZE", 2)
+    assert _concatenate._array_equal(array_a, array_b) == eq
+    # Comparing again uses the cached hashes.
+    assert _concatenate._array_equal(array_a, array_b) == eq
+    if cache.misses:
+        assert cache.hits == cache.misses == 2
+
+
+def test_array_equal__small_not_hashed(cache):
+    assert _concatenate._array_equal(_read_only([1, 2]), _read_only([1, 2]))
+    assert cache.hits == cache.misses == 0
+
+
+def test_array_equal__no_bounds(cache):
+    assert _concatenate._array_equal(None, None)
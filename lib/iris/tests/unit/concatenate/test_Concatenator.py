@@ -0,0 +1,107 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the :class:`iris._concatenate.Concatenator` class."""
+
+import numpy as np
+import pytest
+
+from iris import _concatenate
+from iris._concatenate import Concatenator
+from iris._lazy_data import as_lazy_data
+import iris.coords
+import iris.cube
+import iris.exceptions
+import iris.warnings
+
+
+def _make_cube(times, name="air_temperature", height=None):
+    ny = 3
+    data = np.zeros((len(times), ny), dtype=np.float32)
+    cube = iris.cube.Cube(data, standard_name=name, units="K")
+    time = iris.coords.DimCoord(times, "time", units="hours since 1970-01-01")
+    cube.add_dim_coord(time, 0)
+    cube.add_dim_coord(iris.coords.DimCoord(np.arange(ny), "latitude"), 1)
+    surface = iris.coords.AuxCoord(np.arange(ny, dtype=np.float32), long_name="surface")
+    cube.add_aux_coord(surface, 1)
+    if height is not None:
+        cube.add_aux_coord(iris.coords.AuxCoord(height, "height", units="m"))
+    return cube
+
+
+def test_incremental():
+    concatenator = Concatenator()
+    concatenator.add([_make_cube([0, 1])])
+    (result,) = concatenator.result()
+    np.testing.assert_array_equal(result.coord("time").points, [0, 1])
+    for step in range(2, 5):
+        concatenator.add([_make_cube([step])])
+        (result,) = concatenator.result()
+        np.testing.assert_array_equal(result.coord("time").points, np.arange(step + 1))
+    assert result.shape == (5, 3)
+
+
+def test_out_of_order():
+    concatenator = Concatenator()
+    concatenator.add([_make_cube([3]), _make_cube([1])])
+    concatenator.add([_make_cube([2]), _make_cube([0])])
+    (result,) = concatenator.result()
+    np.testing.assert_array_equal(result.coord("time").points, [0, 1, 2, 3])
+
+
+def test_same_as_concatenate():
+    cubes = [
+        _make_cube([0], height=1.5),
+        _make_cube([0], height=10.0),
+        _make_cube([1], height=1.5),
+        _make_cube([1], height=10.0),
+        _make_cube([0, 1], name="air_pressure"),
+    ]
+    concatenator = Concatenator()
+    for cube in cubes:
+        concatenator.add([cube])
+    assert concatenator.result() == _concatenate.concatenate(cubes)
+
+
+def test_hashes_only_new_cubes(mocker):
+    concatenator = Concatenator()
+    concatenator.add([_make_cube([0]), _make_cube([1]), _make_cube([2])])
+    spy = mocker.spy(_concatenate, "_compute_hashes")
+    concatenator.add([_make_cube([3])])
+    (arrays,) = spy.call_args.args
+    # The arrays of the new cube, and of the proto-cube it is compared with.
+    assert len(arrays) == 2
+    assert len(concatenator._hashes) == 1
+
+
+def test_rehash_with_new_chunks():
+    # The existing hashes are recomputed when a new array of the same shape
+    # requires different chunks.
+    concatenator = Concatenator()
+    concatenator.add([_make_cube([0])])
+    cube = _make_cube([1])
+    surface = cube.coord("surface")
+    surface.points = as_lazy_data(surface.points.copy(), chunks=(1,))
+    concatenator.add([cube])
+    assert len(concatenator.result()) == 1
+
+
+def test_mismatch():
+    concatenator = Concatenator()
+    concatenator.add([_make_cube([0])])
+    cube = _make_cube([1])
+    cube.coord("surface").points = np.array([7, 8, 9], dtype=np.float32)
+    with pytest.warns(iris.warnings.IrisUserWarning, match="unequal"):
+        concatenator.add([cube])
+    assert len(concatenator.result()) == 2
+
+
+def test_empty():
+    assert Concatenator().result() == iris.cube.CubeList()
+
+
+def test_dataless():
+    cube = iris.cube.Cube(shape=(2,))
+    with pytest.raises(iris.exceptions.DatalessError):
+        Concatenator().add([cube])
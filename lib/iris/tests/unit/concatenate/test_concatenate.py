@@ -389,6 +389,41 @@ class TestOrder:
         assert result1 == result2
 
 
+class TestOverlap:
+    _make_cube = TestOrder._make_cube
+
+    @pytest.mark.parametrize("reverse", [False, True], ids=["asc", "desc"])
+    def test_many_unordered(self, reverse):
+        starts = [30, 0, 20, 50, 10, 40]
+        cubes = [
+            self._make_cube(sorted([start, start + 5], reverse=reverse))
+            for start in starts
+        ]
+        result = concatenate(cubes)
+        assert len(result) == 1
+        expected = np.sort([[start, start + 5] for start in starts], axis=None)
+        if reverse:
+            expected = expected[::-1]
+        np.testing.assert_array_equal(result[0].coord("latitude").points, expected)
+
+    @pytest.mark.parametrize("points", [[21, 24], [19, 21], [25, 26], [45, 50]])
+    def test_overlap_with_neighbour(self, points):
+        cubes = [self._make_cube([start, start + 5]) for start in [0, 10, 20, 30, 40]]
+        with pytest.warns(iris.warnings.IrisUserWarning, match="overlap"):
+            result = concatenate(cubes + [self._make_cube(points)])
+        assert len(result) == 2
+
+    def test_bounds_overlap_with_neighbour(self):
+        cubes = [
+            self._make_cube([5], [[0, 10]]),
+            self._make_cube([25], [[20, 30]]),
+            self._make_cube([15], [[0, 20]]),
+        ]
+        with pytest.warns(iris.warnings.IrisUserWarning, match="overlap"):
+            result = concatenate(cubes)
+        assert len(result) == 2
+
+
 class TestConcatenate__dask:
     @pytest.fixture()
     def sample_lazy_cubes(self):
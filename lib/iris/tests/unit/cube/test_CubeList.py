@@ -231,6 +231,39 @@ class Test_merge_cube:
             CubeList([self.cube1, self.cube1]).merge_cube()
 
 
+class Test_merge__keys:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        self.cubes = CubeList()
+        for name in ("air_temperature", "air_pressure"):
+            for height in range(3):
+                for long_name in ("a", "b"):
+                    cube = Cube([1, 2, 3], name, long_name=long_name)
+                    cube.add_aux_coord(AuxCoord([height], "height", units="m"))
+                    self.cubes.append(cube)
+
+    def test_result(self):
+        result = self.cubes.merge()
+        assert len(result) == 4
+        assert [cube.name() for cube in result] == ["air_pressure"] * 2 + [
+            "air_temperature"
+        ] * 2
+        assert [cube.long_name for cube in result] == ["a", "b"] * 2
+        assert all(cube.shape == (3, 3) for cube in result)
+
+    def test_compared_by_key(self, mocker):
+        # Each cube is only compared with the ProtoCube of its own long_name,
+        # and not with the other ProtoCube of the same standard_name.
+        register = mocker.spy(iris._merge.ProtoCube, "register")
+        self.cubes.merge()
+        assert register.call_count == 2 * 2 * 2
+
+    def test_source_calculated_once(self, mocker):
+        source_cube = mocker.spy(iris._merge.ProtoCube, "source_cube")
+        self.cubes.merge()
+        assert source_cube.call_count == len(self.cubes)
+
+
 class Test_merge__time_triple:
     @pytest.fixture(autouse=True)
     def _setup(self, request):
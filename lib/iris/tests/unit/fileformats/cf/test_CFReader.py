@@ -329,6 +329,90 @@ class Test_build_cf_groups__formula_terms:
             assert len(warns.list) == 2
 
 
+class Test_select_variables:
+    @pytest.fixture(autouse=True)
+    def _setup(self, mocker):
+        self.variables = dict(
+            lat=netcdf_variable("lat", "lat", np.float64),
+            lon=netcdf_variable("lon", "lon", np.float64),
+            height=netcdf_variable(
+                "height",
+                "height",
+                np.float64,
+                formula_terms="a: delta b: sigma orog: orography",
+                standard_name="atmosphere_hybrid_height_coordinate",
+            ),
+            delta=netcdf_variable("delta", "height", np.float64),
+            sigma=netcdf_variable("sigma", "height", np.float64),
+            orography=netcdf_variable("orography", "lat lon", np.float64),
+            x=netcdf_variable("x", "lat lon", np.float64),
+            temp=netcdf_variable("temp", "height lat lon", np.float64, coordinates="x"),
+            # An unrelated data variable, with its own dependencies.
+            crs=netcdf_variable("crs", None, np.int32),
+            area=netcdf_variable("area", "lat lon", np.float64),
+            precip_aux=netcdf_variable("precip_aux", "lat lon", np.float64),
+            precip=netcdf_variable(
+                "precip",
+                "lat lon",
+                np.float64,
+                coordinates="precip_aux",
+                grid_mapping="crs",
+                cell_measures="area: area",
+            ),
+        )
+        ncattrs = mock.Mock(return_value=[])
+        dataset = mock.Mock(
+            file_format="NetCDF4", variables=self.variables, ncattrs=ncattrs
+        )
+        mocker.patch("iris.fileformats.cf.CFReader._reset")
+        mocker.patch("iris.fileformats.cf.CFReader._has_meshes", return_value=False)
+        mocker.patch(
+            "iris.fileformats.netcdf._thread_safe_nc.DatasetWrapper",
+            return_value=dataset,
+        )
+
+    @staticmethod
+    def var_callback(*names):
+        def inner(cf_var):
+            return cf_var.cf_name in names
+
+        return inner
+
+    def test_data_variable(self):
+        cf_group = CFReader("dummy", var_callback=self.var_callback("temp")).cf_group
+        expected = set(self.variables) - {"crs", "area", "precip_aux", "precip"}
+        assert set(cf_group) == expected
+        assert list(cf_group.data_variables) == ["temp"]
+        assert list(cf_group.promoted) == ["orography"]
+        assert set(cf_group["temp"].cf_group) == expected - {"temp"}
+
+    def test_other_data_variable(self):
+        cf_group = CFReader("dummy", var_callback=self.var_callback("precip")).cf_group
+        assert set(cf_group) == {"precip", "precip_aux", "crs", "area", "lat", "lon"}
+        assert list(cf_group.data_variables) == ["precip"]
+        assert list(cf_group.grid_mappings) == ["crs"]
+        assert list(cf_group.cell_measures) == ["area"]
+
+    def test_referenced_variable(self):
+        # A variable referenced by another is included with its referrers,
+        # so that it is classified as in the whole file.
+        var_callback = self.var_callback("orography")
+        cf_group = CFReader("dummy", var_callback=var_callback).cf_group
+        assert "temp" not in cf_group
+        assert "height" in cf_group.coordinates
+        assert list(cf_group.data_variables) == []
+        assert list(cf_group.promoted) == ["orography"]
+
+    def test_ugrid_not_selected(self, mocker):
+        mocker.patch("iris.fileformats.cf.CFReader._has_meshes", return_value=True)
+        cf_group = CFReader("dummy", var_callback=self.var_callback("temp")).cf_group
+        assert "precip" in cf_group
+
+    def test_no_var_callback(self):
+        cf_group = CFReader("dummy").cf_group
+        assert set(cf_group.data_variables) == {"temp", "precip"}
+
+
 class Test_build_cf_groups__ugrid:
     @pytest.fixture(autouse=True)
     def _setup_class(self, mocker):
@@ -0,0 +1,152 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for :class:`iris.fileformats._header_index.HeaderIndex`."""
+
+import os
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import iris
+from iris.fileformats import _ff, pp
+from iris.fileformats._header_index import HEADER_INDEX, HeaderIndex
+import iris.tests.stock as stock
+
+
+@pytest.fixture
+def pp_path(tmp_path):
+    cube = stock.realistic_3d()
+    cube.data = cube.data.astype(np.float32)
+    path = str(tmp_path / "test.pp")
+    iris.save(cube, path)
+    return path
+
+
+@pytest.fixture
+def index(tmp_path):
+    with HEADER_INDEX.set(tmp_path / "index"):
+        HEADER_INDEX.reset_stats()
+        yield HEADER_INDEX
+
+
+def _field_summary(fields):
+    return [(field._raw_header, field.data) for field in fields]
+
+
+class TestDisabled:
+    def test_default(self):
+        assert not HeaderIndex().enabled
+
+    def test_lookup(self, pp_path):
+        assert HeaderIndex().lookup(pp_path, "pp>") is None
+
+    def test_build(self, pp_path):
+        with pytest.raises(ValueError, match="no index directory"):
+            HeaderIndex().build([pp_path])
+
+
+class TestPP:
+    def test_roundtrip(self, index, pp_path):
+        scanned = list(pp._field_gen(pp_path, False))
+        assert index.stats == {"hits": 0, "misses": 1, "writes": 1}
+        with mock.patch("iris.fileformats.pp._scan_headers") as scan_headers:
+            indexed = list(pp._field_gen(pp_path, False))
+        # No headers were read from the file.
+        scan_headers.assert_not_called()
+        assert index.hits == 1
+        assert _field_summary(indexed) == _field_summary(scanned)
+
+    def test_read_data(self, index, pp_path):
+        scanned = list(pp._field_gen(pp_path, True))
+        indexed = list(pp._field_gen(pp_path, True))
+        assert index.hits == 1
+        assert _field_summary(indexed) == _field_summary(scanned)
+
+    def test_load(self, index, pp_path):
+        expected = iris.load_cube(pp_path)
+        assert iris.load_cube(pp_path) == expected
+        assert index.hits == 1
+
+    def test_endianness_distinct(self, index, pp_path):
+        list(pp._field_gen(pp_path, False))
+        assert index.lookup(pp_path, "pp<") is None
+
+    def test_modified_file(self, index, pp_path):
+        list(pp._field_gen(pp_path, False))
+        stat = os.stat(pp_path)
+        os.utime(pp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        list(pp._field_gen(pp_path, False))
+        assert index.stats == {"hits": 0, "misses": 2, "writes": 2}
+
+    def test_incomplete_read_not_indexed(self, index, pp_path):
+        with open(pp_path, "r+b") as fh:
+            fh.truncate(os.path.getsize(pp_path) - 100)
+        list(pp._field_gen(pp_path, False))
+        assert index.writes == 0
+
+    def test_foreign_index(self, index, pp_path):
+        # An index file without the expected content is ignored.
+        list(pp._field_gen(pp_path, False))
+        (path,) = index.directory.iterdir()
+        with open(path, "wb") as fh:
+            np.savez(fh, data=np.arange(3))
+        assert index.lookup(pp_path, "pp>") is None
+        with open(path, "wb") as fh:
+            np.save(fh, np.arange(3))
+        assert index.lookup(pp_path, "pp>") is None
+        assert len(iris.load(pp_path)) == 1
+
+
+class TestFF:
+    @pytest.fixture
+    def ff2pp(self, tmp_path):
+        # A file containing just a LOOKUP table of 3 entries, the last of which
+        # is a terminator.
+        path = str(tmp_path / "test.ff")
+        table = np.zeros((3, 64), dtype=">i8")
+        table[:2, :45] = np.arange(90).reshape(2, 45) + 1
+        table[:2, 45:] = np.arange(38).reshape(2, 19).astype(">f8").view(">i8")
+        table[2, 0] = -99
+        table.tofile(path)
+        with mock.patch("iris.fileformats._ff.FFHeader"):
+            ff2pp = _ff.FF2PP(path)
+        ff2pp._ff_header.lookup_table = (1, 64, 3)
+        return ff2pp
+
+    def _headers(self, ff2pp):
+        with open(ff2pp._filename, "rb") as ff_file:
+            return list(ff2pp._lookup_headers(ff_file))
+
+    def test_roundtrip(self, index, ff2pp):
+        scanned = self._headers(ff2pp)
+        assert len(scanned) == 2
+        assert scanned[1][:2] == (46, 47)
+        assert scanned[1][45:47] == (19.0, 20.0)
+        with mock.patch("iris.fileformats._ff._parse_binary_stream") as parse:
+            indexed = self._headers(ff2pp)
+        parse.assert_not_called()
+        assert indexed == scanned
+        assert index.stats == {"hits": 1, "misses": 1, "writes": 1}
+
+    def test_word_depth_distinct(self, index, ff2pp):
+        self._headers(ff2pp)
+        assert index.lookup(ff2pp._filename, "ff4") is None
+
+
+class TestMaintenance:
+    def test_build(self, index, pp_path, tmp_path):
+        other_path = tmp_path / "other.txt"
+        other_path.write_text("not a PP file")
+        assert index.build([pp_path, other_path]) == [pp_path]
+        list(pp._field_gen(pp_path, False))
+        assert index.stats == {"hits": 1, "misses": 1, "writes": 1}
+
+    def test_prune(self, index, pp_path):
+        index.build([pp_path])
+        assert index.prune() == []
+        os.remove(pp_path)
+        (removed,) = index.prune()
+        assert not removed.exists()
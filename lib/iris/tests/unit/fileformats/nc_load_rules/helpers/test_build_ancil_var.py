@@ -21,6 +21,7 @@ def mock_engine():
         cf_var=mock.Mock(dimensions=("foo", "bar")),
         filename="DUMMY",
         cube_parts=dict(ancillary_variables=[]),
+        shared_parts={},
     )
 
 
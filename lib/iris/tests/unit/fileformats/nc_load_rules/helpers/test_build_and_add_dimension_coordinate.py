@@ -48,6 +48,7 @@ class RulesTestMixin:
             cf_var=mock.Mock(dimensions=("foo", "bar")),
             filename="DUMMY",
             cube_parts=dict(coordinates=[]),
+            shared_parts={},
         )
 
         # Create patch for deferred loading that prevents attempted
@@ -69,6 +69,7 @@ class TestBoundsVertexDim(tests.IrisTest):
             cf_var=mock.Mock(dimensions=("foo", "bar"), cf_data=cf_data),
             filename="DUMMY",
             cube_parts=dict(coordinates=[]),
+            shared_parts={},
         )
 
         # Patch the deferred loading that prevents attempted file access.
@@ -186,6 +187,7 @@ class TestDtype(tests.IrisTest):
             cf_var=mock.Mock(dimensions=("foo", "bar")),
             filename="DUMMY",
             cube_parts=dict(coordinates=[]),
+            shared_parts={},
         )
 
     @contextlib.contextmanager
@@ -241,6 +243,7 @@ class TestCoordConstruction(tests.IrisTest):
             cf_var=mock.Mock(dimensions=("foo", "bar")),
             filename="DUMMY",
             cube_parts=dict(coordinates=[]),
+            shared_parts={},
         )
 
         points = np.arange(6)
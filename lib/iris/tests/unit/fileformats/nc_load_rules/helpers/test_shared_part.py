@@ -0,0 +1,67 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Test function :func:`iris.fileformats._nc_load_rules.helpers.shared_part`."""
+
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from iris.coords import AuxCoord
+from iris.fileformats._nc_load_rules.engine import Engine
+from iris.fileformats._nc_load_rules.helpers import shared_part
+
+
+@pytest.fixture
+def engine():
+    return Engine()
+
+
+@pytest.fixture
+def build_func():
+    return mock.Mock(side_effect=lambda: AuxCoord(np.arange(3), long_name="foo"))
+
+
+def test_built_once(engine, build_func):
+    coord1 = shared_part(engine, ("coordinate", "foo"), build_func)
+    coord2 = shared_part(engine, ("coordinate", "foo"), build_func)
+    assert build_func.call_count == 1
+    assert coord1 == coord2
+
+
+def test_copies(engine, build_func):
+    coord1 = shared_part(engine, ("coordinate", "foo"), build_func)
+    coord1.rename("bar")
+    coord2 = shared_part(engine, ("coordinate", "foo"), build_func)
+    assert coord2 is not coord1
+    assert coord2.name() == "foo"
+
+
+def test_different_keys(engine, build_func):
+    shared_part(engine, ("coordinate", "foo"), build_func)
+    shared_part(engine, ("coordinate", "foo", "longitude"), build_func)
+    assert build_func.call_count == 2
+
+
+def test_no_key(engine, build_func):
+    shared_part(engine, None, build_func)
+    shared_part(engine, None, build_func)
+    assert build_func.call_count == 2
+    assert engine.shared_parts == {}
+
+
+def test_failure_not_shared(engine, build_func):
+    build_func.side_effect = [ValueError("bad"), AuxCoord(0)]
+    with pytest.raises(ValueError, match="bad"):
+        shared_part(engine, ("coordinate", "foo"), build_func)
+    assert shared_part(engine, ("coordinate", "foo"), build_func) == AuxCoord(0)
+
+
+def test_reset_keeps_parts(engine, build_func):
+    # The parts persist between the cubes of a file.
+    shared_part(engine, ("coordinate", "foo"), build_func)
+    engine.reset()
+    shared_part(engine, ("coordinate", "foo"), build_func)
+    assert build_func.call_count == 1
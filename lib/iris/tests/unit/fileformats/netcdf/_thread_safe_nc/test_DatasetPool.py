@@ -0,0 +1,149 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for :class:`iris.fileformats.netcdf._thread_safe_nc.DatasetPool`."""
+
+import os
+
+import netCDF4
+import numpy as np
+import pytest
+
+from iris.fileformats.cf import CFReader
+from iris.fileformats.netcdf._thread_safe_nc import (
+    _GLOBAL_NETCDF4_LOCK,
+    DATASET_POOL,
+    DatasetPool,
+    NetCDFDataProxy,
+)
+
+
+def _make_file(path, value=0.0):
+    with netCDF4.Dataset(path, "w") as ds:
+        ds.createDimension("x", 4)
+        var = ds.createVariable("v", "f4", ("x",))
+        var[:] = np.arange(4) + value
+    return str(path)
+
+
+@pytest.fixture
+def files(tmp_path):
+    return [_make_file(tmp_path / f"file_{i}.nc", value=i) for i in range(3)]
+
+
+@pytest.fixture
+def pool():
+    pool = DatasetPool(maxsize=2)
+    yield pool
+    pool.clear()
+
+
+def _read(pool, path):
+    with _GLOBAL_NETCDF4_LOCK:
+        with pool.dataset(path) as ds:
+            return ds.variables["v"][:]
+
+
+class TestAcquire:
+    def test_disabled(self, files):
+        pool = DatasetPool()
+        _read(pool, files[0])
+        _read(pool, files[0])
+        assert pool.stats == {"hits": 0, "misses": 0, "opens": 2}
+        assert len(pool) == 0
+
+    def test_hits(self, pool, files):
+        result = _read(pool, files[1])
+        _read(pool, files[1])
+        np.testing.assert_array_equal(result, np.arange(4) + 1)
+        assert pool.stats == {"hits": 1, "misses": 1, "opens": 1}
+        assert len(pool) == 1
+
+    def test_lru_eviction(self, pool, files):
+        for path in files:
+            _read(pool, path)
+        assert len(pool) == 2
+        # The least recently used was dropped, so must be re-opened.
+        _read(pool, files[0])
+        assert pool.stats == {"hits": 0, "misses": 4, "opens": 4}
+        _read(pool, files[0])
+        assert pool.hits == 1
+
+    def test_in_use_not_evicted(self, pool, files):
+        with _GLOBAL_NETCDF4_LOCK:
+            held = pool.acquire(files[0])
+            pool.acquire(files[1])
+            pool.acquire(files[2])
+            assert held.isopen()
+            pool.release(held)
+        assert not held.isopen()
+
+    def test_modified_file_reopened(self, pool, files):
+        _read(pool, files[0])
+        os.remove(files[0])
+        _make_file(files[0], value=10)
+        result = _read(pool, files[0])
+        np.testing.assert_array_equal(result, np.arange(4) + 10)
+        assert pool.opens == 2
+
+    def test_fork(self, pool, files):
+        with _GLOBAL_NETCDF4_LOCK:
+            held = pool.acquire(files[0])
+            pool.release(held)
+            # Simulate running in a forked child process.
+            pool._pid = -1
+            pool.acquire(files[0])
+        assert pool.misses == 2
+        # The inherited handle is never closed by the child.
+        assert held.isopen()
+        assert pool._orphans == [held]
+        pool._orphans = []
+        held.close()
+
+    def test_url_not_pooled(self, pool):
+        with _GLOBAL_NETCDF4_LOCK:
+            assert pool.acquire("https://nowhere/data.nc") is None
+
+
+class TestClear:
+    def test_clear(self, pool, files):
+        _read(pool, files[0])
+        pool.clear()
+        assert len(pool) == 0
+
+    def test_discard(self, pool, files):
+        _read(pool, files[0])
+        _read(pool, files[1])
+        pool.discard(files[0])
+        assert len(pool) == 1
+
+    def test_shrink(self, pool, files):
+        _read(pool, files[0])
+        _read(pool, files[1])
+        pool.maxsize = 0
+        assert len(pool) == 0
+
+
+class TestClients:
+    @pytest.fixture(autouse=True)
+    def _enable(self):
+        DATASET_POOL.maxsize = 4
+        DATASET_POOL.reset_stats()
+        yield
+        DATASET_POOL.maxsize = 0
+
+    def test_proxy(self, files):
+        proxy = NetCDFDataProxy((4,), np.dtype("f4"), files[2], "v", None)
+        np.testing.assert_array_equal(proxy[1:3], [3, 4])
+        np.testing.assert_array_equal(proxy[:1], [2])
+        assert DATASET_POOL.stats == {"hits": 1, "misses": 1, "opens": 1}
+
+    def test_cfreader(self, files):
+        with CFReader(files[0]) as reader:
+            assert "v" in reader.cf_group
+        # Closing the reader returned the dataset to the pool.
+        assert len(DATASET_POOL) == 1
+        proxy = NetCDFDataProxy((4,), np.dtype("f4"), files[0], "v", None)
+        proxy[:]
+        assert DATASET_POOL.stats == {"hits": 1, "misses": 1, "opens": 1}
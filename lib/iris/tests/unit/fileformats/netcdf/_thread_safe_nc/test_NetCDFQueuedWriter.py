@@ -0,0 +1,181 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for :class:`iris.fileformats.netcdf._thread_safe_nc.NetCDFQueuedWriter`."""
+
+import pickle
+import threading
+from unittest import mock
+
+import dask
+import dask.array as da
+import netCDF4
+import numpy as np
+import pytest
+
+import iris
+from iris.cube import Cube
+from iris.fileformats.netcdf import _thread_safe_nc
+from iris.fileformats.netcdf._thread_safe_nc import (
+    NetCDFQueuedWriteProxy,
+    NetCDFQueuedWriter,
+)
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = str(tmp_path / "test.nc")
+    with netCDF4.Dataset(path, "w") as ds:
+        ds.createDimension("x", 6)
+        ds.createVariable("a", "i4", ("x",))
+        ds.createVariable("b", "f8", ("x",))
+    return path
+
+
+def _read(path, varname):
+    with netCDF4.Dataset(path) as ds:
+        return ds.variables[varname][:]
+
+
+def test_store(path, mocker):
+    spy = mocker.patch.object(_thread_safe_nc.netCDF4, "Dataset", wraps=netCDF4.Dataset)
+    writer = NetCDFQueuedWriter(path, maxsize=1)
+    targets = [writer.target("a"), writer.target("b")]
+    assert isinstance(targets[0], NetCDFQueuedWriteProxy)
+    sources = [da.arange(6, chunks=2), da.arange(6, chunks=3) * 0.5]
+    with dask.config.set(scheduler="threads"):
+        da.store(sources, targets, lock=False)
+    writer.close()
+    # The file was opened once, for all the chunks.
+    assert spy.call_count == 1
+    np.testing.assert_array_equal(_read(path, "a"), np.arange(6))
+    np.testing.assert_array_equal(_read(path, "b"), np.arange(6) * 0.5)
+
+
+def test_reuse(path):
+    writer = NetCDFQueuedWriter(path)
+    writer.target("a")[:3] = np.arange(3)
+    writer.close()
+    writer.target("a")[3:] = np.arange(3)
+    writer.close()
+    np.testing.assert_array_equal(_read(path, "a"), [0, 1, 2, 0, 1, 2])
+
+
+def test_close_unused(path):
+    NetCDFQueuedWriter(path).close()
+
+
+def test_bounded(path, mocker):
+    # A producer waits while the queue is full.
+    writer = NetCDFQueuedWriter(path, maxsize=1)
+    release = threading.Event()
+
+    def slow_open(*args):
+        release.wait()
+        return mock.MagicMock()
+
+    mocker.patch.object(_thread_safe_nc.netCDF4, "Dataset", side_effect=slow_open)
+    writer.target("a")[0] = 1
+    writer.target("a")[1] = 1
+    producer = threading.Thread(target=writer.target("a").__setitem__, args=(2, 1))
+    producer.start()
+    producer.join(timeout=0.2)
+    assert producer.is_alive()
+    release.set()
+    producer.join()
+    writer.close()
+
+
+def test_error(path):
+    writer = NetCDFQueuedWriter(path)
+    with pytest.raises(KeyError, match="missing"):
+        # The error is raised by a later write, or else on closing.
+        writer.target("missing")[:] = np.arange(6)
+        writer.close()
+    writer.close(check=False)
+    assert writer._thread is None
+
+
+def test_write_while_closing(path, mocker):
+    writer = NetCDFQueuedWriter(path)
+    release = threading.Event()
+
+    def slow_open(*args):
+        release.wait()
+        return mock.MagicMock()
+
+    mocker.patch.object(_thread_safe_nc.netCDF4, "Dataset", side_effect=slow_open)
+    writer.target("a")[0] = 1
+    closer = threading.Thread(target=writer.close)
+    closer.start()
+    closer.join(timeout=0.2)
+    assert closer.is_alive()
+    with pytest.raises(ValueError, match="closing"):
+        writer.target("a")[1] = 1
+    release.set()
+    closer.join()
+
+
+def test_abort(path):
+    writer = NetCDFQueuedWriter(path)
+    writer.target("a")[:3] = np.arange(3)
+    writer.abort()
+    with pytest.raises(ValueError, match="closed"):
+        writer.target("a")[3:] = np.arange(3)
+    assert writer._thread is None
+    np.testing.assert_array_equal(_read(path, "a")[:3], np.arange(3))
+
+
+def test_not_picklable(path):
+    with pytest.raises(TypeError, match="local scheduler"):
+        pickle.dumps(NetCDFQueuedWriter(path).target("a"))
+
+
+def test_delayed_save(tmp_path):
+    cube = Cube(da.arange(24.0, chunks=4).reshape(6, 4), var_name="x")
+    path = str(tmp_path / "saved.nc")
+    with dask.config.set(scheduler="threads"):
+        iris.save(cube, path, compute=False).compute()
+    np.testing.assert_array_equal(_read(path, "x"), np.arange(24.0).reshape(6, 4))
+
+
+def test_error_releases_file(path, mocker):
+    dataset = mock.MagicMock(variables={"a": mock.MagicMock()})
+    mocker.patch.object(_thread_safe_nc.netCDF4, "Dataset", return_value=dataset)
+    writer = NetCDFQueuedWriter(path)
+    writer.target("a")[:3] = np.arange(3)
+    writer.target("missing")[:] = np.arange(6)
+    while writer._error is None:
+        threading.Event().wait(0.01)
+    # The file is closed at once, although the writer is not.
+    dataset.close.assert_called_once()
+    assert writer._thread.is_alive()
+    writer.close(check=False)
+    dataset.close.assert_called_once()
+
+
+def _writer_threads():
+    names = [thread.name for thread in threading.enumerate()]
+    return [name for name in names if name == "netcdf-writer:saved.nc"]
+
+
+def test_delayed_save_failed_chunk(tmp_path):
+    def fail(block):
+        if block[0, 0] >= 20:
+            # Fail only once the writer has started on the other chunks.
+            for _ in range(500):
+                if _writer_threads():
+                    break
+                threading.Event().wait(0.01)
+            raise ValueError("failed chunk")
+        return block
+
+    data = da.arange(24.0, chunks=4).reshape(6, 4).map_blocks(fail)
+    path = str(tmp_path / "saved.nc")
+    with dask.config.set(scheduler="threads", num_workers=4):
+        result = iris.save(Cube(data, var_name="x"), path, compute=False)
+        with pytest.raises(ValueError, match="failed chunk"):
+            result.compute()
+    # The writer thread has ended, releasing the file.
+    assert not _writer_threads()
@@ -0,0 +1,148 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for :class:`iris.fileformats.netcdf._thread_safe_nc.ReadConcurrency`."""
+
+import threading
+import time
+
+import netCDF4
+import numpy as np
+import pytest
+
+from iris.fileformats.netcdf import _thread_safe_nc
+from iris.fileformats.netcdf._thread_safe_nc import (
+    READ_CONCURRENCY,
+    NetCDFDataProxy,
+    ReadConcurrency,
+    _SharedExclusiveLock,
+)
+
+
+@pytest.fixture
+def proxies(tmp_path):
+    result = []
+    for i in range(3):
+        path = str(tmp_path / f"file_{i}.nc")
+        with netCDF4.Dataset(path, "w") as ds:
+            ds.createDimension("x", 5)
+            var = ds.createVariable("v", "i4", ("x",))
+            var[:] = np.arange(5) * i
+        result.append(NetCDFDataProxy((5,), np.dtype("i4"), path, "v", None))
+    return result
+
+
+class TestSharedExclusiveLock:
+    def test_exclusive(self):
+        lock = _SharedExclusiveLock()
+        with lock:
+            assert lock.locked()
+            assert not lock.acquire(blocking=False)
+        assert not lock.locked()
+
+    def test_shared_concurrent(self):
+        lock = _SharedExclusiveLock()
+        with lock.shared():
+            with lock.shared():
+                assert lock._readers == 2
+        assert lock._readers == 0
+
+    def test_exclusive_waits_for_shared(self):
+        lock = _SharedExclusiveLock()
+        events = []
+
+        def exclusive():
+            with lock:
+                events.append("exclusive")
+
+        with lock.shared():
+            thread = threading.Thread(target=exclusive)
+            thread.start()
+            time.sleep(0.1)
+            events.append("shared-done")
+        thread.join()
+        assert events == ["shared-done", "exclusive"]
+
+    def test_non_blocking_with_shared(self):
+        lock = _SharedExclusiveLock()
+        with lock.shared():
+            assert not lock.acquire(blocking=False)
+            assert not lock.acquire(timeout=0.05)
+            assert not lock.locked()
+        assert lock.acquire(blocking=False)
+        lock.release()
+
+    def test_file_locks_released(self):
+        control = ReadConcurrency()
+        lock = control._file_lock("a.nc")
+        assert control._file_lock("a.nc") is lock
+        del lock
+        assert len(control._file_locks) == 0
+
+    def test_file_lock_real_path(self, tmp_path, monkeypatch):
+        path = tmp_path / "a.nc"
+        path.touch()
+        link = tmp_path / "link.nc"
+        link.symlink_to(path)
+        monkeypatch.chdir(tmp_path)
+        control = ReadConcurrency()
+        lock = control._file_lock(str(path))
+        assert control._file_lock("a.nc") is lock
+        assert control._file_lock(str(link)) is lock
+
+
+class TestModes:
+    def test_default(self):
+        assert ReadConcurrency().mode is ReadConcurrency.Modes.GLOBAL_LOCK
+
+    def test_set_restores(self):
+        with READ_CONCURRENCY.set("per_file"):
+            assert READ_CONCURRENCY.mode is ReadConcurrency.Modes.PER_FILE
+        assert READ_CONCURRENCY.mode is ReadConcurrency.Modes.GLOBAL_LOCK
+
+    def test_bad_mode(self):
+        with pytest.raises(KeyError):
+            with READ_CONCURRENCY.set("nonsense"):
+                pass
+
+    def test_set_new_pool(self, mocker):
+        # A pool from outer settings is not reused under new settings.
+        outer = mocker.sentinel.executor
+        mocker.patch.object(READ_CONCURRENCY, "_executor", outer)
+        with READ_CONCURRENCY.set("PROCESSES", max_workers=1):
+            assert READ_CONCURRENCY._executor is None
+        assert READ_CONCURRENCY._executor is outer
+
+    @pytest.mark.parametrize("mode", ["GLOBAL_LOCK", "PER_FILE", "PROCESSES"])
+    def test_read(self, proxies, mode):
+        with READ_CONCURRENCY.set(mode, max_workers=2):
+            for i, proxy in enumerate(proxies):
+                np.testing.assert_array_equal(proxy[1:3], np.array([1, 2]) * i)
+        assert READ_CONCURRENCY._executor is None
+
+    def test_per_file_reads_in_parallel(self, proxies, mocker):
+        # Check that reads of different files overlap in time.
+        active = []
+        overlapped = []
+        original = _thread_safe_nc._read_variable
+
+        def slow_read(*args):
+            active.append(1)
+            time.sleep(0.1)
+            overlapped.append(len(active) > 1)
+            result = original(*args)
+            active.pop()
+            return result
+
+        mocker.patch.object(_thread_safe_nc, "_read_variable", slow_read)
+        with READ_CONCURRENCY.set("PER_FILE"):
+            threads = [
+                threading.Thread(target=proxy.__getitem__, args=(slice(None),))
+                for proxy in proxies
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert any(overlapped)
@@ -0,0 +1,146 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for :class:`iris.fileformats.netcdf._load_cache.LoadCache`."""
+
+import os
+from unittest import mock
+
+import pytest
+
+import iris
+from iris.fileformats.netcdf import loader
+from iris.fileformats.netcdf._load_cache import LoadCache
+from iris.fileformats.netcdf.loader import CHUNK_CONTROL, LOAD_CACHE
+from iris.loading import LOAD_PROBLEMS
+import iris.tests.stock as stock
+import iris.warnings
+
+
+@pytest.fixture
+def nc_path(tmp_path):
+    cube = stock.realistic_3d()
+    other = cube.copy()
+    other.rename("air_pressure")
+    path = str(tmp_path / "test.nc")
+    iris.save([cube, other], path)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with LOAD_CACHE.set(tmp_path / "snapshots"):
+        LOAD_CACHE.reset_stats()
+        yield LOAD_CACHE
+
+
+class TestDisabled:
+    def test_default(self):
+        assert not LoadCache().enabled
+
+    def test_lookup(self, nc_path):
+        assert LoadCache().lookup(nc_path) is None
+
+    def test_load(self, nc_path):
+        iris.load(nc_path)
+        assert LOAD_CACHE.stats["writes"] == 0
+
+
+class TestLoad:
+    def test_roundtrip(self, cache, nc_path):
+        expected = iris.load(nc_path)
+        assert cache.stats == {"hits": 0, "misses": 1, "writes": 1, "evictions": 0}
+        with mock.patch("iris.fileformats.cf.CFReader") as cf_reader:
+            result = iris.load(nc_path)
+        # No metadata was read from the file.
+        cf_reader.assert_not_called()
+        assert cache.hits == 1
+        assert result == expected
+
+    def test_constraint(self, cache, nc_path):
+        expected = iris.load_cube(nc_path, "air_pressure")
+        assert iris.load_cube(nc_path, "air_pressure") == expected
+        assert iris.load_cube(nc_path, "air_potential_temperature") is not None
+        assert cache.stats == {"hits": 2, "misses": 1, "writes": 1, "evictions": 0}
+
+    def test_name_constraint_not_cached(self, cache, nc_path, mocker):
+        spy = mocker.spy(loader, "_load_cf_cubes")
+        constraint = iris.NameConstraint(standard_name="air_pressure")
+        expected = iris.load_cube(nc_path, constraint)
+        # The file is loaded for the constraint only, and not recorded.
+        assert spy.call_args.args[2] is not None
+        assert cache.stats == {"hits": 0, "misses": 1, "writes": 0, "evictions": 0}
+        iris.load(nc_path)
+        assert iris.load_cube(nc_path, constraint) == expected
+        assert cache.stats == {"hits": 1, "misses": 2, "writes": 1, "evictions": 0}
+
+    def test_load_problems_not_cached(self, cache, nc_path, mocker):
+        def load_cf_cubes(*args):
+            LOAD_PROBLEMS.record(nc_path, None, ValueError("bad"))
+            yield from original(*args)
+
+        original = loader._load_cf_cubes
+        mocker.patch.object(loader, "_load_cf_cubes", load_cf_cubes)
+        with pytest.warns(iris.warnings.IrisLoadWarning):
+            iris.load(nc_path)
+        LOAD_PROBLEMS.reset(nc_path)
+        assert cache.writes == 0
+
+    def test_future(self, cache, nc_path):
+        iris.load(nc_path)
+        with iris.FUTURE.context(date_microseconds=True):
+            iris.load(nc_path)
+        assert cache.stats == {"hits": 0, "misses": 2, "writes": 2, "evictions": 0}
+
+    def test_callback_not_cached(self, cache, nc_path):
+        iris.load(nc_path, callback=lambda cube, field, filename: None)
+        assert cache.stats == {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    def test_chunk_control_not_cached(self, cache, nc_path):
+        with CHUNK_CONTROL.set(time=1):
+            iris.load(nc_path)
+        assert cache.writes == 0
+
+    def test_modified_file(self, cache, nc_path):
+        iris.load(nc_path)
+        stat = os.stat(nc_path)
+        os.utime(nc_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        iris.load(nc_path)
+        assert cache.stats == {"hits": 0, "misses": 2, "writes": 2, "evictions": 0}
+
+    def test_corrupt_snapshot(self, cache, nc_path):
+        iris.load(nc_path)
+        (path,) = cache.directory.iterdir()
+        path.write_bytes(b"junk")
+        assert cache.lookup(nc_path) is None
+
+
+class TestMaintenance:
+    def test_eviction(self, cache, nc_path, tmp_path):
+        other_path = str(tmp_path / "other.nc")
+        iris.save(stock.simple_2d(), other_path)
+        iris.load(nc_path)
+        (snapshot,) = cache.directory.iterdir()
+        cache.maxsize = snapshot.stat().st_size + 1
+        iris.load(other_path)
+        assert cache.evictions == 1
+        assert cache.lookup(nc_path) is None
+        assert cache.lookup(other_path) is not None
+
+    def test_too_large(self, cache, nc_path):
+        cache.maxsize = 10
+        iris.load(nc_path)
+        assert cache.writes == 0
+
+    def test_prune(self, cache, nc_path):
+        iris.load(nc_path)
+        assert cache.prune() == []
+        os.remove(nc_path)
+        (removed,) = cache.prune()
+        assert not removed.exists()
+
+    def test_clear(self, cache, nc_path):
+        iris.load(nc_path)
+        cache.clear()
+        assert list(cache.directory.iterdir()) == []
@@ -0,0 +1,129 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the "auto" chunking and compression of netCDF saves."""
+
+import dask.array as da
+import netCDF4
+import numpy as np
+import pytest
+
+from iris.coords import DimCoord
+from iris.cube import Cube
+from iris.fileformats.netcdf import saver
+from iris.fileformats.netcdf.saver import Saver, _auto_chunksizes, _auto_complevel
+from iris.warnings import IrisSaveWarning
+
+
+def _make_cube(shape=(20, 3, 40, 50), chunks=None, data=None):
+    if data is None:
+        data = np.zeros(shape, dtype=np.float32)
+    if chunks is not None:
+        data = da.from_array(data, chunks=chunks)
+    cube = Cube(data, var_name="x")
+    for dim, name in ((0, "time"), (2, "latitude"), (3, "longitude")):
+        units = "hours since 2000-01-01" if name == "time" else "degrees"
+        cube.add_dim_coord(DimCoord(np.arange(shape[dim]), name, units=units), dim)
+    return cube
+
+
+class Test_auto_chunksizes:
+    def test_map(self):
+        assert _auto_chunksizes(_make_cube()) == (20, 3, 40, 50)
+
+    def test_map_limited(self, mocker):
+        mocker.patch.object(saver, "_AUTO_CHUNK_BYTES", 2000 * 4 * 3)
+        assert _auto_chunksizes(_make_cube()) == (1, 3, 40, 50)
+
+    def test_map_too_large(self, mocker):
+        mocker.patch.object(saver, "_AUTO_CHUNK_BYTES", 1000 * 4)
+        assert _auto_chunksizes(_make_cube()) == (1, 1, 40, 25)
+
+    def test_timeseries(self, mocker):
+        mocker.patch.object(saver, "_AUTO_CHUNK_BYTES", 20 * 4 * 100)
+        assert _auto_chunksizes(_make_cube(), "timeseries") == (20, 1, 2, 50)
+
+    def test_dask_chunks(self):
+        cube = _make_cube(chunks=(5, 3, 20, 50))
+        assert _auto_chunksizes(cube) == (5, 3, 20, 50)
+
+    def test_no_coords(self):
+        cube = Cube(np.zeros((4, 5, 6)))
+        assert _auto_chunksizes(cube) == (4, 5, 6)
+        assert _auto_chunksizes(cube, "timeseries") == (4, 5, 6)
+
+    def test_scalar(self):
+        assert _auto_chunksizes(Cube(1.0)) is None
+
+    def test_bad_access(self):
+        with pytest.raises(ValueError, match="'map' or 'timeseries'"):
+            _auto_chunksizes(_make_cube(), "sideways")
+
+
+class Test_auto_complevel:
+    def test_compressible(self):
+        assert _auto_complevel(_make_cube()) == 1
+
+    def test_incompressible(self):
+        rng = np.random.default_rng(0)
+        data = rng.integers(0, 2**31, (20, 3, 40, 50), dtype=np.int32)
+        assert _auto_complevel(_make_cube(data=data)) == 0
+
+    def test_lazy_sample(self):
+        cube = _make_cube(chunks=(1, 3, 40, 50))
+        assert _auto_complevel(cube, chunksizes=(1, 3, 40, 50)) == 1
+        assert cube.has_lazy_data()
+
+    def test_lazy_first_chunk(self):
+        def block(block_id=None):
+            if any(block_id):
+                raise AssertionError("Only the first chunk should be computed.")
+            return np.zeros((4, 3, 40, 50), dtype=np.float32)
+
+        data = da.map_blocks(
+            block, chunks=((4,) * 5, (3,), (40,), (50,)), dtype=np.float32
+        )
+        assert _auto_complevel(_make_cube(data=data)) == 1
+
+
+class Test_write:
+    def test_auto(self, tmp_path):
+        path = str(tmp_path / "auto.nc")
+        cube = _make_cube(chunks=(4, 3, 40, 50))
+        with Saver(path, "NETCDF4") as sman:
+            sman.write(cube, zlib=True, complevel="auto", chunksizes="auto")
+        assert sman.auto_settings == {
+            "x": {"chunksizes": (4, 3, 40, 50), "zlib": True, "complevel": 1}
+        }
+        with netCDF4.Dataset(path) as ds:
+            var = ds.variables["x"]
+            assert var.chunking() == [4, 3, 40, 50]
+            assert var.filters()["complevel"] == 1
+
+    def test_netcdf3_ignored(self, tmp_path):
+        path = str(tmp_path / "auto.nc")
+        with Saver(path, "NETCDF3_CLASSIC") as sman:
+            with pytest.warns(
+                IrisSaveWarning,
+                match='Ignoring chunksizes="auto" and complevel="auto", since '
+                "NETCDF3_CLASSIC",
+            ):
+                sman.write(_make_cube(), chunksizes="auto", complevel="auto")
+        assert sman.auto_settings == {}
+
+    def test_complevel_without_zlib_ignored(self, tmp_path):
+        path = str(tmp_path / "auto.nc")
+        with Saver(path, "NETCDF4") as sman:
+            with pytest.warns(IrisSaveWarning, match="since zlib=False"):
+                sman.write(_make_cube(), complevel="auto")
+        assert sman.auto_settings == {}
+        with netCDF4.Dataset(path) as ds:
+            assert not ds.variables["x"].filters()["zlib"]
+
+    @pytest.mark.parametrize("keyword", ["chunksizes", "complevel"])
+    def test_bad_string(self, tmp_path, keyword):
+        path = str(tmp_path / "auto.nc")
+        with Saver(path, "NETCDF4") as sman:
+            with pytest.raises(ValueError, match=f"'{keyword}' must be 'auto'"):
+                sman.write(_make_cube(), zlib=True, **{keyword: "Auto"})
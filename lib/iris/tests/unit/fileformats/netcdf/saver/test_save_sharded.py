@@ -0,0 +1,88 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the :func:`iris.fileformats.netcdf.save_sharded` function."""
+
+import dask.array as da
+import numpy as np
+import pytest
+
+import iris
+from iris.coords import DimCoord
+from iris.cube import Cube, CubeList
+from iris.fileformats.netcdf import save_sharded, saver
+
+
+def _make_cube(name="air_temperature", ntimes=10, time_dim=0):
+    shape = [3, 3]
+    shape.insert(time_dim, ntimes)
+    data = da.arange(np.prod(shape), dtype=np.float32, chunks=9).reshape(shape)
+    cube = Cube(data, var_name=name)
+    time = DimCoord(np.arange(ntimes) * 6.0, "time", units="hours since 2000-01-01")
+    cube.add_dim_coord(time, time_dim)
+    return cube
+
+
+@pytest.fixture
+def template(tmp_path):
+    return str(tmp_path / "shard_{index:02d}.nc")
+
+
+def test_manifest(template):
+    cube = _make_cube()
+    # Room for 4 time points, each of 9 float32 values.
+    manifest = save_sharded(cube, template, max_shard_bytes=4 * 36)
+    assert [(shard["start"], shard["stop"]) for shard in manifest] == [
+        (0, 4),
+        (4, 8),
+        (8, 10),
+    ]
+    assert manifest[1]["filename"] == template.format(index=1)
+    assert (manifest[1]["first"], manifest[1]["last"]) == (24.0, 42.0)
+    assert manifest[2]["nbytes"] == 2 * 36
+
+
+def test_content(template):
+    cubes = CubeList([_make_cube(), _make_cube("precip", time_dim=2)])
+    manifest = save_sharded(cubes, template, max_shard_bytes=100, max_in_flight=1)
+    assert len(manifest) == 10
+    loaded = iris.load([shard["filename"] for shard in manifest]).concatenate()
+    for cube in cubes:
+        (result,) = loaded.extract(iris.NameConstraint(var_name=cube.var_name))
+        np.testing.assert_array_equal(result.data, cube.data)
+
+
+def test_small_limit(template):
+    # A shard always holds at least one point.
+    manifest = save_sharded(_make_cube(ntimes=3), template, max_shard_bytes=1)
+    assert len(manifest) == 3
+
+
+def test_delayed_saves(template, mocker):
+    spy = mocker.spy(saver, "save")
+    save_sharded(_make_cube(), template, max_shard_bytes=36, max_in_flight=3)
+    assert spy.call_count == 10
+    assert all(call.kwargs["compute"] is False for call in spy.call_args_list)
+
+
+def test_lengths_differ(template):
+    cubes = [_make_cube(), _make_cube("precip", ntimes=5)]
+    with pytest.raises(ValueError, match="lengths differ"):
+        save_sharded(cubes, template)
+
+
+def test_no_dimension(template):
+    cube = _make_cube()[0]
+    with pytest.raises(ValueError, match="maps to 0 dimensions"):
+        save_sharded(cube, template)
+
+
+def test_bad_in_flight(template):
+    with pytest.raises(ValueError, match="max_in_flight"):
+        save_sharded(_make_cube(), template, max_in_flight=0)
+
+
+def test_no_index(tmp_path):
+    with pytest.raises(ValueError, match="must contain an '{index}' field"):
+        save_sharded(_make_cube(), str(tmp_path / "shard.nc"))
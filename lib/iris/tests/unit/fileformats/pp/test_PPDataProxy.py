@@ -10,6 +10,10 @@ import iris.tests as tests  # isort:skip
 
 from unittest import mock
 
+import numpy as np
+import numpy.ma as ma
+
+from iris.fileformats import pp
 from iris.fileformats.pp import PPDataProxy, SplittableInt
 
 
@@ -32,5 +36,104 @@ class Test_lbpack(tests.IrisTest):
         self.assertEqual(proxy.lbpack.n4, lbpack // 1000 % 10)
 
 
+class Test__getitem__(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(12, dtype=">f4").reshape(3, 4)
+        self.data[2, 3] = -999.0
+        self.path = self.enterContext(self.temp_filename(".pp"))
+        self.write(self.data)
+        self.enterContext(pp.PAYLOAD_MAPS.set(maxsize=32))
+        self.addCleanup(pp.PAYLOAD_MAPS.clear)
+
+    def write(self, data):
+        # Some leading bytes, and some padding after the payload.
+        with open(self.path, "wb") as fh:
+            fh.write(b"\0" * 8 + data.tobytes() + b"\0" * 8)
+
+    def proxy(self, lbpack=0):
+        return PPDataProxy(
+            (3, 4), np.dtype(">f4"), self.path, 8, 56, lbpack, None, -999.0
+        )
+
+    def test_mapped(self):
+        self.write(np.arange(12, dtype=">f4").reshape(3, 4))
+        proxy = self.proxy()
+        self.assertIsNotNone(proxy._mapped_payload())
+        result = proxy[0:2, 1:3]
+        self.assertEqual(result.dtype, np.dtype("=f4"))
+        self.assertArrayEqual(result, self.data[0:2, 1:3])
+        self.assertNotIsInstance(result, ma.MaskedArray)
+
+    def test_mapped_part_without_mdi(self):
+        # Any part of a field containing missing data is a masked array.
+        result = self.proxy()[0:2, 1:3]
+        self.assertIsInstance(result, ma.MaskedArray)
+        self.assertArrayEqual(result, self.data[0:2, 1:3])
+        self.assertFalse(ma.is_masked(result))
+
+    def test_mapped_mdi(self):
+        result = self.proxy()[1:, 2:]
+        self.assertMaskedArrayEqual(
+            result, ma.masked_values(self.data[1:, 2:].astype("=f4"), -999.0)
+        )
+
+    def test_mapped_scalar(self):
+        result = self.proxy()[1, 2]
+        self.assertEqual(result.shape, ())
+        self.assertEqual(result, 6.0)
+
+    def test_mdi_checked_once(self):
+        proxy = self.proxy()
+        proxy[0]
+        self.assertTrue(proxy._has_mdi)
+        # The whole field is not checked again.
+        with mock.patch.object(np.memmap, "__contains__") as contains:
+            result = proxy[1]
+        contains.assert_not_called()
+        self.assertIsInstance(result, ma.MaskedArray)
+
+    def test_mdi_check_not_compared(self):
+        proxy = self.proxy()
+        proxy[0]
+        self.assertEqual(proxy, self.proxy())
+
+    def test_shared_map(self):
+        self.proxy()[0]
+        self.proxy()[1]
+        self.assertEqual(len(pp.PAYLOAD_MAPS._maps), 1)
+
+    def test_file_changed(self):
+        self.proxy()[0]
+        self.write(self.data[::-1])
+        self.assertArrayEqual(self.proxy()[0], self.data[2])
+
+    def test_unmapped_same_result(self):
+        expected = self.proxy()[...]
+        with pp.PAYLOAD_MAPS.set(maxsize=0):
+            proxy = self.proxy()
+            self.assertIsNone(proxy._mapped_payload())
+            self.assertMaskedArrayEqual(proxy[...], expected)
+
+    def test_set_restores(self):
+        self.proxy()[0]
+        with pp.PAYLOAD_MAPS.set(maxsize=0):
+            self.assertIsNone(self.proxy()._mapped_payload())
+        self.assertEqual(pp.PAYLOAD_MAPS.maxsize, 32)
+        self.assertEqual(len(pp.PAYLOAD_MAPS._maps), 1)
+
+    def test_packed_not_mapped(self):
+        self.assertIsNone(self.proxy(lbpack=1)._mapped_payload())
+
+    def test_short_payload_not_mapped(self):
+        proxy = PPDataProxy((3, 4), np.dtype(">f4"), self.path, 8, 40, 0, None, -999.0)
+        self.assertIsNone(proxy._mapped_payload())
+
+
+class TestPayloadMaps(tests.IrisTest):
+    def test_disabled_by_default(self):
+        self.assertEqual(pp.PayloadMaps().maxsize, 0)
+        self.assertEqual(pp.PAYLOAD_MAPS.maxsize, 0)
+
+
 if __name__ == "__main__":
     tests.main()
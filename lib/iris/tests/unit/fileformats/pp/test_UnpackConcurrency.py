@@ -0,0 +1,98 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for :class:`iris.fileformats.pp.UnpackConcurrency`."""
+
+import threading
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from iris.fileformats import pp
+from iris.fileformats.pp import UNPACK_CONCURRENCY, PPDataProxy, UnpackConcurrency
+
+MDI = -1e30
+
+
+@pytest.fixture
+def rle_fields(tmp_path):
+    # A file of several run-length encoded fields.
+    path = str(tmp_path / "rle.pp")
+    proxies, expected = [], []
+    offset = 0
+    with open(path, "wb") as fh:
+        for i in range(4):
+            packed = np.array([i, MDI, 2, i + 1], dtype=">f4")
+            fh.write(packed.tobytes())
+            proxies.append(
+                PPDataProxy((2, 2), np.dtype(">f4"), path, offset, 16, 4, None, MDI)
+            )
+            expected.append(np.ma.masked_values([[i, MDI], [MDI, i + 1]], MDI))
+            offset += 16
+    with mock.patch.object(pp, "mo_pack", None):
+        yield proxies, expected
+
+
+class TestModes:
+    def test_default(self):
+        assert UnpackConcurrency().mode is UnpackConcurrency.Modes.SERIAL
+
+    def test_set_restores(self):
+        with UNPACK_CONCURRENCY.set("threads", max_workers=2):
+            assert UNPACK_CONCURRENCY.mode is UnpackConcurrency.Modes.THREADS
+            assert UNPACK_CONCURRENCY.max_workers == 2
+        assert UNPACK_CONCURRENCY.mode is UnpackConcurrency.Modes.SERIAL
+        assert UNPACK_CONCURRENCY.max_workers is None
+
+    def test_bad_mode(self):
+        with pytest.raises(KeyError):
+            with UNPACK_CONCURRENCY.set("nonsense"):
+                pass
+
+    def test_pool_shutdown_on_exit(self):
+        with UNPACK_CONCURRENCY.set("threads"):
+            executor = UNPACK_CONCURRENCY._get_executor()
+        assert UNPACK_CONCURRENCY._executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
+
+
+class TestReadProxies:
+    def check(self, rle_fields):
+        proxies, expected = rle_fields
+        result = pp._read_proxies(proxies)
+        assert len(result) == len(expected)
+        for array, expected_array in zip(result, expected):
+            np.testing.assert_array_equal(array, expected_array)
+            np.testing.assert_array_equal(array.mask, expected_array.mask)
+
+    def test_serial(self, rle_fields):
+        self.check(rle_fields)
+
+    def test_threads(self, rle_fields):
+        threads = set()
+        unpack_payload = pp._unpack_payload
+
+        def record_thread(*args):
+            threads.add(threading.current_thread().name)
+            return unpack_payload(*args)
+
+        with mock.patch.object(pp, "_unpack_payload", record_thread):
+            with UNPACK_CONCURRENCY.set("threads", max_workers=2):
+                self.check(rle_fields)
+        assert all(name.startswith("iris-pp-unpack") for name in threads)
+
+    def test_unpacked_fields_not_pooled(self, tmp_path):
+        path = str(tmp_path / "plain.pp")
+        np.arange(8, dtype=">f4").tofile(path)
+        proxies = [
+            PPDataProxy((2, 2), np.dtype(">f4"), path, offset, 16, 0, None, MDI)
+            for offset in (0, 16)
+        ]
+        with UNPACK_CONCURRENCY.set("threads"):
+            with mock.patch.object(UNPACK_CONCURRENCY, "_get_executor") as get:
+                result = pp._read_proxies(proxies)
+        get.assert_not_called()
+        np.testing.assert_array_equal(result[1], [[4, 5], [6, 7]])
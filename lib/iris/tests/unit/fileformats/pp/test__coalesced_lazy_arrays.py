@@ -0,0 +1,95 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the `iris.fileformats.pp._coalesced_lazy_arrays` function."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests  # isort:skip
+
+import shutil
+from unittest import mock
+
+import dask
+import numpy as np
+
+from iris._lazy_data import as_lazy_data, is_lazy_data
+import iris.fileformats.pp as pp
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.path = self.enterContext(self.temp_filename(".pp"))
+        self.arrays = [np.full((2, 3), i, dtype=">f4") for i in range(4)]
+        # Payloads are separated by a "header" of 16 bytes.
+        with open(self.path, "wb") as fh:
+            for array in self.arrays:
+                fh.write(b"\0" * 16 + array.tobytes())
+        # N.B. the memory-mapped reads are disabled, to see the actual file reads.
+        self.assertEqual(pp.PAYLOAD_MAPS.maxsize, 0)
+
+    def field(self, i_field, path=None):
+        field = pp.PPField3()
+        proxy = pp.PPDataProxy(
+            (2, 3),
+            np.dtype(">f4"),
+            path or self.path,
+            16 + i_field * 40,
+            24,
+            0,
+            None,
+            -1e30,
+        )
+        field.data = as_lazy_data(proxy, meta=proxy.dask_meta, chunks=(2, 3))
+        field._data_proxy = proxy
+        return field
+
+    def check(self, fields, expected_reads):
+        arrays = pp._coalesced_lazy_arrays(fields)
+        self.assertEqual(len(arrays), len(fields))
+        self.assertTrue(all(is_lazy_data(array) for array in arrays))
+        with mock.patch(
+            "iris.fileformats.pp.open", side_effect=open, create=True
+        ) as mock_open:
+            (result,) = dask.compute(arrays)
+        self.assertEqual(mock_open.call_count, expected_reads)
+        return result
+
+    def test_single_read(self):
+        result = self.check([self.field(i) for i in range(4)], 1)
+        for array, expected in zip(result, self.arrays):
+            self.assertEqual(array.dtype, np.dtype("=f4"))
+            self.assertArrayEqual(array, expected)
+
+    def test_out_of_order(self):
+        fields = [self.field(i) for i in (0, 1, 3, 2)]
+        result = self.check(fields, 2)
+        self.assertArrayEqual(result[2], self.arrays[3])
+        self.assertArrayEqual(result[3], self.arrays[2])
+
+    def test_large_gap(self):
+        fields = [self.field(0), self.field(3)]
+        with mock.patch("iris.fileformats.pp._MAX_COALESCED_READ_GAP", 16):
+            self.check(fields, 2)
+
+    def test_chunk_size_limit(self):
+        with dask.config.set({"array.chunk-size": "100B"}):
+            self.check([self.field(i) for i in range(4)], 2)
+
+    def test_different_files(self):
+        other_path = self.enterContext(self.temp_filename(".pp"))
+        shutil.copy(self.path, other_path)
+        fields = [self.field(0), self.field(1, other_path)]
+        self.check(fields, 2)
+
+    def test_real_data(self):
+        fields = [self.field(0), self.field(1)]
+        fields[1].data = np.zeros((2, 3))
+        self.assertIsNone(fields[1]._data_proxy)
+        result = self.check(fields, 1)
+        self.assertArrayEqual(result[1], np.zeros((2, 3)))
+
+
+if __name__ == "__main__":
+    tests.main()
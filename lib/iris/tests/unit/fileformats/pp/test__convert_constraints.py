@@ -8,10 +8,13 @@
 # importing anything else.
 import iris.tests as tests  # isort:skip
 
+import pickle
 from unittest import mock
 
+import numpy as np
+
 import iris
-from iris.fileformats.pp import STASH, _convert_constraints
+from iris.fileformats.pp import STASH, _convert_constraints, _header_array
 
 
 class Test_convert_constraints(tests.IrisTest):
@@ -88,6 +91,31 @@ class Test_convert_constraints(tests.IrisTest):
         pp_filter = _convert_constraints(constraints)
         self.assertIsNone(pp_filter)
 
+    def test_header_mask(self):
+        # Fields are selected by their STASH from the header (LBUSER7, LBUSER4),
+        # keeping any land-mask fields.
+        constraints = [
+            iris.AttributeConstraint(STASH="m01s03i236"),
+            iris.AttributeConstraint(STASH="m01s00i004"),
+        ]
+        pp_filter = _convert_constraints(constraints)
+        headers = _header_array(np.zeros((6, 64), dtype=np.int32))
+        headers["lbuser7"] = [1, 1, 1, 1, 2, 1]
+        headers["lbuser4"] = [3236, 4, 7, 30, 4, 3236]
+        self.assertArrayEqual(
+            pp_filter.header_mask(headers), [True, True, False, True, False, True]
+        )
+
+    def test_picklable(self):
+        # The filter can be passed to worker processes for parallel loading.
+        pp_filter = pickle.loads(pickle.dumps(self._single_stash()))
+        stcube = mock.Mock(stash=STASH.from_msi("m01s03i236"))
+        self.assertTrue(pp_filter(stcube))
+        headers = _header_array(np.zeros((2, 64), dtype=np.int32))
+        headers["lbuser7"] = 1
+        headers["lbuser4"] = [3236, 4]
+        self.assertArrayEqual(pp_filter.header_mask(headers), [True, False])
+
 
 if __name__ == "__main__":
     tests.main()
@@ -191,5 +191,52 @@ class Test__data_bytes_to_shaped_array__land_packed(tests.IrisTest):
         return ma.masked_array(data, np.isnan(data), fill_value=-999)
 
 
+class Test__data_bytes_to_shaped_array__run_length_encoded(tests.IrisTest):
+    def setUp(self):
+        self.mdi = -1e30
+        mdi = self.mdi
+        packed = [1.0, mdi, 3, 2.0, mdi, 1, 3.0, 4.0, mdi, 2]
+        self.data_bytes = np.array(packed, dtype=">f4").tobytes()
+        self.expected = ma.masked_values(
+            np.array([1, mdi, mdi, mdi, 2, mdi, 3, 4, mdi, mdi], dtype=np.float32),
+            mdi,
+        ).reshape(2, 5)
+        # Test the numpy decoding, whether or not mo_pack is installed.
+        self.enterContext(mock.patch("iris.fileformats.pp.mo_pack", None))
+
+    def unpack(self, data_bytes):
+        return pp._data_bytes_to_shaped_array(
+            data_bytes,
+            pp.SplittableInt(4, dict(n1=0, n2=1)),
+            None,
+            (2, 5),
+            np.dtype(">f4"),
+            self.mdi,
+        )
+
+    def test_numpy_decoding(self):
+        result = self.unpack(self.data_bytes)
+        self.assertEqual(result.dtype, np.float32)
+        self.assertMaskedArrayEqual(result, self.expected)
+
+    def test_run_length_matches_mdi(self):
+        # A run whose length happens to equal the MDI.
+        data_bytes = np.array([2.0, 2, 5.0], dtype=">f4").tobytes()
+        result = pp._decompress_rle_numpy(data_bytes, (1, 3), 2.0)
+        self.assertArrayEqual(result, [2.0, 2.0, 5.0])
+
+    def test_missing_run_length(self):
+        data_bytes = np.array([1.0, self.mdi], dtype=">f4").tobytes()
+        with self.assertRaisesRegex(ValueError, "without a run length"):
+            pp._decompress_rle_numpy(data_bytes, (1, 2), self.mdi)
+
+    def test_custom_unpacker(self):
+        unpacker = mock.Mock(return_value=np.arange(10, dtype=np.float32))
+        with mock.patch.dict(pp.UNPACKERS, {4: unpacker}):
+            result = self.unpack(self.data_bytes)
+        unpacker.assert_called_once_with(self.data_bytes, (2, 5), self.mdi)
+        self.assertArrayEqual(result, np.arange(10).reshape(2, 5))
+
+
 if __name__ == "__main__":
     tests.main()
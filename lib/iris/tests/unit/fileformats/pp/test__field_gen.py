@@ -8,8 +8,6 @@
 # importing anything else.
 import iris.tests as tests  # isort:skip
 
-import contextlib
-import io
 from unittest import mock
 import warnings
 
@@ -17,43 +15,46 @@ import numpy as np
 
 import iris.fileformats.pp as pp
 
+# Word offsets of some header elements.
+_LBLREC = 14
+_LBEXT = 19
+_LBREL = 21
+_LBUSER4 = 41
+_LBUSER7 = 44
+
+
+def _field_bytes(n_data_words=4, lbuser4=16203, lbuser7=1, lblrec=None):
+    """Make the bytes of a single, unpacked, big-endian PP field."""
+    header = np.zeros(64, dtype=">i4")
+    header[_LBREL] = 3
+    header[_LBLREC] = n_data_words if lblrec is None else lblrec
+    header[_LBUSER4] = lbuser4
+    header[_LBUSER7] = lbuser7
+    data = np.arange(n_data_words, dtype=">f4")
+    header_len = np.array([256], dtype=">i4").tobytes()
+    data_len = np.array([n_data_words * 4], dtype=">i4").tobytes()
+    return (
+        header_len
+        + header.tobytes()
+        + header_len
+        + data_len
+        + data.tobytes()
+        + data_len
+    )
+
 
 class Test(tests.IrisTest):
-    @contextlib.contextmanager
-    def mock_for_field_gen(self, fields):
-        side_effect_fields = list(fields)[:]
-
-        def make_pp_field_override(*args):
-            # Iterates over the fields passed to this context manager,
-            # until there are no more, upon which the np.fromfile
-            # returns an empty list and the while loop in load() is
-            # broken.
-            result = side_effect_fields.pop(0)
-            if not side_effect_fields:
-                np.fromfile.return_value = []
-            return result
-
-        open_func = "builtins.open"
-        with (
-            mock.patch("numpy.fromfile", return_value=[0]),
-            mock.patch(open_func),
-            mock.patch("struct.unpack_from", return_value=[4]),
-            mock.patch(
-                "iris.fileformats.pp.make_pp_field",
-                side_effect=make_pp_field_override,
-            ),
-        ):
-            yield
-
-    def gen_fields(self, fields):
-        with self.mock_for_field_gen(fields):
-            return list(pp._field_gen("mocked", "mocked"))
+    def gen_fields(self, content, read_data_bytes=False, **kwargs):
+        with self.temp_filename() as temp_path:
+            with open(temp_path, "wb") as fh:
+                fh.write(content)
+            return temp_path, list(pp._field_gen(temp_path, read_data_bytes, **kwargs))
 
     def test_lblrec_invalid(self):
-        pp_field = mock.Mock(lblrec=2, lbext=0)
         with warnings.catch_warnings(record=True) as warn:
             warnings.simplefilter("always")
-            self.gen_fields([pp_field])
+            _, fields = self.gen_fields(_field_bytes(n_data_words=1, lblrec=2))
+        self.assertEqual(fields, [])
         self.assertEqual(len(warn), 1)
         wmsg = (
             "LBLREC has a different value to the .* the header in the "
@@ -61,41 +62,46 @@ class Test(tests.IrisTest):
         )
         self.assertRegex(str(warn[0].message), wmsg)
 
-    def test_read_headers_call(self):
-        # Checks that the two calls to np.fromfile are called in the
-        # expected way.
-        pp_field = mock.Mock(lblrec=1, lbext=0, lbuser=[0])
-        with self.mock_for_field_gen([pp_field]):
-            open_fh = mock.MagicMock(spec=io.RawIOBase)
-            open.return_value = open_fh
-            next(pp._field_gen("mocked", read_data_bytes=False))
-            with open_fh as open_fh_ctx:
-                calls = [
-                    mock.call(open_fh_ctx, count=45, dtype=">i4"),
-                    mock.call(open_fh_ctx, count=19, dtype=">f4"),
-                ]
-            np.fromfile.assert_has_calls(calls)
-        with open_fh as open_fh_ctx:
-            expected_deferred_bytes = (
-                "mocked",
-                open_fh_ctx.tell(),
-                4,
-                np.dtype(">f4"),
-            )
-        self.assertEqual(pp_field.data, expected_deferred_bytes)
+    def test_deferred_bytes(self):
+        # Checks that the data is described by a 'deferred array bytes' tuple.
+        path, fields = self.gen_fields(_field_bytes())
+        self.assertEqual(len(fields), 1)
+        self.assertEqual(fields[0].lbuser[3], 16203)
+        expected_deferred_bytes = (path, 268, 16, np.dtype(">f4"))
+        self.assertEqual(fields[0].data, expected_deferred_bytes)
 
     def test_read_data_call(self):
         # Checks that data is read if read_data is True.
-        pp_field = mock.Mock(lblrec=1, lbext=0, lbuser=[0])
-        with self.mock_for_field_gen([pp_field]):
-            open_fh = mock.MagicMock(spec=io.RawIOBase)
-            open.return_value = open_fh
-            next(pp._field_gen("mocked", read_data_bytes=True))
-        with open_fh as open_fh_ctx:
-            expected_loaded_bytes = pp.LoadedArrayBytes(
-                open_fh_ctx.read(), np.dtype(">f4")
-            )
-        self.assertEqual(pp_field.data, expected_loaded_bytes)
+        _, fields = self.gen_fields(_field_bytes(), read_data_bytes=True)
+        expected_loaded_bytes = pp.LoadedArrayBytes(
+            np.arange(4, dtype=">f4").tobytes(), np.dtype(">f4")
+        )
+        self.assertEqual(fields[0].data, expected_loaded_bytes)
+
+    def test_multiple_fields(self):
+        content = _field_bytes(2, lbuser4=1) + _field_bytes(3, lbuser4=2)
+        path, fields = self.gen_fields(content)
+        self.assertEqual([field.lbuser[3] for field in fields], [1, 2])
+        self.assertEqual(
+            [field.data[1:3] for field in fields], [(268, 8), (268 + 280, 12)]
+        )
+
+    def test_header_filter(self):
+        content = b"".join(_field_bytes(lbuser4=lbuser4) for lbuser4 in (1, 2, 3))
+        header_filter = mock.Mock(return_value=np.array([True, False, True]))
+        _, fields = self.gen_fields(content, header_filter=header_filter)
+        self.assertEqual([field.lbuser[3] for field in fields], [1, 3])
+        (headers,), _ = header_filter.call_args
+        self.assertArrayEqual(headers["lbuser4"], [1, 2, 3])
+        self.assertArrayEqual(headers["lbrel"], [3, 3, 3])
+
+    def test_truncated_header(self):
+        content = _field_bytes(lbuser4=1) + _field_bytes(lbuser4=2)[:100]
+        with mock.patch("warnings.warn") as warn:
+            _, fields = self.gen_fields(content)
+        self.assertEqual([field.lbuser[3] for field in fields], [1])
+        self.assertEqual(warn.call_count, 1)
+        self.assertIn("Truncated header", warn.call_args[0][0])
 
     def test_invalid_header_release(self):
         # Check that an unknown LBREL value just results in a warning
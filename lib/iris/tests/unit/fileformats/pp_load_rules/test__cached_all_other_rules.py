@@ -0,0 +1,99 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for :func:`iris.fileformats.pp_load_rules._cached_all_other_rules`."""
+
+import pytest
+
+from iris.fileformats import pp_load_rules
+from iris.fileformats.pp import PPField3
+from iris.fileformats.pp_load_rules import _all_other_rules, _cached_all_other_rules
+
+DIM_COORDS_INDEX = 6
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(mocker):
+    mocker.patch.dict(pp_load_rules._all_other_rules_cache, clear=True)
+
+
+def _field(**kwargs):
+    field = PPField3(header=[0] * 64)
+    settings = dict(
+        lbtim=11,
+        lbcode=1,
+        lbproc=128,
+        lbsrce=1111,
+        lbuser=(1, 0, 0, 16203, 0, 0, 1),
+        lbfc=0,
+        lbrow=3,
+        lbnpt=4,
+        lbhem=0,
+        bdx=1.0,
+        bzx=0.0,
+        bdy=1.0,
+        bzy=-2.0,
+        bmdi=-1e30,
+        bplat=90.0,
+        bplon=0.0,
+    )
+    settings.update(kwargs)
+    for name, value in settings.items():
+        setattr(field, name, value)
+    return field
+
+
+def test_same_result():
+    field = _field()
+    assert _cached_all_other_rules(field) == _all_other_rules(field)
+    assert len(pp_load_rules._all_other_rules_cache) == 1
+
+
+def test_reused(mocker):
+    _cached_all_other_rules(_field())
+    spy = mocker.spy(pp_load_rules, "_all_other_rules")
+    result = _cached_all_other_rules(_field(lbft=6, blev=1000.0))
+    spy.assert_not_called()
+    assert result == _all_other_rules(_field())
+
+
+def test_copies():
+    field = _field()
+    result1 = _cached_all_other_rules(field)
+    result2 = _cached_all_other_rules(field)
+    ((coord1, _), _) = result1[DIM_COORDS_INDEX]
+    ((coord2, _), _) = result2[DIM_COORDS_INDEX]
+    assert coord1 == coord2
+    assert coord1 is not coord2
+    assert result1[4] is not result2[4]
+    coord1.rename("foo")
+    assert _cached_all_other_rules(field)[DIM_COORDS_INDEX][0][0].name() != "foo"
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [dict(lbuser=(1, 0, 0, 3236, 0, 0, 1)), dict(lbproc=0), dict(bplat=37.5)],
+    ids=["stash", "lbproc", "rotated"],
+)
+def test_different_signature(changes):
+    result = _cached_all_other_rules(_field(**changes))
+    assert result == _all_other_rules(_field(**changes))
+    assert result != _cached_all_other_rules(_field())
+    assert len(pp_load_rules._all_other_rules_cache) == 2
+
+
+def test_irregular_grid_not_cached(mocker):
+    field = _field(bdx=0.0)
+    mocker.patch.object(pp_load_rules, "_all_other_rules", return_value="x")
+    assert _cached_all_other_rules(field) == "x"
+    assert len(pp_load_rules._all_other_rules_cache) == 0
+
+
+def test_seasonal_dates_in_signature():
+    # Seasonal means are identified from their dates.
+    djf = _field(lbtim=32, lbmon=12, lbdat=1, lbmond=3, lbdatd=1)
+    mam = _field(lbtim=32, lbmon=3, lbdat=1, lbmond=6, lbdatd=1)
+    assert _cached_all_other_rules(djf) == _all_other_rules(djf)
+    assert _cached_all_other_rules(mam) == _all_other_rules(mam)
+    assert len(pp_load_rules._all_other_rules_cache) == 2
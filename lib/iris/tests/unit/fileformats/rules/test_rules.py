@@ -23,6 +23,7 @@ from iris.fileformats.rules import (
     load_cubes,
     scalar_cell_method,
 )
+from iris.loading import LOAD_CONCURRENCY
 from iris.tests._shared_utils import skip_data
 import iris.tests.stock as stock
 
@@ -225,6 +226,78 @@ class TestLoadCubes:
         assert len(cubes[1].aux_factories) == 1
         assert len(cubes[1].coords("surface_altitude")) == 1
 
+    @skip_data
+    @pytest.mark.parametrize("load_mode", ["SERIAL", "THREADS"])
+    def test_cross_reference_between_files(self, load_mode):
+        # Test a cross-reference between fields in different files, which are
+        # converted separately when loading in parallel, and that the load
+        # callback is applied in the same way.
+        param_cube = stock.realistic_4d_no_derived()
+        orog_coord = param_cube.coord("surface_altitude")
+        param_cube.remove_coord(orog_coord)
+
+        orog_cube = param_cube[0, 0, :, :]
+        orog_cube.data = orog_coord.points
+        orog_cube.rename("surface_altitude")
+        orog_cube.units = orog_coord.units
+        orog_cube.attributes = orog_coord.attributes
+
+        press_field = mock.Mock(
+            core_data=mock.Mock(return_value=param_cube.data),
+            bmdi=-1e20,
+            realised_dtype=param_cube.dtype,
+        )
+        orog_field = mock.Mock(
+            core_data=mock.Mock(return_value=orog_cube.data),
+            bmdi=-1e20,
+            realised_dtype=orog_cube.dtype,
+        )
+
+        def field_generator(filename):
+            return {"press_file": [press_field], "orog_file": [orog_field]}[filename]
+
+        def converter(field):
+            if field is press_field:
+                src = param_cube
+                factories = [Factory(HybridHeightFactory, [Reference("orography")])]
+                references = []
+            else:
+                src = orog_cube
+                factories = []
+                references = [ReferenceTarget("orography", None)]
+            dim_coords_and_dims = [
+                (coord, src.coord_dims(coord)[0]) for coord in src.dim_coords
+            ]
+            aux_coords_and_dims = [
+                (coord, src.coord_dims(coord)) for coord in src.aux_coords
+            ]
+            return ConversionMetadata(
+                factories,
+                references,
+                src.standard_name,
+                src.long_name,
+                src.units,
+                src.attributes,
+                src.cell_methods,
+                dim_coords_and_dims,
+                aux_coords_and_dims,
+            )
+
+        def callback(cube, field, filename):
+            cube.attributes["source_file"] = filename
+
+        fake_loader = Loader(field_generator, {}, converter)
+        with LOAD_CONCURRENCY.set(load_mode):
+            cubes = load_cubes(["press_file", "orog_file"], callback, fake_loader)
+            assert isinstance(cubes, types.GeneratorType)
+            cubes = list(cubes)
+        assert len(cubes) == 2
+        press_cube = cubes[1]
+        assert len(press_cube.aux_factories) == 1
+        assert len(press_cube.coords("surface_altitude")) == 1
+        assert press_cube.attributes["source_file"] == "press_file"
+        assert cubes[0].attributes["source_file"] == "orog_file"
+
 
 class Test_scalar_cell_method:
     """Tests for iris.fileformats.rules.scalar_cell_method() function."""
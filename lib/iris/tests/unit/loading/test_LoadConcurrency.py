@@ -0,0 +1,94 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the :class:`iris.loading.LoadConcurrency` class."""
+
+import threading
+
+import pytest
+
+import iris
+from iris.fileformats.um._fast_load import STRUCTURED_LOAD_CONTROLS
+from iris.loading import LOAD_CONCURRENCY, LOAD_PROBLEMS, LoadConcurrency
+from iris.warnings import IrisLoadWarning
+
+
+@pytest.fixture
+def threads():
+    with LOAD_CONCURRENCY.set("threads", max_workers=2):
+        yield
+
+
+class TestModes:
+    def test_default(self):
+        assert LoadConcurrency().mode is LoadConcurrency.Modes.SERIAL
+
+    def test_set_restores(self):
+        with LOAD_CONCURRENCY.set("processes", max_workers=3):
+            assert LOAD_CONCURRENCY.mode is LoadConcurrency.Modes.PROCESSES
+            assert LOAD_CONCURRENCY.max_workers == 3
+        assert LOAD_CONCURRENCY.mode is LoadConcurrency.Modes.SERIAL
+        assert LOAD_CONCURRENCY.max_workers is None
+
+    def test_bad_mode(self):
+        with pytest.raises(KeyError):
+            with LOAD_CONCURRENCY.set("nonsense"):
+                pass
+
+    def test_pool_shutdown_on_exit(self):
+        with LOAD_CONCURRENCY.set("threads"):
+            executor = LOAD_CONCURRENCY._get_executor()
+        assert LOAD_CONCURRENCY._executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
+
+
+class TestMap:
+    def test_serial(self):
+        result = LOAD_CONCURRENCY.map(lambda n: range(n), [2, 0, 3])
+        assert result == [[0, 1], [], [0, 1, 2]]
+
+    def test_processes_unpicklable(self):
+        # A function which cannot be passed to worker processes is run in turn.
+        with LOAD_CONCURRENCY.set("processes"):
+            result = LOAD_CONCURRENCY.map(lambda n: range(n), [2, 0, 3])
+            assert LOAD_CONCURRENCY._executor is None
+        assert result == [[0, 1], [], [0, 1, 2]]
+
+    def test_threads_ordered(self, threads):
+        def load(n):
+            return [(n, threading.current_thread().name)]
+
+        result = LOAD_CONCURRENCY.map(load, range(6))
+        assert [item[0][0] for item in result] == list(range(6))
+        assert all(item[0][1].startswith("iris-load") for item in result)
+
+    def test_controls_passed_to_workers(self, threads):
+        def load(_):
+            return [
+                (
+                    iris.FUTURE.date_microseconds,
+                    STRUCTURED_LOAD_CONTROLS.loads_use_structured,
+                )
+            ]
+
+        date_microseconds = not iris.FUTURE.date_microseconds
+        with iris.FUTURE.context(date_microseconds=date_microseconds):
+            with STRUCTURED_LOAD_CONTROLS.context(loads_use_structured=True):
+                result = LOAD_CONCURRENCY.map(load, range(2))
+        assert result == [[(date_microseconds, True)]] * 2
+        # The worker threads are left with their original controls.
+        result = LOAD_CONCURRENCY.map(load, range(2))
+        assert result == [[(not date_microseconds, False)]] * 2
+
+    def test_problems_returned(self, threads):
+        def load(filename):
+            LOAD_PROBLEMS.record(filename, None, ValueError(filename))
+            return []
+
+        LOAD_PROBLEMS.reset()
+        with pytest.warns(IrisLoadWarning):
+            LOAD_CONCURRENCY.map(load, ["a.nc", "b.nc"])
+        assert list(LOAD_PROBLEMS.problems_by_file) == ["a.nc", "b.nc"]
+        LOAD_PROBLEMS.reset()
@@ -77,6 +77,21 @@ class Mixin_register(metaclass=ABCMeta):
             result = proto_cube.register(self.cube2, error_on_mismatch=True)
             self.assertTrue(result)
 
+    def test_key(self):
+        # Cubes which can merge must share a merge key.
+        key1 = ProtoCube.source_cube(self.cube1).key
+        key2 = ProtoCube.source_cube(self.cube2).key
+        if not self.fragments:
+            self.assertEqual(key1, key2)
+        hash(key1)
+
+    def test_source(self):
+        # Registering with pre-calculated signatures gives the same result.
+        proto_cube = ProtoCube(self.cube1, source=ProtoCube.source_cube(self.cube1))
+        source = ProtoCube.source_cube(self.cube2)
+        result = proto_cube.register(self.cube2, source=source)
+        self.assertEqual(result, not self.fragments)
+
 
 class Test_register__match(Mixin_register, tests.IrisTest):
     @property
@@ -237,6 +252,36 @@ class Test_register__data_dtype(Mixin_register, tests.IrisTest):
         return cube
 
 
+class Test_source_cube(tests.IrisTest):
+    def key(self, **attributes):
+        cube = example_cube()
+        cube.attributes.update(attributes)
+        return ProtoCube.source_cube(cube).key
+
+    def test_equal_attributes(self):
+        for value1, value2 in [
+            (1, 1.0),
+            (np.int16(3), [3]),
+            (np.arange(3), [0, 1, 2]),
+            ((1, 2), np.array([1, 2])),
+        ]:
+            self.assertEqual(self.key(x=value1), self.key(x=value2))
+
+    def test_different_attributes(self):
+        self.assertNotEqual(self.key(x=1), self.key(x=2))
+        self.assertNotEqual(self.key(x="1"), self.key(x=1))
+        self.assertNotEqual(self.key(x=[1, 2]), self.key(x=[[1, 2]]))
+        self.assertNotEqual(self.key(STASH="m01s00i004"), self.key(STASH="m01s16i203"))
+
+    def test_unhashable_attribute(self):
+        self.assertEqual(self.key(x={"a": 1}), self.key(x={"a": 1}))
+
+    def test_dataless(self):
+        cube = iris.cube.Cube(shape=(3,))
+        with self.assertRaises(iris.exceptions.DatalessError):
+            ProtoCube.source_cube(cube)
+
+
 class _MergeTest:
     # A mixin test class for common test methods implementation.
 
@@ -0,0 +1,81 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the merge space analysis of :mod:`iris._merge`."""
+
+import numpy as np
+import pytest
+
+from iris._merge import (
+    _is_dependent,
+    _separable_pair,
+    build_indexes,
+    derive_relation_matrix,
+    derive_space,
+)
+
+# A 2x3 grid of source-cubes, where 'c' is a function of 'a' and 'b' is
+# independent of 'a'.
+GRID = [{"a": a, "b": b, "c": a * 10} for a in (1, 2) for b in ("x", "y", "z")]
+
+
+def test_codes():
+    indexes = build_indexes(GRID)
+    np.testing.assert_array_equal(indexes["a"].codes, [0, 0, 0, 1, 1, 1])
+    assert indexes["a"].cells == [1, 2]
+    np.testing.assert_array_equal(indexes["b"].codes, [0, 1, 2, 0, 1, 2])
+    assert indexes["b"].cells == ["x", "y", "z"]
+
+
+@pytest.mark.parametrize(
+    "names, expected",
+    [(("a", "b"), True), (("b", "a"), True), (("a", "c"), False)],
+)
+def test_separable_pair(names, expected):
+    indexes = build_indexes(GRID)
+    assert _separable_pair(*[indexes[name] for name in names]) is expected
+
+
+def test_separable_pair__missing_combination():
+    indexes = build_indexes(GRID[:-1])
+    assert not _separable_pair(indexes["a"], indexes["b"])
+
+
+def test_relation_matrix_symmetric():
+    relation_matrix = derive_relation_matrix(build_indexes(GRID))
+    assert relation_matrix["a"].separable == {"b"}
+    assert relation_matrix["b"].separable == {"a", "c"}
+    assert relation_matrix["c"].inseparable == {"a"}
+    assert relation_matrix["a"].inseparable == {"c"}
+
+
+def test_is_dependent():
+    indexes = build_indexes(GRID)
+    mapping = {}
+    assert _is_dependent("c", ["a"], indexes, mapping)
+    assert mapping == {(1,): 10, (2,): 20}
+    assert not _is_dependent("b", ["a"], indexes)
+    assert _is_dependent("b", ["a", "c"], indexes) is False
+    assert _is_dependent("a", ["b", "c"], indexes)
+
+
+def test_is_dependent__no_independent():
+    indexes = build_indexes([{"a": 1, "b": 0}, {"a": 1, "b": 1}])
+    assert _is_dependent("a", [], indexes)
+    assert not _is_dependent("b", [], indexes)
+
+
+def test_derive_space__combination():
+    # Neither 'a' nor 'b' is a function of the other, and they are not
+    # separable, so they require an invented combination dimension.
+    positions = [{"a": 1, "b": 1}, {"a": 1, "b": 2}, {"a": 2, "b": 1}]
+    indexes = build_indexes(positions)
+    relation_matrix = derive_relation_matrix(indexes)
+    function_matrix = {}
+    space = derive_space(
+        [{"a", "b"}], relation_matrix, indexes, function_matrix=function_matrix
+    )
+    assert space == {"a-b": None, "a": ("a-b",), "b": ("a-b",)}
+    assert function_matrix["a"] == {((1, 1),): 1, ((1, 2),): 1, ((2, 1),): 2}
+    assert function_matrix["b"] == {((1, 1),): 1, ((1, 2),): 2, ((2, 1),): 1}
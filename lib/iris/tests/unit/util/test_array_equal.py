@@ -9,6 +9,7 @@ import numpy as np
 import numpy.ma as ma
 import pytest
 
+from iris._concatenate import ArrayHashCache
 from iris.util import array_equal
 
 ARRAY1 = np.array(np.arange(24).reshape(2, 3, 4))
@@ -191,3 +192,15 @@ def test_array_equal(array_a, array_b, withnans, eq, lazy):
         if identical:
             array_b = array_a
     assert eq == array_equal(array_a, array_b, withnans=withnans)
+
+
+def test_array_equal__not_hashed(mocker):
+    # Array hashing is only for concatenate, not all comparisons.
+    cache = mocker.patch("iris._concatenate.ARRAY_HASH_CACHE", ArrayHashCache())
+    assert array_equal(da.arange(4, chunks=2), da.arange(4, chunks=2) + 0)
+    assert cache.hits == cache.misses == 0
+
+
+def test_array_equal__same_lazy_name():
+    array = da.arange(4, chunks=2)
+    assert array_equal(array, array.copy())